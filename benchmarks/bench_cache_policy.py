@@ -0,0 +1,98 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark of the hit ratio of `ResponseCache` policies on a trace with a bulk scan.
+
+Live traffic looks up a few thousand users with a skewed popularity throughout. In
+the middle of the trace, a one-off screen of many members looks up every one of them
+once, interleaved with the live traffic. Hit ratios are reported for the live traffic
+before, during and after the scan, as misses cache what was looked up like the client
+does.
+
+Run from the repository root with `python -m benchmarks.bench_cache_policy`.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Iterator
+
+from ravyapi.cache import CachePolicy, ResponseCache
+
+CACHE_SIZE = 4096
+HOT_USERS = 3000
+SCANNED_USERS = 200_000
+LIVE_LOOKUPS = 100_000
+SCAN_RATIO = 4
+"""Scan lookups per live lookup while the scan runs."""
+
+PHASES = ("before", "during", "after")
+
+
+def make_trace(seed: int = 0) -> list[tuple[str, int]]:
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(HOT_USERS)]
+
+    def live(count: int) -> Iterator[int]:
+        yield from rng.choices(range(HOT_USERS), weights, k=count)
+
+    trace = [("before", user) for user in live(LIVE_LOOKUPS)]
+    scanned = iter(range(HOT_USERS, HOT_USERS + SCANNED_USERS))
+
+    for user in live(SCANNED_USERS // SCAN_RATIO):
+        trace.append(("during", user))
+        trace.extend(("scan", next(scanned)) for _ in range(SCAN_RATIO))
+
+    trace.extend(("after", user) for user in live(LIVE_LOOKUPS))
+    return trace
+
+
+def replay(
+    policy: CachePolicy, trace: list[tuple[str, int]]
+) -> tuple[dict[str, float], float]:
+    cache = ResponseCache(max_size=CACHE_SIZE, ttls={"users": 3600.0}, policy=policy)
+    hits = dict.fromkeys(PHASES, 0)
+    lookups = dict.fromkeys(PHASES, 0)
+    start = time.perf_counter()
+
+    for phase, user in trace:
+        key = f"/users/{user}"
+
+        if cache.get(key) is None:
+            cache.set(key, {}, "users", str(user))
+        elif phase in hits:
+            hits[phase] += 1
+
+        if phase in lookups:
+            lookups[phase] += 1
+
+    seconds = time.perf_counter() - start
+    return {phase: hits[phase] / lookups[phase] for phase in PHASES}, seconds
+
+
+def main() -> None:
+    trace = make_trace()
+    print(f"{'policy':>8} {'before':>8} {'during':>8} {'after':>8} {'lookups/s':>11}")
+
+    for policy in ("lru", "tinylfu"):
+        ratios, seconds = replay(policy, trace)
+        print(
+            f"{policy:>8} "
+            + " ".join(f"{ratios[phase]:>8.1%}" for phase in PHASES)
+            + f" {len(trace) / seconds:>11,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
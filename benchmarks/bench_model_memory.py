@@ -0,0 +1,112 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark of the memory retained by models, with and without `compact`.
+
+Every model is built from its own freshly decoded response body, as it would be by the
+client, and only the models are kept. Default models retain the decoded response in
+`data`, while compact models let it be freed and rebuild it when accessed.
+
+Run from the repository root with `python -m benchmarks.bench_model_memory`.
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+from typing import Any, Callable
+
+from ravyapi.api.models import (
+    BanEntryResponse,
+    CheckAvatarResponse,
+    GetBansResponse,
+    GetGuildResponse,
+    GetKSoftBanResponse,
+    GetUserResponse,
+    GetWebsiteResponse,
+    ReputationEntry,
+    Trust,
+    WhitelistEntry,
+)
+from ravyapi.data_binding import default_json_dumps, default_json_loads
+
+MODELS = 10_000
+
+TRUST = {"level": 1, "label": "very untrusted"}
+BAN = {
+    "provider": "ravy",
+    "reason": "Scam",
+    "reason_key": "scam",
+    "moderator": "1234567891011121314",
+}
+WHITELIST = {"provider": "ravy", "reason": "STAFF"}
+REP = {"provider": "ravy", "score": 0.2, "upvotes": 1, "downvotes": 9}
+
+PAYLOADS: dict[Callable[..., Any], dict[str, Any]] = {
+    Trust: TRUST,
+    BanEntryResponse: BAN,
+    WhitelistEntry: WHITELIST,
+    ReputationEntry: REP,
+    GetBansResponse: {"trust": TRUST, "bans": [BAN] * 10},
+    GetGuildResponse: {"trust": TRUST, "bans": [BAN] * 3},
+    GetUserResponse: {
+        "pronouns": "they/them",
+        "trust": TRUST,
+        "whitelists": [WHITELIST],
+        "bans": [BAN] * 3,
+        "rep": [REP],
+        "sentinel": {"verified": False, "id": "abc"},
+    },
+    GetKSoftBanResponse: {
+        "found": True,
+        "id": "1234567891011121314",
+        "tag": "someone#0001",
+        "reason": "Scam",
+        "proof": "https://imgur.com/abc",
+        "moderator": "1234567891011121314",
+        "severe": False,
+        "timestamp": "2022-08-01T12:00:00.000Z",
+    },
+    GetWebsiteResponse: {"isFraudulent": True, "message": "Phishing"},
+    CheckAvatarResponse: {"matched": True, "key": "steam_scam", "similarity": 0.97},
+}
+
+
+def retained(model: Callable[..., Any], body: bytes, compact: bool) -> int:
+    tracemalloc.start()
+    start = tracemalloc.take_snapshot()
+    models = [model(default_json_loads(body), compact=compact) for _ in range(MODELS)]
+    size = sum(
+        stat.size_diff
+        for stat in tracemalloc.take_snapshot().compare_to(start, "filename")
+    )
+    tracemalloc.stop()
+    del models
+    return size // MODELS
+
+
+def main() -> None:
+    print(f"{'model':>20} {'default (bytes)':>16} {'compact (bytes)':>16} {'saved':>6}")
+
+    for model, payload in PAYLOADS.items():
+        body = default_json_dumps(payload)
+        body = body if isinstance(body, bytes) else body.encode()
+        default = retained(model, body, False)
+        compact = retained(model, body, True)
+        print(
+            f"{model.__name__:>20} {default:>16,} {compact:>16,} "
+            f"{1 - compact / default:>6.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark of building `GetUserResponse` models eagerly and lazily.
+
+Measures the construction time and the memory allocated by the models, excluding the
+decoded response they are built from, for users with increasingly many bans.
+
+Run from the repository root with `python -m benchmarks.bench_models`.
+"""
+
+from __future__ import annotations
+
+import timeit
+import tracemalloc
+from typing import Any, Callable
+
+from ravyapi.api.models import GetUserResponse
+
+BAN_COUNTS = (0, 10, 100, 1000)
+MODELS = 1000
+
+
+def make_user(bans: int) -> dict[str, Any]:
+    return {
+        "pronouns": "they/them",
+        "trust": {"level": 1, "label": "very untrusted"},
+        "whitelists": [],
+        "bans": [
+            {
+                "provider": "ravy",
+                "reason": "Scam",
+                "reason_key": "scam",
+                "moderator": "1234567891011121314",
+            }
+            for _ in range(bans)
+        ],
+        "rep": [{"provider": "ravy", "score": 0.2, "upvotes": 1, "downvotes": 9}],
+        "sentinel": {"verified": False, "id": "abc"},
+    }
+
+
+def allocated(build: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    start = tracemalloc.take_snapshot()
+    models = [build() for _ in range(MODELS)]
+    size = sum(
+        stat.size_diff
+        for stat in tracemalloc.take_snapshot().compare_to(start, "filename")
+    )
+    tracemalloc.stop()
+    del models
+    return size // MODELS
+
+
+def main() -> None:
+    print(f"{'bans':>5} {'mode':>18} {'construct (us)':>15} {'memory (bytes)':>15}")
+
+    for bans in BAN_COUNTS:
+        data = make_user(bans)
+
+        def lazy_trust() -> GetUserResponse:
+            model = GetUserResponse(data, lazy=True)
+            model.trust.level
+            return model
+
+        cases: dict[str, Callable[[], Any]] = {
+            "eager": lambda: GetUserResponse(data),
+            "lazy": lambda: GetUserResponse(data, lazy=True),
+            "lazy + trust.level": lazy_trust,
+        }
+
+        for mode, build in cases.items():
+            number = max(10, 100_000 // (bans + 10))
+            seconds = min(timeit.repeat(build, number=number, repeat=5)) / number
+            memory = allocated(build)
+            print(f"{bans:>5} {mode:>18} {seconds * 1e6:>15.2f} {memory:>15,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Microbenchmark of the per-request cost of routing.
+
+`before` replicates the routing done per request before routes were precompiled:
+allocating the path classes, concatenating the base URL, parsing it into a URL, and
+deriving the rate limit bucket with a regex. `after` is the current routing with
+`ravyapi.api.paths.Route`.
+
+Run from the repository root with `python -m benchmarks.bench_routing`.
+"""
+
+from __future__ import annotations
+
+import itertools
+import re
+import timeit
+
+import yarl
+
+from ravyapi.api.paths import PATHS, Paths
+from ravyapi.const import BASE_URL
+
+NUMBER = 200_000
+
+# Distinct IDs per request, so yarl's cache of parsed URLs does not hide the cost
+_USER_IDS = itertools.count(1234567891011121314)
+
+_ROUTE_ID_REGEX = re.compile(r"/\d+")
+
+
+def before() -> None:
+    path = Paths().users(next(_USER_IDS)).bans
+    yarl.URL(BASE_URL + path)
+    _ROUTE_ID_REGEX.sub("/{id}", path)
+
+
+def after() -> None:
+    route = PATHS.USER_BANS
+    route.url(next(_USER_IDS))
+    route.bucket
+
+
+def after_static() -> None:
+    route = PATHS.TOKEN
+    route.url()
+    route.bucket
+
+
+def main() -> None:
+    for name, func in (
+        ("before", before),
+        ("after", after),
+        ("after (no ID)", after_static),
+    ):
+        best = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print(f"{name:>14}: {best / NUMBER * 1e6:.3f} us per request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark of message screening throughput, in messages per second.
+
+The corpus mimics chat traffic: most messages contain no URL, some contain ordinary
+links, markdown links or bare domains, and a few phishing links are pasted over and
+over with different casing and tracking parameters. Lookups are answered by a stub
+endpoint without networking, so only the pipeline itself is measured.
+
+Run from the repository root with `python -m benchmarks.bench_screening`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import Any, AsyncIterator
+
+from ravyapi.api.models import GetWebsiteResponse
+from ravyapi.links import canonicalize_url, extract_urls
+from ravyapi.screening import URLScreener
+
+MESSAGES = 100_000
+
+WORDS = (
+    "hey anyone know how to fix this lol the server is down again "
+    "gg that was close i think we should try tomorrow at 5pm version 1.2.3 "
+    "ok thanks see you later can someone ping the mods please"
+).split()
+
+LINKS = (
+    "https://github.com/GoogolGenius/RavyAPI.py/issues/{}",
+    "https://youtu.be/dQw4w9WgXcQ?t={}",
+    "[docs](https://docs.python.org/3/library/asyncio.html#{})",
+    "see example.com/page/{}",
+    "<https://tenor.com/view/cat-{}>",
+)
+
+PHISHING = (
+    "https://Discord-Nitro.gift/claim?utm_source=dm&id={}",
+    "FREE NITRO: discord-nitro.gift/claim/",
+    "https://steamcommunnity.com/tradeoffer/new/?partner={}#start",
+)
+
+
+def make_corpus(amount: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    corpus: list[str] = []
+
+    for _ in range(amount):
+        text = " ".join(rng.choices(WORDS, k=rng.randint(3, 25)))
+        roll = rng.random()
+
+        if roll < 0.15:
+            text += " " + rng.choice(LINKS).format(rng.randint(1, 500))
+        elif roll < 0.18:
+            text += " " + rng.choice(PHISHING).format(rng.randint(1, 3))
+
+        corpus.append(text)
+
+    return corpus
+
+
+class StubURLs:
+    async def get_website(self, url: str, **_: Any) -> GetWebsiteResponse:
+        return GetWebsiteResponse(
+            {"isFraudulent": "nitro" in url or "communnity" in url, "message": ""}
+        )
+
+
+def bench_extraction(corpus: list[str]) -> float:
+    start = time.perf_counter()
+
+    for text in corpus:
+        for url in extract_urls(text):
+            canonicalize_url(url)
+
+    return len(corpus) / (time.perf_counter() - start)
+
+
+async def bench_screen_many(corpus: list[str], batch: int) -> float:
+    screener = URLScreener(StubURLs())  # type: ignore[arg-type]
+    start = time.perf_counter()
+
+    for index in range(0, len(corpus), batch):
+        await screener.screen_many(corpus[index : index + batch])
+
+    return len(corpus) / (time.perf_counter() - start)
+
+
+async def bench_screen_stream(corpus: list[str]) -> float:
+    screener = URLScreener(StubURLs())  # type: ignore[arg-type]
+
+    async def stream() -> AsyncIterator[str]:
+        for text in corpus:
+            yield text
+
+    start = time.perf_counter()
+
+    async for _ in screener.screen_stream(stream()):
+        pass
+
+    return len(corpus) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    corpus = make_corpus(MESSAGES)
+
+    print(f"{'extract + canonicalize':>24}: {bench_extraction(corpus):,.0f} msg/s")
+    print(
+        f"{'screen_many (batch 500)':>24}: "
+        f"{asyncio.run(bench_screen_many(corpus, 500)):,.0f} msg/s"
+    )
+    print(
+        f"{'screen_stream':>24}: "
+        f"{asyncio.run(bench_screen_stream(corpus)):,.0f} msg/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -17,4 +17,11 @@ from __future__ import annotations
 
 from ravyapi._about import *
 from ravyapi.api import *
+from ravyapi.backends import *
+from ravyapi.cache import *
 from ravyapi.client import *
+from ravyapi.connections import *
+from ravyapi.links import *
+from ravyapi.ratelimits import *
+from ravyapi.retries import *
+from ravyapi.screening import *
@@ -17,14 +17,68 @@ from __future__ import annotations
 
 __all__: tuple[str, ...] = ("Avatars",)
 
+import asyncio
+import collections.abc
+import os
 import urllib.parse
+from typing import IO, Any, AsyncIterable, Awaitable, Callable, overload
 
 import aiohttp
 from typing_extensions import Literal
 
 from ravyapi.api.models import CheckAvatarResponse
-from ravyapi.http import HTTPAwareEndpoint
-from ravyapi.utils import with_permission_check
+from ravyapi.data_binding import ResponseMode
+from ravyapi.http import HTTPAwareEndpoint, HTTPClient
+from ravyapi.links import avatar_key
+from ravyapi.utils import copy_json, with_permission_check
+
+
+async def _upload(
+    http: HTTPClient,
+    avatar: bytes | bytearray | memoryview | os.PathLike[str] | AsyncIterable[bytes],
+    params: dict[str, Any],
+    mode: ResponseMode,
+) -> dict[str, Any] | bytes:
+    # Buffers are written as they are and files and iterators are read in chunks,
+    # so the multipart body never holds a copy of the image
+    def form(payload: Any) -> aiohttp.FormData:
+        data = aiohttp.FormData()
+        data.add_field(
+            "avatar",
+            payload,
+            content_type="application/octet-stream",
+            filename="avatar",
+        )
+        return data
+
+    files: list[IO[bytes]] = []
+
+    async def reform() -> aiohttp.FormData:
+        if isinstance(avatar, os.PathLike):
+            loop = asyncio.get_running_loop()
+            file = await loop.run_in_executor(None, open, avatar, "rb")
+            files.append(file)
+            return form(file)
+
+        return form(avatar)
+
+    # A form can only be sent once, so it is rebuilt for every attempt,
+    # unless the avatar is an iterator that cannot be read again
+    body: aiohttp.FormData | Callable[[], Awaitable[aiohttp.FormData]] = (
+        form(avatar) if isinstance(avatar, collections.abc.AsyncIterable) else reform
+    )
+
+    try:
+        if mode == "bytes":
+            return await http.request_body(
+                "POST", http.paths.AVATARS, params=params, data=body
+            )
+
+        return await http.post(http.paths.AVATARS, params=params, data=body)
+    finally:
+        # aiohttp closes a file once it is sent, but not if the request fails before
+        for file in files:
+            file.close()
 
 
 class Avatars(HTTPAwareEndpoint):
@@ -32,23 +86,96 @@ class Avatars(HTTPAwareEndpoint):
 
     __slots__: tuple[str, ...] = ()
 
+    @overload
+    async def check_avatar(
+        self,
+        avatar: (
+            str
+            | bytes
+            | bytearray
+            | memoryview
+            | os.PathLike[str]
+            | AsyncIterable[bytes]
+        ),
+        threshold: float = ...,
+        method: Literal["ssim", "phash"] = ...,
+        *,
+        mode: Literal["model"] | None = ...,
+    ) -> CheckAvatarResponse: ...
+
+    @overload
+    async def check_avatar(
+        self,
+        avatar: (
+            str
+            | bytes
+            | bytearray
+            | memoryview
+            | os.PathLike[str]
+            | AsyncIterable[bytes]
+        ),
+        threshold: float = ...,
+        method: Literal["ssim", "phash"] = ...,
+        *,
+        mode: Literal["json"],
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def check_avatar(
+        self,
+        avatar: (
+            str
+            | bytes
+            | bytearray
+            | memoryview
+            | os.PathLike[str]
+            | AsyncIterable[bytes]
+        ),
+        threshold: float = ...,
+        method: Literal["ssim", "phash"] = ...,
+        *,
+        mode: Literal["bytes"],
+    ) -> bytes: ...
+
     @with_permission_check("avatars")
     async def check_avatar(
         self: HTTPAwareEndpoint,
-        avatar: str | bytes,
+        avatar: (
+            str
+            | bytes
+            | bytearray
+            | memoryview
+            | os.PathLike[str]
+            | AsyncIterable[bytes]
+        ),
         threshold: float = 0.97,
         method: Literal["ssim", "phash"] = "phash",
-    ) -> CheckAvatarResponse:
+        *,
+        mode: ResponseMode | None = None,
+    ) -> CheckAvatarResponse | dict[str, Any] | bytes:
         """Check if avatar is fraudulent.
 
+        Uploaded avatars are streamed: buffers are sent without being copied, and files
+        and async iterators are read in chunks as the request is sent.
+
+        If the client has a `ravyapi.cache.AvatarCache`, verdicts are cached by a digest
+        of the bytes of uploaded avatars, and by `ravyapi.links.avatar_key` for Discord
+        CDN URLs, so a repeated avatar is not checked again. Avatars uploaded from async
+        iterators can only be read once and are not cached.
+
         Parameters
         ----------
-        avatar : str | bytes
+        avatar : str | bytes | bytearray | memoryview | os.PathLike[str] | AsyncIterable[bytes]
             Link to the avatar, should start with "cdn.discordapp.com" or the avatar to query, as an octet stream.
+            The octet stream may be a buffer, the path of a file or an async iterator of chunks.
         threshold : float = 0.97
             How similar the avatar needs to be for it to match (0-1, default 0.97).
         method : Literal["ssim", "phash"]
             Which method to use for matching the avatars ("ssim" or "phash", default is "phash").
+        mode : ResponseMode | None
+            Optional, what to return: `"model"` for the model, `"json"` for the decoded
+            JSON or `"bytes"` for the undecoded response body, which is never cached.
+            Defaults to `ravyapi.client.Client.response_mode`.
 
         Raises
         ------
@@ -59,14 +186,38 @@ class Avatars(HTTPAwareEndpoint):
 
         Returns
         -------
-        CheckAvatarResponse
+        CheckAvatarResponse | dict[str, Any] | bytes
             A model response from `ravyapi.api.endpoints.avatars.Avatars.check_avatar`.
             Located as `ravyapi.api.models.avatars.CheckAvatarResponse`.
+            The decoded JSON or the undecoded response body instead, depending on `mode`.
         """
-        if not isinstance(avatar, (str, bytes)):
-            raise TypeError('Parameter "avatar" must be of type "str" or "bytes"')
+        if not isinstance(
+            avatar,
+            (
+                str,
+                bytes,
+                bytearray,
+                memoryview,
+                os.PathLike,
+                collections.abc.AsyncIterable,
+            ),
+        ):
+            raise TypeError(
+                'Parameter "avatar" must be of type "str", "bytes", "bytearray", '
+                '"memoryview", "os.PathLike" or "AsyncIterable[bytes]"'
+            )
 
-        if not avatar:
+        if isinstance(avatar, (bytes, bytearray, memoryview)):
+            empty = memoryview(avatar).nbytes == 0
+        elif isinstance(avatar, os.PathLike):
+            stat = await asyncio.get_running_loop().run_in_executor(
+                None, os.stat, avatar
+            )
+            empty = stat.st_size == 0
+        else:
+            empty = isinstance(avatar, str) and not avatar
+
+        if empty:
             raise ValueError('Parameter "avatar" must not be empty')
 
         if not 0 <= threshold <= 1:
@@ -77,33 +228,74 @@ class Avatars(HTTPAwareEndpoint):
         if method not in ("ssim", "phash"):
             raise ValueError('Parameter "method" must be either "ssim" or "phash"')
 
+        mode = self._http.response_mode_of(mode)
+        # Verdicts are cached decoded, so undecoded bodies skip the cache
+        cache = self._http.avatar_cache if mode != "bytes" else None
+        response: dict[str, Any] | None = None
+
         if isinstance(avatar, str):
             if urllib.parse.urlparse(avatar).hostname != "cdn.discordapp.com":
                 raise ValueError(
                     'Parameter "avatar_url" must start with "https://cdn.discordapp.com"'
                 )
 
-            return CheckAvatarResponse(
-                await self._http.get(
-                    self._http.paths.avatars.route,
-                    params={
-                        "avatar": avatar,
-                        "threshold": threshold,
-                        "method": method,
-                    },
-                )
-            )
+            key = avatar_key(avatar)
 
-        data = aiohttp.FormData()
-        data.add_field("avatar", avatar, content_type="application/octet-stream")
+            if key is not None and cache is not None:
+                response = cache.get(key, threshold, method)
 
-        return CheckAvatarResponse(
-            await self._http.post(
-                self._http.paths.avatars.route,
-                params={
+            if response is None:
+                params: dict[str, Any] = {
+                    "avatar": avatar,
                     "threshold": threshold,
                     "method": method,
-                },
-                data=data,
-            )
-        )
+                }
+                # Variants of the same avatar share one in-flight request
+                request_key = (
+                    ("avatars", key, threshold, method) if key is not None else None
+                )
+
+                if mode == "bytes":
+                    return await self._http.get_bytes(
+                        self._http.paths.AVATARS, params=params, key=request_key
+                    )
+
+                response = await self._http.get(
+                    self._http.paths.AVATARS, params=params, key=request_key
+                )
+
+                if key is not None and cache is not None:
+                    cache.set(key, threshold, method, response)
+        else:
+            digest: str | None = None
+            params = {"threshold": threshold, "method": method}
+
+            if cache is not None and not isinstance(
+                avatar, collections.abc.AsyncIterable
+            ):
+                if isinstance(avatar, os.PathLike):
+                    digest = await asyncio.get_running_loop().run_in_executor(
+                        None, cache.digest_file, avatar
+                    )
+                else:
+                    digest = cache.digest(avatar)
+
+                if digest is not None:
+                    response = cache.get(digest, threshold, method)
+
+            if response is None:
+                uploaded = await _upload(self._http, avatar, params, mode)
+
+                if isinstance(uploaded, bytes):
+                    return uploaded
+
+                response = uploaded
+
+                if cache is not None and digest is not None:
+                    cache.set(digest, threshold, method, response)
+
+        if mode == "json":
+            # Copied, as the decoded JSON is shared with the cache and other callers
+            return copy_json(response)
+
+        return CheckAvatarResponse(response, compact=self._http.compact_models)
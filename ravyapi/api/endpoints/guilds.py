@@ -17,9 +17,19 @@ from __future__ import annotations
 
 __all__: tuple[str, ...] = ("Guilds",)
 
+from typing import Any, AsyncIterator, Iterable, overload
+
+from typing_extensions import Literal
+
 from ravyapi.api.models import GetGuildResponse
+from ravyapi.data_binding import ResponseMode
 from ravyapi.http import HTTPAwareEndpoint
-from ravyapi.utils import with_permission_check
+from ravyapi.utils import (
+    copy_json,
+    gather_bounded,
+    iterate_bounded,
+    with_permission_check,
+)
 
 
 class Guilds(HTTPAwareEndpoint):
@@ -27,31 +37,133 @@ class Guilds(HTTPAwareEndpoint):
 
     __slots__: tuple[str, ...] = ()
 
+    @overload
+    async def get_guild(
+        self, guild_id: int, *, mode: Literal["model"] | None = ...
+    ) -> GetGuildResponse: ...
+
+    @overload
+    async def get_guild(
+        self, guild_id: int, *, mode: Literal["json"]
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def get_guild(self, guild_id: int, *, mode: Literal["bytes"]) -> bytes: ...
+
     @with_permission_check("guilds")
-    async def get_guild(self: HTTPAwareEndpoint, guild_id: int) -> GetGuildResponse:
+    async def get_guild(
+        self: HTTPAwareEndpoint, guild_id: int, *, mode: ResponseMode | None = None
+    ) -> GetGuildResponse | dict[str, Any] | bytes:
         """Get extensive guild information.
 
         Parameters
         ----------
         guild_id : int
             Guild ID of the guild to look up.
+        mode : ResponseMode | None
+            Optional, what to return: `"model"` for the model, `"json"` for the decoded
+            JSON or `"bytes"` for the undecoded response body.
+            Defaults to `ravyapi.client.Client.response_mode`.
 
         Raises
         ------
         TypeError
             If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
 
         Returns
         -------
-        GetGuildResponse
+        GetGuildResponse | dict[str, Any] | bytes
             A model response from `ravyapi.api.endpoints.guilds.Guilds.get_guild`.
             Located as `ravyapi.api.models.guilds.GetGuildResponse`.
+            The decoded JSON or the undecoded response body instead, depending on `mode`.
         """
         if not isinstance(guild_id, int):
             raise TypeError('Parameter "guild_id" must be of type "int"')
 
+        mode = self._http.response_mode_of(mode)
+
+        if mode == "bytes":
+            return await self._http.get_bytes(self._http.paths.GUILD, guild_id)
+
+        data = await self._http.get(self._http.paths.GUILD, guild_id)
+
+        if mode == "json":
+            # Copied, as the decoded JSON is shared with the cache and other callers
+            return copy_json(data)
+
         return GetGuildResponse(
-            await self._http.get(
-                self._http.paths.guilds(guild_id).route,
-            )
+            data,
+            lazy=self._http.lazy_models,
+            compact=self._http.compact_models,
         )
+
+    async def get_guild_many(
+        self, guild_ids: Iterable[int], *, concurrency: int = 10
+    ) -> dict[int, GetGuildResponse | Exception]:
+        """Get extensive guild information of many guilds, with bounded concurrency.
+
+        Parameters
+        ----------
+        guild_ids : Iterable[int]
+            Guild IDs of the guilds to look up. Duplicates are only looked up once.
+        concurrency : int
+            The maximum amount of lookups running at once.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+
+        Returns
+        -------
+        dict[int, GetGuildResponse | Exception]
+            The response of every unique ID, or the exception raised looking it up,
+            in the order the IDs were given. See `ravyapi.api.endpoints.guilds.Guilds.get_guild`.
+        """
+        if not isinstance(concurrency, int):
+            raise TypeError('Parameter "concurrency" must be of type "int"')
+
+        if concurrency < 1:
+            raise ValueError('Parameter "concurrency" must be at least 1')
+
+        return await gather_bounded(self.get_guild, guild_ids, concurrency=concurrency)
+
+    def iter_guild_many(
+        self, guild_ids: Iterable[int], *, concurrency: int = 10
+    ) -> AsyncIterator[tuple[int, GetGuildResponse | Exception]]:
+        """Get extensive guild information of many guilds, yielding responses as they complete.
+
+        IDs are consumed lazily, so only the lookups in progress are held in memory,
+        along with every distinct ID seen so far to skip duplicates.
+
+        Parameters
+        ----------
+        guild_ids : Iterable[int]
+            Guild IDs of the guilds to look up. Duplicates are only looked up once.
+        concurrency : int
+            The maximum amount of lookups running at once.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+
+        Returns
+        -------
+        AsyncIterator[tuple[int, GetGuildResponse | Exception]]
+            An async iterator of every unique ID and its response, or the exception
+            raised looking it up. See `ravyapi.api.endpoints.guilds.Guilds.get_guild`.
+        """
+        if not isinstance(concurrency, int):
+            raise TypeError('Parameter "concurrency" must be of type "int"')
+
+        if concurrency < 1:
+            raise ValueError('Parameter "concurrency" must be at least 1')
+
+        return iterate_bounded(self.get_guild, guild_ids, concurrency=concurrency)
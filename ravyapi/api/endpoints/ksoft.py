@@ -17,9 +17,19 @@ from __future__ import annotations
 
 __all__: tuple[str, ...] = ("KSoft",)
 
+from typing import Any, AsyncIterator, Iterable, overload
+
+from typing_extensions import Literal
+
 from ravyapi.api.models import GetKSoftBanResponse
+from ravyapi.data_binding import ResponseMode
 from ravyapi.http import HTTPAwareEndpoint
-from ravyapi.utils import with_permission_check
+from ravyapi.utils import (
+    copy_json,
+    gather_bounded,
+    iterate_bounded,
+    with_permission_check,
+)
 
 
 class KSoft(HTTPAwareEndpoint):
@@ -27,31 +37,129 @@ class KSoft(HTTPAwareEndpoint):
 
     __slots__: tuple[str, ...] = ()
 
+    @overload
+    async def get_ban(
+        self, user_id: int, *, mode: Literal["model"] | None = ...
+    ) -> GetKSoftBanResponse: ...
+
+    @overload
+    async def get_ban(
+        self, user_id: int, *, mode: Literal["json"]
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def get_ban(self, user_id: int, *, mode: Literal["bytes"]) -> bytes: ...
+
     @with_permission_check("ksoft.bans")
-    async def get_ban(self: HTTPAwareEndpoint, user_id: int) -> GetKSoftBanResponse:
+    async def get_ban(
+        self: HTTPAwareEndpoint, user_id: int, *, mode: ResponseMode | None = None
+    ) -> GetKSoftBanResponse | dict[str, Any] | bytes:
         """Get ban status.
 
         Parameters
         ----------
         user_id : int
             User ID of the user to look up.
+        mode : ResponseMode | None
+            Optional, what to return: `"model"` for the model, `"json"` for the decoded
+            JSON or `"bytes"` for the undecoded response body.
+            Defaults to `ravyapi.client.Client.response_mode`.
 
         Raises
         ------
         TypeError
             If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
 
         Returns
         -------
-        GetKSoftBanResponse
+        GetKSoftBanResponse | dict[str, Any] | bytes
             A model response from `ravyapi.api.endpoints.ksoft.KSoft.get_ban`.
             Located as `ravyapi.api.models.ksoft.GetKSoftBanResponse`.
+            The decoded JSON or the undecoded response body instead, depending on `mode`.
         """
         if not isinstance(user_id, int):
             raise TypeError('Parameter "user_id" must be of type "int"')
 
-        return GetKSoftBanResponse(
-            await self._http.get(
-                self._http.paths.ksoft.bans(user_id),
-            )
-        )
+        mode = self._http.response_mode_of(mode)
+
+        if mode == "bytes":
+            return await self._http.get_bytes(self._http.paths.KSOFT_BAN, user_id)
+
+        data = await self._http.get(self._http.paths.KSOFT_BAN, user_id)
+
+        if mode == "json":
+            # Copied, as the decoded JSON is shared with the cache and other callers
+            return copy_json(data)
+
+        return GetKSoftBanResponse(data, compact=self._http.compact_models)
+
+    async def get_ban_many(
+        self, user_ids: Iterable[int], *, concurrency: int = 10
+    ) -> dict[int, GetKSoftBanResponse | Exception]:
+        """Get ban statuses of many users, with bounded concurrency.
+
+        Parameters
+        ----------
+        user_ids : Iterable[int]
+            User IDs of the users to look up. Duplicates are only looked up once.
+        concurrency : int
+            The maximum amount of lookups running at once.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+
+        Returns
+        -------
+        dict[int, GetKSoftBanResponse | Exception]
+            The response of every unique ID, or the exception raised looking it up,
+            in the order the IDs were given. See `ravyapi.api.endpoints.ksoft.KSoft.get_ban`.
+        """
+        if not isinstance(concurrency, int):
+            raise TypeError('Parameter "concurrency" must be of type "int"')
+
+        if concurrency < 1:
+            raise ValueError('Parameter "concurrency" must be at least 1')
+
+        return await gather_bounded(self.get_ban, user_ids, concurrency=concurrency)
+
+    def iter_ban_many(
+        self, user_ids: Iterable[int], *, concurrency: int = 10
+    ) -> AsyncIterator[tuple[int, GetKSoftBanResponse | Exception]]:
+        """Get ban statuses of many users, yielding responses as they complete.
+
+        IDs are consumed lazily, so only the lookups in progress are held in memory,
+        along with every distinct ID seen so far to skip duplicates.
+
+        Parameters
+        ----------
+        user_ids : Iterable[int]
+            User IDs of the users to look up. Duplicates are only looked up once.
+        concurrency : int
+            The maximum amount of lookups running at once.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+
+        Returns
+        -------
+        AsyncIterator[tuple[int, GetKSoftBanResponse | Exception]]
+            An async iterator of every unique ID and its response, or the exception
+            raised looking it up. See `ravyapi.api.endpoints.ksoft.KSoft.get_ban`.
+        """
+        if not isinstance(concurrency, int):
+            raise TypeError('Parameter "concurrency" must be of type "int"')
+
+        if concurrency < 1:
+            raise ValueError('Parameter "concurrency" must be at least 1')
+
+        return iterate_bounded(self.get_ban, user_ids, concurrency=concurrency)
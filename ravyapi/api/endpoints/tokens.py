@@ -17,8 +17,14 @@ from __future__ import annotations
 
 __all__: tuple[str, ...] = ("Tokens",)
 
+from typing import Any, overload
+
+from typing_extensions import Literal
+
 from ravyapi.api.models import GetTokenResponse
+from ravyapi.data_binding import ResponseMode
 from ravyapi.http import HTTPAwareEndpoint
+from ravyapi.utils import copy_json
 
 
 class Tokens(HTTPAwareEndpoint):
@@ -26,13 +32,50 @@ class Tokens(HTTPAwareEndpoint):
 
     __slots__: tuple[str, ...] = ()
 
-    async def get_token(self: HTTPAwareEndpoint) -> GetTokenResponse:
+    @overload
+    async def get_token(
+        self, *, mode: Literal["model"] | None = ...
+    ) -> GetTokenResponse: ...
+
+    @overload
+    async def get_token(self, *, mode: Literal["json"]) -> dict[str, Any]: ...
+
+    @overload
+    async def get_token(self, *, mode: Literal["bytes"]) -> bytes: ...
+
+    async def get_token(
+        self, *, mode: ResponseMode | None = None
+    ) -> GetTokenResponse | dict[str, Any] | bytes:
         """Get current token information.
 
+        Parameters
+        ----------
+        mode : ResponseMode | None
+            Optional, what to return: `"model"` for the model, `"json"` for the decoded
+            JSON or `"bytes"` for the undecoded response body.
+            Defaults to `ravyapi.client.Client.response_mode`.
+
+        Raises
+        ------
+        ValueError
+            If any parameters are invalid values.
+
         Returns
         -------
-        GetTokenResponse
+        GetTokenResponse | dict[str, Any] | bytes
             A model response from `ravyapi.api.endpoints.tokens.Tokens.get_token`.
             Located as `ravyapi.api.models.tokens.GetTokenResponse`.
+            The decoded JSON or the undecoded response body instead, depending on `mode`.
         """
-        return GetTokenResponse(await self._http.get(self._http.paths.tokens.route))
+        mode = self._http.response_mode_of(mode)
+
+        if mode == "bytes":
+            return await self._http.get_bytes(self._http.paths.TOKEN)
+
+        data = await self._http.get(self._http.paths.TOKEN)
+
+        if mode == "json":
+            # Copied, as the decoded JSON is shared with the cache and other callers
+            return copy_json(data)
+
+        return GetTokenResponse(data, compact=self._http.compact_models)
@@ -18,11 +18,15 @@ from __future__ import annotations
 __all__: tuple[str, ...] = ("URLs",)
 
 import urllib.parse
-from typing import Any
+from typing import Any, Iterable, overload
+
+from typing_extensions import Literal
 
 from ravyapi.api.models import EditWebsiteRequest, GetWebsiteResponse
+from ravyapi.data_binding import ResponseMode
 from ravyapi.http import HTTPAwareEndpoint
-from ravyapi.utils import with_permission_check
+from ravyapi.links import canonicalize_url
+from ravyapi.utils import copy_json, gather_bounded, with_permission_check
 
 
 class URLs(HTTPAwareEndpoint):
@@ -30,6 +34,36 @@ class URLs(HTTPAwareEndpoint):
 
     __slots__: tuple[str, ...] = ()
 
+    @overload
+    async def get_website(
+        self,
+        url: str,
+        *,
+        author: int | None = ...,
+        phisherman_user: int | None = ...,
+        mode: Literal["model"] | None = ...,
+    ) -> GetWebsiteResponse: ...
+
+    @overload
+    async def get_website(
+        self,
+        url: str,
+        *,
+        author: int | None = ...,
+        phisherman_user: int | None = ...,
+        mode: Literal["json"],
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def get_website(
+        self,
+        url: str,
+        *,
+        author: int | None = ...,
+        phisherman_user: int | None = ...,
+        mode: Literal["bytes"],
+    ) -> bytes: ...
+
     @with_permission_check("urls.cached")
     async def get_website(
         self: HTTPAwareEndpoint,
@@ -37,7 +71,8 @@ class URLs(HTTPAwareEndpoint):
         *,
         author: int | None = None,
         phisherman_user: int | None = None,
-    ) -> GetWebsiteResponse:
+        mode: ResponseMode | None = None,
+    ) -> GetWebsiteResponse | dict[str, Any] | bytes:
         """Get website information.
 
         Parameters
@@ -48,6 +83,10 @@ class URLs(HTTPAwareEndpoint):
             Optional, the user that posted the message containing this URL (for auto banning, requires admin.users).
         phisherman_user : int | None
             Optional, required if `ravyapi.client.Client.set_phisherman_token` is called, Discord user ID of the token owner.
+        mode : ResponseMode | None
+            Optional, what to return: `"model"` for the model, `"json"` for the decoded
+            JSON or `"bytes"` for the undecoded response body.
+            Defaults to `ravyapi.client.Client.response_mode`.
 
         Raises
         ------
@@ -58,9 +97,10 @@ class URLs(HTTPAwareEndpoint):
 
         Returns
         -------
-        GetWebsiteResponse
+        GetWebsiteResponse | dict[str, Any] | bytes
             A model response from `ravyapi.api.endpoints.urls.URLs.get_website`.
             Located as `ravyapi.api.models.urls.GetWebsiteResponse`.
+            The decoded JSON or the undecoded response body instead, depending on `mode`.
         """
         if not isinstance(url, str):
             raise TypeError('Parameter "url" must be of type "str"')
@@ -91,9 +131,90 @@ class URLs(HTTPAwareEndpoint):
         if phisherman_user is not None:
             params["phisherman_user"] = phisherman_user
 
-        return GetWebsiteResponse(
-            await self._http.get(self._http.paths.urls.route, params=params)
+        mode = self._http.response_mode_of(mode)
+
+        if mode == "bytes":
+            return await self._http.get_bytes(self._http.paths.URLS, params=params)
+
+        data = await self._http.get(self._http.paths.URLS, params=params)
+
+        if mode == "json":
+            # Copied, as the decoded JSON is shared with the cache and other callers
+            return copy_json(data)
+
+        return GetWebsiteResponse(data, compact=self._http.compact_models)
+
+    async def check_many(
+        self,
+        urls: Iterable[str],
+        *,
+        author: int | None = None,
+        phisherman_user: int | None = None,
+        concurrency: int = 10,
+    ) -> dict[str, GetWebsiteResponse | Exception]:
+        """Get website information of many URLs, looking up every distinct URL once.
+
+        URLs are canonicalized with `ravyapi.links.canonicalize_url` first, so URLs only
+        differing in casing, fragments, trailing slashes or tracking parameters share
+        one lookup.
+
+        Parameters
+        ----------
+        urls : Iterable[str]
+            The URLs to look up.
+        author : int | None
+            Optional, the user that posted the message containing these URLs (for auto banning, requires admin.users).
+        phisherman_user : int | None
+            Optional, required if `ravyapi.client.Client.set_phisherman_token` is called, Discord user ID of the token owner.
+        concurrency : int
+            The maximum amount of lookups running at once.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+
+        Returns
+        -------
+        dict[str, GetWebsiteResponse | Exception]
+            The response of every given URL, or the exception raised canonicalizing or
+            looking it up, in the order the URLs were given. See `ravyapi.api.endpoints.urls.URLs.get_website`.
+        """
+        if not isinstance(concurrency, int):
+            raise TypeError('Parameter "concurrency" must be of type "int"')
+
+        if concurrency < 1:
+            raise ValueError('Parameter "concurrency" must be at least 1')
+
+        canonical: dict[str, str | Exception] = {}
+
+        for url in urls:
+            if not isinstance(url, str):
+                raise TypeError('Parameter "urls" must be an iterable of "str"')
+
+            if url not in canonical:
+                try:
+                    canonical[url] = canonicalize_url(url)
+                except ValueError as exc:
+                    # Malformed URL, e.g. an unclosed IPv6 literal, only fails its own lookup
+                    canonical[url] = exc
+
+        async def check(url: str) -> GetWebsiteResponse:
+            return await self.get_website(
+                url, author=author, phisherman_user=phisherman_user
+            )
+
+        results = await gather_bounded(
+            check,
+            (value for value in canonical.values() if isinstance(value, str)),
+            concurrency=concurrency,
         )
+        return {
+            url: value if isinstance(value, Exception) else results[value]
+            for url, value in canonical.items()
+        }
 
     @with_permission_check("admin.urls")
     async def edit_website(
@@ -103,6 +224,7 @@ class URLs(HTTPAwareEndpoint):
         is_fraudulent: bool,
         message: str,
         encode: bool = True,
+        retry: bool = False,
     ) -> None:
         """Edit website information.
 
@@ -116,6 +238,8 @@ class URLs(HTTPAwareEndpoint):
             An informational message about the website.
         encode : bool
             Whether to url-encode the parameter `url`.
+        retry : bool
+            Whether to retry the request on transient failures.
 
         Raises
         ------
@@ -142,10 +266,17 @@ class URLs(HTTPAwareEndpoint):
         if not isinstance(encode, bool):
             raise TypeError('Parameter "encode" must be of type "bool"')
 
+        if not isinstance(retry, bool):
+            raise TypeError('Parameter "retry" must be of type "bool"')
+
         if encode:
             message = urllib.parse.quote_plus(message)
 
         await self._http.post(
-            f"{self._http.paths.urls.route}/{url}",
+            self._http.paths.URL,
+            url,
             json=EditWebsiteRequest(is_fraudulent, message).to_json(),
+            retry=retry,
         )
+        await self._http.invalidate("urls", url)
+        await self._http.invalidate("urls", urllib.parse.unquote(url))
@@ -17,6 +17,10 @@ from __future__ import annotations
 
 __all__: tuple[str, ...] = ("Users",)
 
+from typing import Any, AsyncIterator, Iterable, overload
+
+from typing_extensions import Literal
+
 from ravyapi.api.models import (
     BanEntryRequest,
     GetBansResponse,
@@ -25,8 +29,30 @@ from ravyapi.api.models import (
     GetUserResponse,
     GetWhitelistsResponse,
 )
+from ravyapi.data_binding import ResponseMode
 from ravyapi.http import HTTPAwareEndpoint
-from ravyapi.utils import with_permission_check
+from ravyapi.utils import (
+    copy_json,
+    gather_bounded,
+    iterate_bounded,
+    with_permission_check,
+)
+
+
+def _pronouns_of(user: dict[str, Any]) -> dict[str, Any]:
+    return {"pronouns": user["pronouns"]}
+
+
+def _bans_of(user: dict[str, Any]) -> dict[str, Any]:
+    return {"trust": user["trust"], "bans": user["bans"]}
+
+
+def _whitelists_of(user: dict[str, Any]) -> dict[str, Any]:
+    return {"trust": user["trust"], "whitelists": user["whitelists"]}
+
+
+def _reputation_of(user: dict[str, Any]) -> dict[str, Any]:
+    return {"trust": user["trust"], "rep": user["rep"]}
 
 
 class Users(HTTPAwareEndpoint):
@@ -34,87 +60,275 @@ class Users(HTTPAwareEndpoint):
 
     __slots__: tuple[str, ...] = ()
 
+    @overload
+    async def get_user(
+        self, user_id: int, *, mode: Literal["model"] | None = ...
+    ) -> GetUserResponse: ...
+
+    @overload
+    async def get_user(
+        self, user_id: int, *, mode: Literal["json"]
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def get_user(self, user_id: int, *, mode: Literal["bytes"]) -> bytes: ...
+
     @with_permission_check("users")
-    async def get_user(self: HTTPAwareEndpoint, user_id: int) -> GetUserResponse:
+    async def get_user(
+        self: HTTPAwareEndpoint, user_id: int, *, mode: ResponseMode | None = None
+    ) -> GetUserResponse | dict[str, Any] | bytes:
         """Get extensive user information.
 
         Parameters
         ----------
         user_id : int
             User ID of the user to look up.
+        mode : ResponseMode | None
+            Optional, what to return: `"model"` for the model, `"json"` for the decoded
+            JSON or `"bytes"` for the undecoded response body.
+            Defaults to `ravyapi.client.Client.response_mode`.
 
         Raises
         ------
         TypeError
             If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
 
         Returns
         -------
-        GetUserResponse
+        GetUserResponse | dict[str, Any] | bytes
             A model response from `ravyapi.api.endpoints.users.Users.get_user`.
             Located as `ravyapi.api.models.users.GetUserResponse`.
+            The decoded JSON or the undecoded response body instead, depending on `mode`.
         """
         if not isinstance(user_id, int):
             raise TypeError('Parameter "user_id" must be of type "int"')
 
+        mode = self._http.response_mode_of(mode)
+
+        if mode == "bytes":
+            return await self._http.get_bytes(self._http.paths.USER, user_id)
+
+        data = await self._http.get(self._http.paths.USER, user_id)
+
+        if mode == "json":
+            # Copied, as the decoded JSON is shared with the cache and other callers
+            return copy_json(data)
+
         return GetUserResponse(
-            await self._http.get(self._http.paths.users(user_id).route)
+            data,
+            lazy=self._http.lazy_models,
+            compact=self._http.compact_models,
         )
 
+    async def get_user_many(
+        self, user_ids: Iterable[int], *, concurrency: int = 10
+    ) -> dict[int, GetUserResponse | Exception]:
+        """Get extensive user information of many users, with bounded concurrency.
+
+        Parameters
+        ----------
+        user_ids : Iterable[int]
+            User IDs of the users to look up. Duplicates are only looked up once.
+        concurrency : int
+            The maximum amount of lookups running at once.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+
+        Returns
+        -------
+        dict[int, GetUserResponse | Exception]
+            The response of every unique ID, or the exception raised looking it up,
+            in the order the IDs were given. See `ravyapi.api.endpoints.users.Users.get_user`.
+        """
+        if not isinstance(concurrency, int):
+            raise TypeError('Parameter "concurrency" must be of type "int"')
+
+        if concurrency < 1:
+            raise ValueError('Parameter "concurrency" must be at least 1')
+
+        return await gather_bounded(self.get_user, user_ids, concurrency=concurrency)
+
+    def iter_user_many(
+        self, user_ids: Iterable[int], *, concurrency: int = 10
+    ) -> AsyncIterator[tuple[int, GetUserResponse | Exception]]:
+        """Get extensive user information of many users, yielding responses as they complete.
+
+        IDs are consumed lazily, so only the lookups in progress are held in memory,
+        along with every distinct ID seen so far to skip duplicates.
+
+        Parameters
+        ----------
+        user_ids : Iterable[int]
+            User IDs of the users to look up. Duplicates are only looked up once.
+        concurrency : int
+            The maximum amount of lookups running at once.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+
+        Returns
+        -------
+        AsyncIterator[tuple[int, GetUserResponse | Exception]]
+            An async iterator of every unique ID and its response, or the exception
+            raised looking it up. See `ravyapi.api.endpoints.users.Users.get_user`.
+        """
+        if not isinstance(concurrency, int):
+            raise TypeError('Parameter "concurrency" must be of type "int"')
+
+        if concurrency < 1:
+            raise ValueError('Parameter "concurrency" must be at least 1')
+
+        return iterate_bounded(self.get_user, user_ids, concurrency=concurrency)
+
+    @overload
+    async def get_pronouns(
+        self, user_id: int, *, mode: Literal["model"] | None = ...
+    ) -> GetPronounsResponse: ...
+
+    @overload
+    async def get_pronouns(
+        self, user_id: int, *, mode: Literal["json"]
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def get_pronouns(self, user_id: int, *, mode: Literal["bytes"]) -> bytes: ...
+
     @with_permission_check("users.pronouns")
     async def get_pronouns(
-        self: HTTPAwareEndpoint, user_id: int
-    ) -> GetPronounsResponse:
+        self: HTTPAwareEndpoint, user_id: int, *, mode: ResponseMode | None = None
+    ) -> GetPronounsResponse | dict[str, Any] | bytes:
         """Get pronouns.
 
+        Taken from a cached `ravyapi.api.endpoints.users.Users.get_user` response if
+        there is one. Requested together with other parts of the same user, such as
+        its bans, whitelists, reputation or pronouns, it is taken from one `get_user`
+        request instead. Neither applies with the `"bytes"` mode.
+
         Parameters
         ----------
         user_id : int
             User ID of the user to look up.
+        mode : ResponseMode | None
+            Optional, what to return: `"model"` for the model, `"json"` for the decoded
+            JSON or `"bytes"` for the undecoded response body.
+            Defaults to `ravyapi.client.Client.response_mode`.
 
         Raises
         ------
         TypeError
             If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
 
         Returns
         -------
-        GetPronounsResponse
+        GetPronounsResponse | dict[str, Any] | bytes
             A model response from `ravyapi.api.endpoints.users.Users.get_pronouns`.
             Located as `ravyapi.api.models.users.GetPronounsResponse`.
+            The decoded JSON or the undecoded response body instead, depending on `mode`.
         """
         if not isinstance(user_id, int):
             raise TypeError('Parameter "user_id" must be of type "int"')
 
-        return GetPronounsResponse(
-            await self._http.get(self._http.paths.users(user_id).pronouns)
+        mode = self._http.response_mode_of(mode)
+
+        if mode == "bytes":
+            return await self._http.get_bytes(self._http.paths.USER_PRONOUNS, user_id)
+
+        data = await self._http.get_part(
+            self._http.paths.USER_PRONOUNS,
+            user_id,
+            whole=self._http.paths.USER,
+            part=_pronouns_of,
         )
 
+        if mode == "json":
+            # Copied, as the decoded JSON is shared with the cache and other callers
+            return copy_json(data)
+
+        return GetPronounsResponse(data, compact=self._http.compact_models)
+
+    @overload
+    async def get_bans(
+        self, user_id: int, *, mode: Literal["model"] | None = ...
+    ) -> GetBansResponse: ...
+
+    @overload
+    async def get_bans(
+        self, user_id: int, *, mode: Literal["json"]
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def get_bans(self, user_id: int, *, mode: Literal["bytes"]) -> bytes: ...
+
     @with_permission_check("users.bans")
-    async def get_bans(self: HTTPAwareEndpoint, user_id: int) -> GetBansResponse:
+    async def get_bans(
+        self: HTTPAwareEndpoint, user_id: int, *, mode: ResponseMode | None = None
+    ) -> GetBansResponse | dict[str, Any] | bytes:
         """Get bans.
 
+        Taken from a cached `ravyapi.api.endpoints.users.Users.get_user` response if
+        there is one. Requested together with other parts of the same user, such as
+        its bans, whitelists, reputation or pronouns, it is taken from one `get_user`
+        request instead. Neither applies with the `"bytes"` mode.
+
         Parameters
         ----------
         user_id : int
             User ID of the user to look up.
+        mode : ResponseMode | None
+            Optional, what to return: `"model"` for the model, `"json"` for the decoded
+            JSON or `"bytes"` for the undecoded response body.
+            Defaults to `ravyapi.client.Client.response_mode`.
 
         Raises
         ------
         TypeError
             If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
 
         Returns
         -------
-        GetBansResponse
+        GetBansResponse | dict[str, Any] | bytes
             A model response from `ravyapi.api.endpoints.users.Users.get_bans`.
             Located as `ravyapi.api.models.users.GetBansResponse`.
+            The decoded JSON or the undecoded response body instead, depending on `mode`.
         """
         if not isinstance(user_id, int):
             raise TypeError('Parameter "user_id" must be of type "int"')
 
+        mode = self._http.response_mode_of(mode)
+
+        if mode == "bytes":
+            return await self._http.get_bytes(self._http.paths.USER_BANS, user_id)
+
+        data = await self._http.get_part(
+            self._http.paths.USER_BANS,
+            user_id,
+            whole=self._http.paths.USER,
+            part=_bans_of,
+        )
+
+        if mode == "json":
+            # Copied, as the decoded JSON is shared with the cache and other callers
+            return copy_json(data)
+
         return GetBansResponse(
-            await self._http.get(self._http.paths.users(user_id).bans)
+            data,
+            lazy=self._http.lazy_models,
+            compact=self._http.compact_models,
         )
 
     @with_permission_check("admin.bans")
@@ -126,6 +340,7 @@ class Users(HTTPAwareEndpoint):
         reason: str,
         moderator: int,
         reason_key: str | None = None,
+        retry: bool = False,
     ) -> None:
         """Add ban.
 
@@ -141,6 +356,8 @@ class Users(HTTPAwareEndpoint):
             User ID of the responsible moderator, usually Discord.
         reason_key : str | None
             Machine-readable version of the reason - only present for providers ravy and dservices.
+        retry : bool
+            Whether to retry the request on transient failures, which may add the ban twice.
 
         Raises
         ------
@@ -173,65 +390,161 @@ class Users(HTTPAwareEndpoint):
         if reason_key is not None and not reason_key:
             raise ValueError('Parameter "reason_key" must not be empty')
 
+        if not isinstance(retry, bool):
+            raise TypeError('Parameter "retry" must be of type "bool"')
+
         await self._http.post(
-            self._http.paths.users(user_id).bans,
+            self._http.paths.USER_BANS,
+            user_id,
             json=BanEntryRequest(provider, reason, moderator, reason_key).to_json(),
+            retry=retry,
         )
+        await self._http.invalidate("users", user_id)
+
+    @overload
+    async def get_whitelists(
+        self, user_id: int, *, mode: Literal["model"] | None = ...
+    ) -> GetWhitelistsResponse: ...
+
+    @overload
+    async def get_whitelists(
+        self, user_id: int, *, mode: Literal["json"]
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def get_whitelists(
+        self, user_id: int, *, mode: Literal["bytes"]
+    ) -> bytes: ...
 
     @with_permission_check("users.whitelists")
     async def get_whitelists(
-        self: HTTPAwareEndpoint, user_id: int
-    ) -> GetWhitelistsResponse:
+        self: HTTPAwareEndpoint, user_id: int, *, mode: ResponseMode | None = None
+    ) -> GetWhitelistsResponse | dict[str, Any] | bytes:
         """Get whitelists.
 
+        Taken from a cached `ravyapi.api.endpoints.users.Users.get_user` response if
+        there is one. Requested together with other parts of the same user, such as
+        its bans, whitelists, reputation or pronouns, it is taken from one `get_user`
+        request instead. Neither applies with the `"bytes"` mode.
+
         Parameters
         ----------
         user_id : int
             User ID of the user to look up.
+        mode : ResponseMode | None
+            Optional, what to return: `"model"` for the model, `"json"` for the decoded
+            JSON or `"bytes"` for the undecoded response body.
+            Defaults to `ravyapi.client.Client.response_mode`.
 
         Raises
         ------
         TypeError
             If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
 
         Returns
         -------
-        GetWhitelistsResponse
+        GetWhitelistsResponse | dict[str, Any] | bytes
             A model response from `ravyapi.api.endpoints.users.Users.get_whitelists`.
             Located as `ravyapi.api.models.users.GetWhitelistsResponse`.
+            The decoded JSON or the undecoded response body instead, depending on `mode`.
         """
         if not isinstance(user_id, int):
             raise TypeError('Parameter "user_id" must be of type "int"')
 
+        mode = self._http.response_mode_of(mode)
+
+        if mode == "bytes":
+            return await self._http.get_bytes(self._http.paths.USER_WHITELISTS, user_id)
+
+        data = await self._http.get_part(
+            self._http.paths.USER_WHITELISTS,
+            user_id,
+            whole=self._http.paths.USER,
+            part=_whitelists_of,
+        )
+
+        if mode == "json":
+            # Copied, as the decoded JSON is shared with the cache and other callers
+            return copy_json(data)
+
         return GetWhitelistsResponse(
-            await self._http.get(self._http.paths.users(user_id).whitelists)
+            data,
+            lazy=self._http.lazy_models,
+            compact=self._http.compact_models,
         )
 
+    @overload
+    async def get_reputation(
+        self, user_id: int, *, mode: Literal["model"] | None = ...
+    ) -> GetReputationResponse: ...
+
+    @overload
+    async def get_reputation(
+        self, user_id: int, *, mode: Literal["json"]
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def get_reputation(
+        self, user_id: int, *, mode: Literal["bytes"]
+    ) -> bytes: ...
+
     @with_permission_check("users.rep")
     async def get_reputation(
-        self: HTTPAwareEndpoint, user_id: int
-    ) -> GetReputationResponse:
+        self: HTTPAwareEndpoint, user_id: int, *, mode: ResponseMode | None = None
+    ) -> GetReputationResponse | dict[str, Any] | bytes:
         """Get reputation.
 
+        Taken from a cached `ravyapi.api.endpoints.users.Users.get_user` response if
+        there is one. Requested together with other parts of the same user, such as
+        its bans, whitelists, reputation or pronouns, it is taken from one `get_user`
+        request instead. Neither applies with the `"bytes"` mode.
+
         Parameters
         ----------
         user_id : int
             User ID of the user to look up.
+        mode : ResponseMode | None
+            Optional, what to return: `"model"` for the model, `"json"` for the decoded
+            JSON or `"bytes"` for the undecoded response body.
+            Defaults to `ravyapi.client.Client.response_mode`.
 
         Raises
         ------
         TypeError
             If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
 
         Returns
         -------
-        GetReputationResponse
+        GetReputationResponse | dict[str, Any] | bytes
             A model response from `ravyapi.api.endpoints.users.Users.get_reputation`.
             Located as `ravyapi.api.models.users.GetReputationResponse`.
+            The decoded JSON or the undecoded response body instead, depending on `mode`.
         """
         if not isinstance(user_id, int):
             raise TypeError('Parameter "user_id" must be of type "int"')
 
+        mode = self._http.response_mode_of(mode)
+
+        if mode == "bytes":
+            return await self._http.get_bytes(self._http.paths.USER_REPUTATION, user_id)
+
+        data = await self._http.get_part(
+            self._http.paths.USER_REPUTATION,
+            user_id,
+            whole=self._http.paths.USER,
+            part=_reputation_of,
+        )
+
+        if mode == "json":
+            # Copied, as the decoded JSON is shared with the cache and other callers
+            return copy_json(data)
+
         return GetReputationResponse(
-            await self._http.get(self._http.paths.users(user_id).reputation)
+            data,
+            lazy=self._http.lazy_models,
+            compact=self._http.compact_models,
         )
@@ -18,6 +18,7 @@ from __future__ import annotations
 from ravyapi.api.models.avatars import *
 from ravyapi.api.models.generic import *
 from ravyapi.api.models.guilds import *
+from ravyapi.api.models.interning import *
 from ravyapi.api.models.ksoft import *
 from ravyapi.api.models.tokens import *
 from ravyapi.api.models.urls import *
@@ -25,20 +25,28 @@ class CheckAvatarResponse:
 
     Attributes
     ----------
-    data: dict[str, Any]
+    data : dict[str, Any]
         The raw data returned from the Ravy API.
-    matched: bool
+    matched : bool
         Whether the avatar was matched.
-    key: str
+    key : str
         The avatar key that matched.
-    similarity: float
+    similarity : float
         Similarity of the avatar to the key, represented as a float between 0 and 1.
     """
 
     __slots__: tuple[str, ...] = ("_data", "_matched", "_key", "_similarity")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
+    def __init__(self, data: dict[str, Any], *, compact: bool = False) -> None:
+        """
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The raw data returned from the Ravy API.
+        compact : bool
+            Whether to drop the raw data, rebuilding it from the fields when accessed.
+        """
+        self._data: dict[str, Any] | None = None if compact else data
         self._matched: bool = data["matched"]
         self._key: str | None = data.get("key")
         self._similarity: float | None = data.get("similarity")
@@ -52,6 +60,17 @@ class CheckAvatarResponse:
     @property
     def data(self) -> dict[str, Any]:
         """The raw data returned from the Ravy API."""
+        if self._data is None:
+            data: dict[str, Any] = {"matched": self._matched}
+
+            if self._key is not None:
+                data["key"] = self._key
+
+            if self._similarity is not None:
+                data["similarity"] = self._similarity
+
+            return data
+
         return self._data
 
     @property
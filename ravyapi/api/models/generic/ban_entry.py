@@ -19,21 +19,23 @@ __all__: tuple[str, ...] = ("BanEntryRequest", "BanEntryResponse")
 
 from typing import Any
 
+from ravyapi.api.models.interning import INTERNED_STRINGS
+
 
 class BanEntryResponse:
     """A generic model for ban entry responses.
 
     Attributes
     ----------
-    data: dict[str, Any]
+    data : dict[str, Any]
         The raw data returned from the Ravy API.
-    provider: str
+    provider : str
         Source for where the user or guild was banned.
-    reason: str
+    reason : str
         Why the user or guild was banned.
-    reason_key: str | None
+    reason_key : str | None
         Machine-readable version of the reason - only present for providers ravy and dservices.
-    moderator: int
+    moderator : int
         User ID of the responsible moderator, usually Discord.
     """
 
@@ -45,11 +47,22 @@ class BanEntryResponse:
         "_moderator",
     )
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
-        self._provider: str = data["provider"]
+    def __init__(self, data: dict[str, Any], *, compact: bool = False) -> None:
+        """
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The raw data returned from the Ravy API.
+        compact : bool
+            Whether to drop the raw data, rebuilding it from the fields when accessed.
+        """
+        self._data: dict[str, Any] | None = None if compact else data
+        self._provider: str = INTERNED_STRINGS.intern(data["provider"])
         self._reason: str = data["reason"]
-        self._reason_key: str | None = data.get("reason_key")
+        reason_key: str | None = data.get("reason_key")
+        self._reason_key: str | None = (
+            INTERNED_STRINGS.intern(reason_key) if reason_key is not None else None
+        )
         self._moderator: int = int(data["moderator"])
 
     def __repr__(self) -> str:
@@ -62,6 +75,18 @@ class BanEntryResponse:
     @property
     def data(self) -> dict[str, Any]:
         """The raw data returned from the Ravy API."""
+        if self._data is None:
+            data: dict[str, Any] = {
+                "provider": self._provider,
+                "reason": self._reason,
+                "moderator": str(self._moderator),
+            }
+
+            if self._reason_key is not None:
+                data["reason_key"] = self._reason_key
+
+            return data
+
         return self._data
 
     @property
@@ -90,24 +115,24 @@ class BanEntryRequest:
 
     Parameters
     ----------
-    provider: str
+    provider : str
         Source for where the user or guild is banned.
-    reason: str
+    reason : str
         Why the user or guild is banned.
-    moderator: int
+    moderator : int
         User ID of the responsible moderator, usually Discord.
-    reason_key: str | None
+    reason_key : str | None
         Machine-readable version of the reason - only present for providers ravy and dservices.
 
     Attributes
     ----------
-    provider: str
+    provider : str
         Source for where the user or guild is banned.
-    reason: str
+    reason : str
         Why the user or guild is banned.
-    moderator: int
+    moderator : int
         User ID of the responsible moderator, usually Discord.
-    reason_key: str | None
+    reason_key : str | None
         Machine-readable version of the reason - only present for providers ravy and dservices.
     """
 
@@ -119,13 +144,13 @@ class BanEntryRequest:
         """
         Parameters
         ----------
-        provider: str
+        provider : str
             Source for where the user or guild is banned.
-        reason: str
+        reason : str
             Why the user or guild is banned.
-        moderator: int
+        moderator : int
             User ID of the responsible moderator, usually Discord.
-        reason_key: str | None
+        reason_key : str | None
             Machine-readable version of the reason - only present for providers ravy and dservices.
         """
         self._provider: str = provider
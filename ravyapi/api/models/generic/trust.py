@@ -19,26 +19,41 @@ __all__: tuple[str, ...] = ("Trust",)
 
 from typing import Any
 
+from typing_extensions import Final
+
+from ravyapi.api.models.interning import INTERNED_STRINGS, InternTable
+
 
 class Trust:
     """A generic model for trust.
 
+    Trust models are immutable and compare equal by level and label, so the few
+    distinct ones can be shared between compact responses with `Trust.shared`.
+
     Attributes
     ----------
-    data: dict[str, Any]
+    data : dict[str, Any]
         The raw data returned from the Ravy API.
-    level: int
+    level : int
         From 0-6, higher is better, default is 3.
-    label: str
+    label : str
         What the number means.
     """
 
     __slots__: tuple[str, ...] = ("_data", "_level", "_label")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
+    def __init__(self, data: dict[str, Any], *, compact: bool = False) -> None:
+        """
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The raw data returned from the Ravy API.
+        compact : bool
+            Whether to drop the raw data, rebuilding it from the fields when accessed.
+        """
+        self._data: dict[str, Any] | None = None if compact else data
         self._level: int = data["level"]
-        self._label: str = data["label"]
+        self._label: str = INTERNED_STRINGS.intern(data["label"])
 
     def __repr__(self) -> str:
         return (
@@ -46,9 +61,40 @@ class Trust:
             f"(level={self.level!r}, label={self.label!r})"
         )
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Trust):
+            return NotImplemented
+
+        return self._level == other._level and self._label == other._label
+
+    def __hash__(self) -> int:
+        return hash((self._level, self._label))
+
+    @classmethod
+    def shared(cls, data: dict[str, Any]) -> Trust:
+        """Get the trust model shared by every response with the same level and label.
+
+        Shared models are compact, rebuilding their raw data when accessed, so keys
+        unknown to the model are dropped.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The raw data returned from the Ravy API.
+
+        Returns
+        -------
+        Trust
+            The shared `ravyapi.api.models.generic.trust.Trust` trust model.
+        """
+        return _INTERNED_TRUSTS.intern(cls(data, compact=True))
+
     @property
     def data(self) -> dict[str, Any]:
         """The raw data returned from the Ravy API."""
+        if self._data is None:
+            return {"level": self._level, "label": self._label}
+
         return self._data
 
     @property
@@ -60,3 +106,6 @@ class Trust:
     def label(self) -> str:
         """What the number means."""
         return self._label
+
+
+_INTERNED_TRUSTS: Final[InternTable[Trust]] = InternTable(max_size=64)
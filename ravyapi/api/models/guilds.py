@@ -27,22 +27,49 @@ class GetGuildResponse:
 
     Attributes
     ----------
-    data: dict[str, Any]
+    data : dict[str, Any]
         The raw data returned from the Ravy API.
-    trust: Trust
+    trust : Trust
         The guild's `ravyapi.api.models.generic.trust.Trust` trust model.
-    bans: list[BanEntryResponse]
+    bans : list[BanEntryResponse]
         A list of the guild's `ravyapi.api.models.generic.ban_entry.BanEntryResponse` ban models.
     """
 
     __slots__: tuple[str, ...] = ("_data", "_trust", "_bans")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
-        self._trust: Trust = data["trust"]
-        self._bans: list[BanEntryResponse] = [
-            BanEntryResponse(ban) for ban in data["bans"]
-        ]
+    def __init__(
+        self, data: dict[str, Any], *, lazy: bool = False, compact: bool = False
+    ) -> None:
+        """
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The raw data returned from the Ravy API.
+        lazy : bool
+            Whether to build the nested models when first accessed instead of now.
+        compact : bool
+            Whether to drop the raw data, rebuilding it from the fields when accessed.
+            Cannot be combined with `lazy`, which builds the nested models from it.
+
+        Raises
+        ------
+        ValueError
+            If both `lazy` and `compact` are set.
+        """
+        if lazy and compact:
+            raise ValueError('Parameters "lazy" and "compact" are mutually exclusive')
+
+        self._data: dict[str, Any] | None = None if compact else data
+        self._trust: Trust | None = (
+            None
+            if lazy
+            else (Trust.shared(data["trust"]) if compact else Trust(data["trust"]))
+        )
+        self._bans: list[BanEntryResponse] | None = (
+            None
+            if lazy
+            else [BanEntryResponse(ban, compact=compact) for ban in data["bans"]]
+        )
 
     def __repr__(self) -> str:
         return (
@@ -53,14 +80,26 @@ class GetGuildResponse:
     @property
     def data(self) -> dict[str, Any]:
         """The raw data returned from the Ravy API."""
+        if self._data is None:
+            return {
+                "trust": self.trust.data,
+                "bans": [ban.data for ban in self.bans],
+            }
+
         return self._data
 
     @property
     def trust(self) -> Trust:
         """The guild's `ravyapi.api.models.generic.trust.Trust` trust model."""
+        if self._trust is None:
+            self._trust = Trust(self.data["trust"])
+
         return self._trust
 
     @property
     def bans(self) -> list[BanEntryResponse]:
         """A list of the guilds's `ravyapi.api.models.generic.ban_entry.BanEntryResponse` ban models."""
+        if self._bans is None:
+            self._bans = [BanEntryResponse(ban) for ban in self.data["bans"]]
+
         return self._bans
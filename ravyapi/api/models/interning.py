@@ -0,0 +1,103 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Interning of values repeated across many models."""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = ("InternTable", "INTERNED_STRINGS")
+
+from typing import Generic, Hashable, TypeVar
+
+from typing_extensions import Final
+
+_ValueT = TypeVar("_ValueT", bound=Hashable)
+
+
+class InternTable(Generic[_ValueT]):
+    """A bounded table of canonical instances of equal immutable values.
+
+    Interning a value returns the first equal value interned, so models built from many
+    responses share one instance of each repeated value instead of one per response.
+    Once the table is full, new values are returned as given, so a flood of distinct
+    values cannot grow it without bound.
+
+    Attributes
+    ----------
+    max_size : int
+        The maximum amount of values interned.
+    """
+
+    __slots__: tuple[str, ...] = ("_max_size", "_values")
+
+    def __init__(self, *, max_size: int = 1024) -> None:
+        """
+        Parameters
+        ----------
+        max_size : int
+            The maximum amount of values interned.
+        """
+        if max_size < 1:
+            raise ValueError('Parameter "max_size" must be at least 1')
+
+        self._max_size: int = max_size
+        self._values: dict[_ValueT, _ValueT] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(max_size={self.max_size!r}, size={len(self)!r})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._values
+
+    def intern(self, value: _ValueT) -> _ValueT:
+        """Get the canonical instance of a value.
+
+        Parameters
+        ----------
+        value : _ValueT
+            The value to intern.
+
+        Returns
+        -------
+        _ValueT
+            The interned value equal to `value`, or `value` itself if it was not
+            interned before and the table is full.
+        """
+        interned = self._values.get(value)
+
+        if interned is not None:
+            return interned
+
+        if len(self._values) < self._max_size:
+            self._values[value] = value
+
+        return value
+
+    def clear(self) -> None:
+        """Forget every interned value."""
+        self._values.clear()
+
+    @property
+    def max_size(self) -> int:
+        """The maximum amount of values interned."""
+        return self._max_size
+
+
+INTERNED_STRINGS: Final[InternTable[str]] = InternTable(max_size=4096)
+"""The table interning strings repeated across models, such as ban providers."""
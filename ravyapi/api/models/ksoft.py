@@ -27,7 +27,7 @@ class GetKSoftBanResponse:
     ----------
     data : dict[str, Any]
         The raw data returned from the Ravy API.
-    found: bool
+    found : bool
         Whether the user was found in the database.
     user_id : int | None
         The user's ID, if found.
@@ -57,8 +57,16 @@ class GetKSoftBanResponse:
         "_timestamp",
     )
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
+    def __init__(self, data: dict[str, Any], *, compact: bool = False) -> None:
+        """
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The raw data returned from the Ravy API.
+        compact : bool
+            Whether to drop the raw data, rebuilding it from the fields when accessed.
+        """
+        self._data: dict[str, Any] | None = None if compact else data
         self._found: bool = data["found"]
         user_id: str | None = data.get("id")
         self._user_id: int | None = int(user_id) if user_id else None
@@ -81,6 +89,22 @@ class GetKSoftBanResponse:
     @property
     def data(self) -> dict[str, Any]:
         """The raw data returned from the Ravy API."""
+        if self._data is None:
+            data: dict[str, Any] = {
+                "found": self._found,
+                "id": str(self._user_id) if self._user_id is not None else None,
+                "tag": self._tag,
+                "reason": self._reason,
+                "proof": self._proof,
+                "moderator": (
+                    str(self._moderator) if self._moderator is not None else None
+                ),
+                "severe": self._severe,
+                "timestamp": self._timestamp,
+            }
+
+            return {key: value for key, value in data.items() if value is not None}
+
         return self._data
 
     @property
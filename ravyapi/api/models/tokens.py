@@ -27,15 +27,15 @@ class GetTokenResponse:
 
     Attributes
     ----------
-    data: dict[str, Any]
+    data : dict[str, Any]
         The raw data returned from the Ravy API.
-    user: str
+    user : str
         The user ID associated with the token.
-    access: list[str]
+    access : list[str]
         A list of valid permission nodes for the token.
-    application: int
+    application : int
         The application ID registered to the token.
-    token_type: Literal["ravy", "ksoft"]
+    token_type : Literal["ravy", "ksoft"]
         The type of the token, either "ravy" or "ksoft."
     """
 
@@ -47,8 +47,16 @@ class GetTokenResponse:
         "_token_type",
     )
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
+    def __init__(self, data: dict[str, Any], *, compact: bool = False) -> None:
+        """
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The raw data returned from the Ravy API.
+        compact : bool
+            Whether to drop the raw data, rebuilding it from the fields when accessed.
+        """
+        self._data: dict[str, Any] | None = None if compact else data
         self._user: int = int(data["user"])
         self._access: list[str] = data["access"]
         self._application: int = int(data["application"])
@@ -64,6 +72,14 @@ class GetTokenResponse:
     @property
     def data(self) -> dict[str, Any]:
         """The raw data returned from the Ravy API."""
+        if self._data is None:
+            return {
+                "user": str(self._user),
+                "access": self._access,
+                "application": str(self._application),
+                "type": self._token_type,
+            }
+
         return self._data
 
     @property
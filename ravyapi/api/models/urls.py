@@ -25,18 +25,26 @@ class GetWebsiteResponse:
 
     Attributes
     ----------
-    data: dict[str, Any]
+    data : dict[str, Any]
         The raw data returned from the Ravy API.
-    is_fraudulent: bool
+    is_fraudulent : bool
         Whether the website is fraudulent.
-    message: str
+    message : str
         An informational message about the website.
     """
 
     __slots__: tuple[str, ...] = ("_data", "_is_fraudulent", "_message")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
+    def __init__(self, data: dict[str, Any], *, compact: bool = False) -> None:
+        """
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The raw data returned from the Ravy API.
+        compact : bool
+            Whether to drop the raw data, rebuilding it from the fields when accessed.
+        """
+        self._data: dict[str, Any] | None = None if compact else data
         self._is_fraudulent: bool = data["isFraudulent"]
         self._message: str = data["message"]
 
@@ -49,6 +57,9 @@ class GetWebsiteResponse:
     @property
     def data(self) -> dict[str, Any]:
         """The raw data returned from the Ravy API."""
+        if self._data is None:
+            return {"isFraudulent": self._is_fraudulent, "message": self._message}
+
         return self._data
 
     @property
@@ -67,16 +78,16 @@ class EditWebsiteRequest:
 
     Parameters
     ----------
-    is_fraudulent: bool
+    is_fraudulent : bool
         Whether the website is fraudulent.
-    message: str
+    message : str
         An informational message about the website.
 
     Attributes
     ----------
-    is_fraudulent: bool
+    is_fraudulent : bool
         Whether the website is fraudulent.
-    message: str
+    message : str
         An informational message about the website.
     """
 
@@ -86,9 +97,9 @@ class EditWebsiteRequest:
         """
         Parameters
         ----------
-        is_fraudulent: bool
+        is_fraudulent : bool
             Whether the website is fraudulent.
-        message: str
+        message : str
             An informational message about the website.
         """
         self._is_fraudulent: bool = is_fraudulent
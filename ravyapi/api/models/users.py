@@ -29,6 +29,7 @@ __all__: tuple[str, ...] = (
 from typing import Any
 
 from ravyapi.api.models.generic import BanEntryResponse, Trust
+from ravyapi.api.models.interning import INTERNED_STRINGS
 
 
 class GetUserResponse:
@@ -62,18 +63,56 @@ class GetUserResponse:
         "_sentinel",
     )
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
+    def __init__(
+        self, data: dict[str, Any], *, lazy: bool = False, compact: bool = False
+    ) -> None:
+        """
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The raw data returned from the Ravy API.
+        lazy : bool
+            Whether to build the nested models when first accessed instead of now.
+        compact : bool
+            Whether to drop the raw data, rebuilding it from the fields when accessed.
+            Cannot be combined with `lazy`, which builds the nested models from it.
+
+        Raises
+        ------
+        ValueError
+            If both `lazy` and `compact` are set.
+        """
+        if lazy and compact:
+            raise ValueError('Parameters "lazy" and "compact" are mutually exclusive')
+
+        self._data: dict[str, Any] | None = None if compact else data
         self._pronouns: str = data["pronouns"]
-        self._trust: Trust = Trust(data["trust"])
-        self._whitelists: list[WhitelistEntry] = [
-            WhitelistEntry(whitelist) for whitelist in data["whitelists"]
-        ]
-        self._bans: list[BanEntryResponse] = [
-            BanEntryResponse(ban) for ban in data["bans"]
-        ]
-        self._rep: list[ReputationEntry] = [ReputationEntry(rep) for rep in data["rep"]]
-        self._sentinel: SentinelEntry = SentinelEntry(data["sentinel"])
+        self._trust: Trust | None = (
+            None
+            if lazy
+            else (Trust.shared(data["trust"]) if compact else Trust(data["trust"]))
+        )
+        self._whitelists: list[WhitelistEntry] | None = (
+            None
+            if lazy
+            else [
+                WhitelistEntry(whitelist, compact=compact)
+                for whitelist in data["whitelists"]
+            ]
+        )
+        self._bans: list[BanEntryResponse] | None = (
+            None
+            if lazy
+            else [BanEntryResponse(ban, compact=compact) for ban in data["bans"]]
+        )
+        self._rep: list[ReputationEntry] | None = (
+            None
+            if lazy
+            else [ReputationEntry(rep, compact=compact) for rep in data["rep"]]
+        )
+        self._sentinel: SentinelEntry | None = (
+            None if lazy else SentinelEntry(data["sentinel"], compact=compact)
+        )
 
     def __repr__(self) -> str:
         return (
@@ -86,6 +125,16 @@ class GetUserResponse:
     @property
     def data(self) -> dict[str, Any]:
         """The raw data returned from the Ravy API."""
+        if self._data is None:
+            return {
+                "pronouns": self._pronouns,
+                "trust": self.trust.data,
+                "whitelists": [whitelist.data for whitelist in self.whitelists],
+                "bans": [ban.data for ban in self.bans],
+                "rep": [rep.data for rep in self.rep],
+                "sentinel": self.sentinel.data,
+            }
+
         return self._data
 
     @property
@@ -96,26 +145,43 @@ class GetUserResponse:
     @property
     def trust(self) -> Trust:
         """The user's `ravyapi.api.models.generic.trust.Trust` trust model."""
+        if self._trust is None:
+            self._trust = Trust(self.data["trust"])
+
         return self._trust
 
     @property
     def whitelists(self) -> list[WhitelistEntry]:
         """A list of the user's `ravyapi.api.models.users.WhitelistEntry` whitelist models."""
+        if self._whitelists is None:
+            self._whitelists = [
+                WhitelistEntry(whitelist) for whitelist in self.data["whitelists"]
+            ]
+
         return self._whitelists
 
     @property
     def bans(self) -> list[BanEntryResponse]:
         """A list of the user's `ravyapi.api.models.generic.ban_entry.BanEntryResponse` ban models."""
+        if self._bans is None:
+            self._bans = [BanEntryResponse(ban) for ban in self.data["bans"]]
+
         return self._bans
 
     @property
     def rep(self) -> list[ReputationEntry]:
         """A list of the user's `ravyapi.api.models.users.ReputationEntry` reputation models."""
+        if self._rep is None:
+            self._rep = [ReputationEntry(rep) for rep in self.data["rep"]]
+
         return self._rep
 
     @property
     def sentinel(self) -> SentinelEntry:
         """The user's `ravyapi.api.models.users.SentinelEntry` sentinel model."""
+        if self._sentinel is None:
+            self._sentinel = SentinelEntry(self.data["sentinel"])
+
         return self._sentinel
 
 
@@ -132,8 +198,16 @@ class GetPronounsResponse:
 
     __slots__: tuple[str, ...] = ("_data", "_pronouns")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
+    def __init__(self, data: dict[str, Any], *, compact: bool = False) -> None:
+        """
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The raw data returned from the Ravy API.
+        compact : bool
+            Whether to drop the raw data, rebuilding it from the fields when accessed.
+        """
+        self._data: dict[str, Any] | None = None if compact else data
         self._pronouns: str = data["pronouns"]
 
     def __repr__(self) -> str:
@@ -145,6 +219,9 @@ class GetPronounsResponse:
     @property
     def data(self) -> dict[str, Any]:
         """The raw data returned from the Ravy API."""
+        if self._data is None:
+            return {"pronouns": self._pronouns}
+
         return self._data
 
     @property
@@ -168,10 +245,39 @@ class GetBansResponse:
 
     __slots__: tuple[str, ...] = ("_data", "_trust", "_bans")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
-        self._trust = Trust(data["trust"])
-        self._bans = [BanEntryResponse(ban) for ban in data["bans"]]
+    def __init__(
+        self, data: dict[str, Any], *, lazy: bool = False, compact: bool = False
+    ) -> None:
+        """
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The raw data returned from the Ravy API.
+        lazy : bool
+            Whether to build the nested models when first accessed instead of now.
+        compact : bool
+            Whether to drop the raw data, rebuilding it from the fields when accessed.
+            Cannot be combined with `lazy`, which builds the nested models from it.
+
+        Raises
+        ------
+        ValueError
+            If both `lazy` and `compact` are set.
+        """
+        if lazy and compact:
+            raise ValueError('Parameters "lazy" and "compact" are mutually exclusive')
+
+        self._data: dict[str, Any] | None = None if compact else data
+        self._trust: Trust | None = (
+            None
+            if lazy
+            else (Trust.shared(data["trust"]) if compact else Trust(data["trust"]))
+        )
+        self._bans: list[BanEntryResponse] | None = (
+            None
+            if lazy
+            else [BanEntryResponse(ban, compact=compact) for ban in data["bans"]]
+        )
 
     def __repr__(self) -> str:
         return (
@@ -182,16 +288,28 @@ class GetBansResponse:
     @property
     def data(self) -> dict[str, Any]:
         """The raw data returned from the Ravy API."""
+        if self._data is None:
+            return {
+                "trust": self.trust.data,
+                "bans": [ban.data for ban in self.bans],
+            }
+
         return self._data
 
     @property
     def trust(self) -> Trust:
         """The user's `ravyapi.api.models.generic.trust.Trust` trust model."""
+        if self._trust is None:
+            self._trust = Trust(self.data["trust"])
+
         return self._trust
 
     @property
     def bans(self) -> list[BanEntryResponse]:
         """A list of the user's `ravyapi.api.models.generic.ban_entry.BanEntryResponse` ban models."""
+        if self._bans is None:
+            self._bans = [BanEntryResponse(ban) for ban in self.data["bans"]]
+
         return self._bans
 
 
@@ -210,12 +328,42 @@ class GetWhitelistsResponse:
 
     __slots__: tuple[str, ...] = ("_data", "_whitelists", "_trust")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
-        self._whitelists = [
-            WhitelistEntry(whitelist) for whitelist in data["whitelists"]
-        ]
-        self._trust = Trust(data["trust"])
+    def __init__(
+        self, data: dict[str, Any], *, lazy: bool = False, compact: bool = False
+    ) -> None:
+        """
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The raw data returned from the Ravy API.
+        lazy : bool
+            Whether to build the nested models when first accessed instead of now.
+        compact : bool
+            Whether to drop the raw data, rebuilding it from the fields when accessed.
+            Cannot be combined with `lazy`, which builds the nested models from it.
+
+        Raises
+        ------
+        ValueError
+            If both `lazy` and `compact` are set.
+        """
+        if lazy and compact:
+            raise ValueError('Parameters "lazy" and "compact" are mutually exclusive')
+
+        self._data: dict[str, Any] | None = None if compact else data
+        self._whitelists: list[WhitelistEntry] | None = (
+            None
+            if lazy
+            else [
+                WhitelistEntry(whitelist, compact=compact)
+                for whitelist in data["whitelists"]
+            ]
+        )
+        self._trust: Trust | None = (
+            None
+            if lazy
+            else (Trust.shared(data["trust"]) if compact else Trust(data["trust"]))
+        )
 
     def __repr__(self) -> str:
         return (
@@ -226,16 +374,30 @@ class GetWhitelistsResponse:
     @property
     def data(self) -> dict[str, Any]:
         """The raw data returned from the Ravy API."""
+        if self._data is None:
+            return {
+                "whitelists": [whitelist.data for whitelist in self.whitelists],
+                "trust": self.trust.data,
+            }
+
         return self._data
 
     @property
     def whitelists(self) -> list[WhitelistEntry]:
         """A list of the user's `ravyapi.api.models.users.WhitelistEntry` whitelist models."""
+        if self._whitelists is None:
+            self._whitelists = [
+                WhitelistEntry(whitelist) for whitelist in self.data["whitelists"]
+            ]
+
         return self._whitelists
 
     @property
     def trust(self) -> Trust:
         """The user's `ravyapi.api.models.generic.trust.Trust` trust model."""
+        if self._trust is None:
+            self._trust = Trust(self.data["trust"])
+
         return self._trust
 
 
@@ -254,10 +416,39 @@ class GetReputationResponse:
 
     __slots__: tuple[str, ...] = ("_data", "_rep", "_trust")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
-        self._rep = [ReputationEntry(rep) for rep in data["rep"]]
-        self._trust = Trust(data["trust"])
+    def __init__(
+        self, data: dict[str, Any], *, lazy: bool = False, compact: bool = False
+    ) -> None:
+        """
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The raw data returned from the Ravy API.
+        lazy : bool
+            Whether to build the nested models when first accessed instead of now.
+        compact : bool
+            Whether to drop the raw data, rebuilding it from the fields when accessed.
+            Cannot be combined with `lazy`, which builds the nested models from it.
+
+        Raises
+        ------
+        ValueError
+            If both `lazy` and `compact` are set.
+        """
+        if lazy and compact:
+            raise ValueError('Parameters "lazy" and "compact" are mutually exclusive')
+
+        self._data: dict[str, Any] | None = None if compact else data
+        self._rep: list[ReputationEntry] | None = (
+            None
+            if lazy
+            else [ReputationEntry(rep, compact=compact) for rep in data["rep"]]
+        )
+        self._trust: Trust | None = (
+            None
+            if lazy
+            else (Trust.shared(data["trust"]) if compact else Trust(data["trust"]))
+        )
 
     def __repr__(self) -> str:
         return (
@@ -268,16 +459,28 @@ class GetReputationResponse:
     @property
     def data(self) -> dict[str, Any]:
         """The raw data returned from the Ravy API."""
+        if self._data is None:
+            return {
+                "rep": [rep.data for rep in self.rep],
+                "trust": self.trust.data,
+            }
+
         return self._data
 
     @property
     def rep(self) -> list[ReputationEntry]:
         """A list of the user's `ravyapi.api.models.users.ReputationEntry` reputation models."""
+        if self._rep is None:
+            self._rep = [ReputationEntry(rep) for rep in self.data["rep"]]
+
         return self._rep
 
     @property
     def trust(self) -> Trust:
         """The user's `ravyapi.api.models.generic.trust.Trust` trust model."""
+        if self._trust is None:
+            self._trust = Trust(self.data["trust"])
+
         return self._trust
 
 
@@ -296,10 +499,18 @@ class WhitelistEntry:
 
     __slots__: tuple[str, ...] = ("_data", "_provider", "_reason")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
-        self._provider: str = data["provider"]
-        self._reason: str = data["reason"]
+    def __init__(self, data: dict[str, Any], *, compact: bool = False) -> None:
+        """
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The raw data returned from the Ravy API.
+        compact : bool
+            Whether to drop the raw data, rebuilding it from the fields when accessed.
+        """
+        self._data: dict[str, Any] | None = None if compact else data
+        self._provider: str = INTERNED_STRINGS.intern(data["provider"])
+        self._reason: str = INTERNED_STRINGS.intern(data["reason"])
 
     def __repr__(self) -> str:
         return (
@@ -310,6 +521,9 @@ class WhitelistEntry:
     @property
     def data(self) -> dict[str, Any]:
         """The raw data returned from the Ravy API."""
+        if self._data is None:
+            return {"provider": self._provider, "reason": self._reason}
+
         return self._data
 
     @property
@@ -348,9 +562,17 @@ class ReputationEntry:
         "_downvotes",
     )
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
-        self._provider: str = data["provider"]
+    def __init__(self, data: dict[str, Any], *, compact: bool = False) -> None:
+        """
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The raw data returned from the Ravy API.
+        compact : bool
+            Whether to drop the raw data, rebuilding it from the fields when accessed.
+        """
+        self._data: dict[str, Any] | None = None if compact else data
+        self._provider: str = INTERNED_STRINGS.intern(data["provider"])
         self._score: float = data["score"]
         self._upvotes: int | None = data.get("upvotes")
         self._downvotes: int | None = data.get("downvotes")
@@ -365,6 +587,17 @@ class ReputationEntry:
     @property
     def data(self) -> dict[str, Any]:
         """The raw data returned from the Ravy API."""
+        if self._data is None:
+            data: dict[str, Any] = {"provider": self._provider, "score": self._score}
+
+            if self._upvotes is not None:
+                data["upvotes"] = self._upvotes
+
+            if self._downvotes is not None:
+                data["downvotes"] = self._downvotes
+
+            return data
+
         return self._data
 
     @property
@@ -403,8 +636,16 @@ class SentinelEntry:
 
     __slots__: tuple[str, ...] = ("_data", "_verified", "_internal_id")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
+    def __init__(self, data: dict[str, Any], *, compact: bool = False) -> None:
+        """
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The raw data returned from the Ravy API.
+        compact : bool
+            Whether to drop the raw data, rebuilding it from the fields when accessed.
+        """
+        self._data: dict[str, Any] | None = None if compact else data
         self._verified: bool = data["verified"]
         self._internal_id: str = str(data["id"])
 
@@ -417,6 +658,9 @@ class SentinelEntry:
     @property
     def data(self) -> dict[str, Any]:
         """The raw data returned from the Ravy API."""
+        if self._data is None:
+            return {"verified": self._verified, "id": self._internal_id}
+
         return self._data
 
     @property
@@ -15,7 +15,127 @@
 
 from __future__ import annotations
 
-__all__: tuple[str, ...] = ("Paths",)
+__all__: tuple[str, ...] = ("Paths", "Route")
+
+import yarl
+from typing_extensions import Final
+
+from ravyapi.const import BASE_URL
+
+
+class Route:
+    """A precompiled route template of an endpoint.
+
+    The URL of the route is built once, so building the URL of a request only joins
+    the ID or URL it is about into the precompiled template.
+
+    Attributes
+    ----------
+    name : str
+        The name of the endpoint, for example `users.bans`.
+    template : str
+        The path of the endpoint, with `{}` in place of the ID or URL, if any.
+    bucket : str
+        The key of the endpoint's rate limit bucket, for example `/users/{id}/bans`.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_name",
+        "_template",
+        "_bucket",
+        "_base",
+        "_prefix",
+        "_suffix",
+        "_url",
+    )
+
+    def __init__(self, name: str, template: str, *, base_url: str = BASE_URL) -> None:
+        """
+        Parameters
+        ----------
+        name : str
+            The name of the endpoint, for example `users.bans`.
+        template : str
+            The path of the endpoint, with `{}` in place of the ID or URL, if any.
+        base_url : str
+            The base URL of the API the path is relative to.
+        """
+        base = yarl.URL(base_url)
+        prefix, placeholder, suffix = template.partition("{}")
+
+        self._name: str = name
+        self._template: str = template
+        self._bucket: str = template.replace("{}", "{id}")
+        self._base: yarl.URL = base.origin()
+        self._prefix: str = base.raw_path.rstrip("/") + prefix
+        self._suffix: str = suffix
+        self._url: yarl.URL | None = (
+            None if placeholder else self._base.with_path(self._prefix, encoded=True)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(name={self.name!r}, template={self.template!r})"
+        )
+
+    def path(self, resource: int | str | None = None) -> str:
+        """Get the path of a request to the endpoint.
+
+        Parameters
+        ----------
+        resource : int | str | None
+            The ID or URL the request is about, if the endpoint takes one.
+
+        Returns
+        -------
+        str
+            The path of the request, relative to the base URL.
+        """
+        if self._url is not None:
+            return self._template
+
+        return self._template.replace("{}", str(resource))
+
+    def url(self, resource: int | str | None = None) -> yarl.URL:
+        """Get the full URL of a request to the endpoint.
+
+        Parameters
+        ----------
+        resource : int | str | None
+            The ID or URL the request is about, if the endpoint takes one.
+
+        Returns
+        -------
+        yarl.URL
+            The URL of the request. Endpoints without an ID or URL reuse one instance.
+        """
+        if self._url is not None:
+            return self._url
+
+        if isinstance(resource, int):
+            # Only the path is replaced, since IDs never need quoting
+            return self._base.with_path(
+                f"{self._prefix}{resource}{self._suffix}", encoded=True
+            )
+
+        # URLs are passed already quoted, which is kept as is when parsing
+        return self._base.join(yarl.URL(f"{self._prefix}{resource}{self._suffix}"))
+
+    @property
+    def name(self) -> str:
+        """The name of the endpoint, for example `users.bans`."""
+        return self._name
+
+    @property
+    def template(self) -> str:
+        """The path of the endpoint, with `{}` in place of the ID or URL, if any."""
+        return self._template
+
+    @property
+    def bucket(self) -> str:
+        """The key of the endpoint's rate limit bucket, for example `/users/{id}/bans`."""
+        return self._bucket
 
 
 class BasePath:
@@ -46,6 +166,9 @@ class BasePath:
 class Paths:
     """A main class for routing paths to the Ravy API.
 
+    The precompiled `Route` of every endpoint is available as a constant, which is
+    what requests are made with. The path classes remain for building paths by hand.
+
     Attributes
     ----------
     avatars : Avatars
@@ -58,12 +181,19 @@ class Paths:
         A path class for the `urls` endpoint.
     """
 
-    __slots__: tuple[str, ...] = (
-        "avatars",
-        "ksoft",
-        "tokens",
-        "urls",
-    )
+    __slots__: tuple[str, ...] = ()
+
+    AVATARS: Final[Route] = Route("avatars", "/avatars")
+    GUILD: Final[Route] = Route("guilds", "/guilds/{}")
+    KSOFT_BAN: Final[Route] = Route("ksoft.bans", "/ksoft/bans/{}")
+    TOKEN: Final[Route] = Route("tokens", "/tokens/@current")
+    URLS: Final[Route] = Route("urls", "/urls")
+    URL: Final[Route] = Route("urls", "/urls/{}")
+    USER: Final[Route] = Route("users", "/users/{}")
+    USER_PRONOUNS: Final[Route] = Route("users.pronouns", "/users/{}/pronouns")
+    USER_BANS: Final[Route] = Route("users.bans", "/users/{}/bans")
+    USER_WHITELISTS: Final[Route] = Route("users.whitelists", "/users/{}/whitelists")
+    USER_REPUTATION: Final[Route] = Route("users.rep", "/users/{}/rep")
 
     @property
     def avatars(self) -> Avatars:
@@ -164,7 +294,7 @@ class KSoft(BasePath):
         The route for the endpoint.
     """
 
-    __slots__: tuple[str, ...] = ("bans",)
+    __slots__: tuple[str, ...] = ()
 
     def __init__(self) -> None:
         super().__init__("/ksoft")
@@ -234,7 +364,7 @@ class Users(BasePath):
         The route for `reputation`.
     """
 
-    __slots__: tuple[str, ...] = ("_user_id", "_route")
+    __slots__: tuple[str, ...] = ()
 
     def __init__(self, user_id: int) -> None:
         super().__init__(f"/users/{user_id}", user_id)
@@ -258,3 +388,7 @@ class Users(BasePath):
     def reputation(self) -> str:
         """The route for `reputation`."""
         return f"{self.route}/rep"
+
+
+PATHS: Final[Paths] = Paths()
+"""The shared instance of `Paths`."""
@@ -0,0 +1,550 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cache backends sharing response bodies between processes."""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = (
+    "CacheBackend",
+    "CacheBackendError",
+    "MemoryBackend",
+    "RedisBackend",
+)
+
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict, deque
+from typing import Any, Sequence
+
+import yarl
+from typing_extensions import Final, Protocol, runtime_checkable
+
+_LOGGER: Final[logging.Logger] = logging.getLogger("ravyapi.backends")
+
+
+class CacheBackendError(Exception):
+    """A class denoting an exception raised when a cache backend fails a command."""
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """The interface of a cache of response bodies shared between clients.
+
+    Keys are strings such as `users:1234`, and values are the bodies of responses.
+    Backends are free to lose values at any time, as a missing value only costs a
+    request to the Ravy API.
+    """
+
+    async def get(self, key: str) -> bytes | None:
+        """Get a value.
+
+        Parameters
+        ----------
+        key : str
+            The key of the value.
+
+        Returns
+        -------
+        bytes | None
+            The value, or `None` if it is not cached or expired.
+        """
+        ...
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Get many values at once, in as few round trips as the backend allows.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            The keys of the values.
+
+        Returns
+        -------
+        list[bytes | None]
+            The value of every key, in order, or `None` for those not cached or expired.
+        """
+        ...
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Set a value.
+
+        Parameters
+        ----------
+        key : str
+            The key of the value.
+        value : bytes
+            The value.
+        ttl : float
+            The time to live of the value, in seconds.
+        """
+        ...
+
+    async def delete(self, keys: Sequence[str]) -> int:
+        """Delete values.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            The keys of the values.
+
+        Returns
+        -------
+        int
+            The amount of deleted values.
+        """
+        ...
+
+    async def close(self) -> None:
+        """Release the resources of the backend, such as connections."""
+        ...
+
+
+class MemoryBackend:
+    """A `CacheBackend` in the memory of the process, bounded with LRU eviction.
+
+    Values are only shared by clients in the same process, which makes this mostly
+    useful for trying out backends and as a reference implementation.
+
+    Attributes
+    ----------
+    max_size : int
+        The maximum amount of values.
+    """
+
+    __slots__: tuple[str, ...] = ("_max_size", "_values")
+
+    def __init__(self, *, max_size: int = 4096) -> None:
+        """
+        Parameters
+        ----------
+        max_size : int
+            The maximum amount of values.
+        """
+        if max_size < 1:
+            raise ValueError('Parameter "max_size" must be at least 1')
+
+        self._max_size: int = max_size
+        self._values: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(max_size={self.max_size!r}, size={len(self)!r})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _get(self, key: str) -> bytes | None:
+        entry = self._values.get(key)
+
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+
+        if expires_at <= time.monotonic():
+            del self._values[key]
+            return None
+
+        self._values.move_to_end(key)
+        return value
+
+    async def get(self, key: str) -> bytes | None:
+        """Get a value, see `CacheBackend.get`."""
+        return self._get(key)
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Get many values at once, see `CacheBackend.get_many`."""
+        return [self._get(key) for key in keys]
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Set a value, see `CacheBackend.set`."""
+        self._values[key] = (value, time.monotonic() + ttl)
+        self._values.move_to_end(key)
+
+        while len(self._values) > self._max_size:
+            self._values.popitem(last=False)
+
+    async def delete(self, keys: Sequence[str]) -> int:
+        """Delete values, see `CacheBackend.delete`."""
+        return sum(self._values.pop(key, None) is not None for key in keys)
+
+    async def close(self) -> None:
+        """Remove all values."""
+        self._values.clear()
+
+    @property
+    def max_size(self) -> int:
+        """The maximum amount of values."""
+        return self._max_size
+
+
+def _encode_command(args: Sequence[str | bytes | int]) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+
+    return b"".join(parts)
+
+
+async def _read_reply(reader: asyncio.StreamReader) -> Any:
+    line = await reader.readuntil(b"\r\n")
+    kind, payload = line[:1], line[1:-2]
+
+    if kind == b"+":
+        return payload
+
+    if kind == b"-":
+        return CacheBackendError(payload.decode(errors="replace"))
+
+    if kind == b":":
+        return int(payload)
+
+    if kind == b"$":
+        length = int(payload)
+        return None if length < 0 else (await reader.readexactly(length + 2))[:-2]
+
+    if kind == b"*":
+        length = int(payload)
+        return (
+            None if length < 0 else [await _read_reply(reader) for _ in range(length)]
+        )
+
+    raise CacheBackendError(f"Invalid reply from Redis: {line!r}")
+
+
+class RedisBackend:
+    """A `CacheBackend` in Redis, or any server speaking the Redis protocol.
+
+    Values are shared by every client using the same server and namespace, so a
+    response fetched by one process answers the same lookup in all others.
+
+    Commands are pipelined on one connection per event loop: concurrent commands are
+    written without waiting for the replies of those before them, and `get_many` is
+    a single `MGET`, so batch lookups take one round trip.
+
+    Attributes
+    ----------
+    host : str
+        The host of the server.
+    port : int
+        The port of the server.
+    db : int
+        The database number to use.
+    namespace : str
+        The prefix of every key, separating the values of this library from others.
+    timeout : float
+        The timeout, in seconds, of connecting and of every command.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_host",
+        "_port",
+        "_db",
+        "_username",
+        "_password",
+        "_namespace",
+        "_timeout",
+        "_connecting",
+        "_writer",
+        "_replies",
+        "_reader_task",
+    )
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        *,
+        db: int = 0,
+        username: str | None = None,
+        password: str | None = None,
+        namespace: str = "ravyapi:",
+        timeout: float = 1.0,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        host : str
+            The host of the server.
+        port : int
+            The port of the server.
+        db : int
+            The database number to use.
+        username : str | None
+            Optional, the username to authenticate with, for servers with ACLs.
+        password : str | None
+            Optional, the password to authenticate with.
+        namespace : str
+            The prefix of every key, separating the values of this library from others.
+        timeout : float
+            The timeout, in seconds, of connecting and of every command.
+        """
+        if timeout <= 0:
+            raise ValueError('Parameter "timeout" must be positive')
+
+        self._host: str = host
+        self._port: int = port
+        self._db: int = db
+        self._username: str | None = username
+        self._password: str | None = password
+        self._namespace: str = namespace
+        self._timeout: float = timeout
+        self._connecting: asyncio.Future[None] | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._replies: deque[asyncio.Future[Any]] = deque()
+        self._reader_task: asyncio.Task[None] | None = None
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> RedisBackend:
+        """Create a backend from a URL such as `redis://:password@localhost:6379/0`.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the server.
+        **kwargs : Any
+            The other keyword arguments of `RedisBackend`.
+
+        Returns
+        -------
+        RedisBackend
+            The backend.
+        """
+        parsed = yarl.URL(url)
+
+        if parsed.scheme != "redis":
+            raise ValueError('Parameter "url" must have the "redis" scheme')
+
+        return cls(
+            parsed.host or "localhost",
+            parsed.port or 6379,
+            db=int(parsed.path.strip("/") or 0),
+            username=parsed.user or None,
+            password=parsed.password,
+            **kwargs,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(host={self.host!r}, port={self.port!r}, db={self.db!r}, "
+            f"namespace={self.namespace!r})"
+        )
+
+    async def _connect(self) -> None:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self._host, self._port), self._timeout
+        )
+        self._writer = writer
+        self._replies.clear()
+        self._reader_task = asyncio.ensure_future(self._read_replies(reader))
+        _LOGGER.debug("Connected to Redis at %s:%s", self._host, self._port)
+
+        setup: list[tuple[str | bytes | int, ...]] = []
+
+        if self._password is not None:
+            setup.append(
+                ("AUTH", self._password)
+                if self._username is None
+                else ("AUTH", self._username, self._password)
+            )
+
+        if self._db:
+            setup.append(("SELECT", self._db))
+
+        # Written before any other command, which waits for the connection
+        replies = [self._write(command) for command in setup]
+
+        try:
+            for reply in replies:
+                await asyncio.wait_for(asyncio.shield(reply), self._timeout)
+        except BaseException:
+            self._disconnect()
+            raise
+
+    async def _ensure_connected(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        if (
+            self._writer is not None
+            and not self._writer.is_closing()
+            and self._reader_task is not None
+            and self._reader_task.get_loop() is loop
+        ):
+            return
+
+        if (
+            self._connecting is None
+            or self._connecting.done()
+            or self._connecting.get_loop() is not loop
+        ):
+            self._disconnect()
+            self._connecting = asyncio.ensure_future(self._connect())
+
+        await asyncio.shield(self._connecting)
+
+    def _disconnect(self, exc: BaseException | None = None) -> None:
+        try:
+            if self._reader_task is not None:
+                self._reader_task.cancel()
+
+            if self._writer is not None:
+                self._writer.close()
+        except RuntimeError:
+            # The connection belongs to an event loop which is already closed
+            pass
+
+        self._reader_task = None
+        self._writer = None
+
+        while self._replies:
+            future = self._replies.popleft()
+
+            if not future.done():
+                future.set_exception(
+                    exc
+                    if exc is not None
+                    else ConnectionError("Disconnected from Redis")
+                )
+
+    async def _read_replies(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                reply = await _read_reply(reader)
+                future = self._replies.popleft()
+
+                # Commands timing out are still answered, but nobody waits for them
+                if future.done():
+                    continue
+
+                if isinstance(reply, CacheBackendError):
+                    future.set_exception(reply)
+                else:
+                    future.set_result(reply)
+        except asyncio.CancelledError:
+            raise
+        except (OSError, EOFError, CacheBackendError, ValueError) as exc:
+            _LOGGER.warning("Lost connection to Redis: %r", exc)
+            self._reader_task = None
+            self._disconnect(ConnectionError(f"Lost connection to Redis: {exc!r}"))
+
+    def _write(self, args: Sequence[str | bytes | int]) -> asyncio.Future[Any]:
+        assert self._writer is not None
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        # Replies arrive in the order commands are written, which is the order here
+        self._replies.append(future)
+        self._writer.write(_encode_command(args))
+        return future
+
+    async def execute(self, *args: str | bytes | int) -> Any:
+        """Execute a raw command.
+
+        Parameters
+        ----------
+        *args : str | bytes | int
+            The command and its arguments, for example `"PING"`.
+
+        Raises
+        ------
+        CacheBackendError
+            If the server replies with an error.
+        ConnectionError
+            If the connection to the server is lost.
+        asyncio.TimeoutError
+            If the server does not reply within `timeout`.
+
+        Returns
+        -------
+        Any
+            The reply of the server.
+        """
+        await self._ensure_connected()
+        return await asyncio.wait_for(asyncio.shield(self._write(args)), self._timeout)
+
+    async def get(self, key: str) -> bytes | None:
+        """Get a value, see `CacheBackend.get`."""
+        value: bytes | None = await self.execute("GET", self._namespace + key)
+        return value
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Get many values at once, see `CacheBackend.get_many`."""
+        if not keys:
+            return []
+
+        values: list[bytes | None] = await self.execute(
+            "MGET", *(self._namespace + key for key in keys)
+        )
+        return values
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Set a value, see `CacheBackend.set`."""
+        if math.isinf(ttl):
+            await self.execute("SET", self._namespace + key, value)
+        else:
+            await self.execute(
+                "SET", self._namespace + key, value, "PX", max(1, int(ttl * 1000))
+            )
+
+    async def delete(self, keys: Sequence[str]) -> int:
+        """Delete values, see `CacheBackend.delete`."""
+        if not keys:
+            return 0
+
+        deleted: int = await self.execute(
+            "DEL", *(self._namespace + key for key in keys)
+        )
+        return deleted
+
+    async def close(self) -> None:
+        """Close the connection to the server, failing commands awaiting a reply."""
+        writer = self._writer
+        self._connecting = None
+        self._disconnect()
+
+        if writer is not None:
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    @property
+    def host(self) -> str:
+        """The host of the server."""
+        return self._host
+
+    @property
+    def port(self) -> int:
+        """The port of the server."""
+        return self._port
+
+    @property
+    def db(self) -> int:
+        """The database number to use."""
+        return self._db
+
+    @property
+    def namespace(self) -> str:
+        """The prefix of every key, separating the values of this library from others."""
+        return self._namespace
+
+    @property
+    def timeout(self) -> float:
+        """The timeout, in seconds, of connecting and of every command."""
+        return self._timeout
@@ -0,0 +1,1594 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Caching of decoded responses from the Ravy API, in memory and on disk."""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = (
+    "AvatarCache",
+    "CachePolicy",
+    "CacheStats",
+    "DiskCache",
+    "ResponseCache",
+)
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Hashable, Mapping, get_args
+
+from typing_extensions import Final, Literal, TypeAlias
+
+from ravyapi.api.errors import NotFoundError
+from ravyapi.data_binding import default_json_dumps, default_json_loads
+
+_LOGGER: Final[logging.Logger] = logging.getLogger("ravyapi.cache")
+
+CachePolicy: TypeAlias = Literal["lru", "tinylfu"]
+"""How a `ResponseCache` picks the responses to evict: least recently used first, or
+W-TinyLFU, which only admits new responses over those used more often."""
+
+_CACHE_POLICIES: Final[tuple[str, ...]] = get_args(CachePolicy)
+
+DEFAULT_TTLS: Final[Mapping[str, float]] = {
+    "users": 60.0,
+    "guilds": 60.0,
+    "ksoft.bans": 300.0,
+    "urls": 300.0,
+}
+"""The default time to live, in seconds, of cached responses per endpoint."""
+
+DEFAULT_NEGATIVE_TTLS: Final[Mapping[str, float]] = {
+    "users": 15.0,
+    "guilds": 15.0,
+    "ksoft.bans": 30.0,
+    "urls": 30.0,
+}
+"""The default time to live, in seconds, of cached 404 results per endpoint."""
+
+_DIGEST_CHUNK_SIZE: Final[int] = 64 * 1024
+
+# Smaller payloads are stored as they are, as compressing them saves next to nothing
+_COMPRESSION_THRESHOLD: Final[int] = 512
+
+_SCHEMA: Final[tuple[str, ...]] = (
+    "PRAGMA auto_vacuum = INCREMENTAL",
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    """
+    CREATE TABLE IF NOT EXISTS responses (
+        key TEXT PRIMARY KEY,
+        route TEXT NOT NULL,
+        resource TEXT,
+        expires_at REAL NOT NULL,
+        negative INTEGER NOT NULL,
+        compressed INTEGER NOT NULL,
+        value BLOB NOT NULL
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)",
+    "CREATE INDEX IF NOT EXISTS responses_resource ON responses (resource)",
+)
+
+
+class CacheStats:
+    """Metrics describing the effectiveness of a `ResponseCache`.
+
+    Attributes
+    ----------
+    hits : int
+        The amount of lookups answered from the cache with a response.
+    negative_hits : int
+        The amount of lookups answered from the cache with a `NotFoundError`.
+    misses : int
+        The amount of lookups that were not cached or had expired.
+    evictions : int
+        The amount of entries evicted to stay within the maximum size.
+    disk_hits : int
+        The amount of hits answered from the `DiskCache` after missing in memory.
+    stale_hits : int
+        The amount of hits answered with an expired response within its grace window.
+    refreshes : int
+        The amount of background refreshes of stale or frequently accessed responses.
+    size : int
+        The amount of entries currently cached.
+    hit_ratio : float
+        The ratio of lookups answered from the cache, between 0 and 1.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_hits",
+        "_negative_hits",
+        "_misses",
+        "_evictions",
+        "_disk_hits",
+        "_stale_hits",
+        "_refreshes",
+        "_size",
+    )
+
+    def __init__(self) -> None:
+        self._hits: int = 0
+        self._negative_hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._disk_hits: int = 0
+        self._stale_hits: int = 0
+        self._refreshes: int = 0
+        self._size: int = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(hits={self.hits!r}, negative_hits={self.negative_hits!r}, "
+            f"misses={self.misses!r}, "
+            f"evictions={self.evictions!r}, disk_hits={self.disk_hits!r}, "
+            f"stale_hits={self.stale_hits!r}, refreshes={self.refreshes!r}, "
+            f"size={self.size!r})"
+        )
+
+    @property
+    def hits(self) -> int:
+        """The amount of lookups answered from the cache with a response."""
+        return self._hits
+
+    @property
+    def negative_hits(self) -> int:
+        """The amount of lookups answered from the cache with a `NotFoundError`."""
+        return self._negative_hits
+
+    @property
+    def misses(self) -> int:
+        """The amount of lookups that were not cached or had expired."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """The amount of entries evicted to stay within the maximum size."""
+        return self._evictions
+
+    @property
+    def disk_hits(self) -> int:
+        """The amount of hits answered from the `DiskCache` after missing in memory."""
+        return self._disk_hits
+
+    @property
+    def stale_hits(self) -> int:
+        """The amount of hits answered with an expired response within its grace window."""
+        return self._stale_hits
+
+    @property
+    def refreshes(self) -> int:
+        """The amount of background refreshes of stale or frequently accessed responses."""
+        return self._refreshes
+
+    @property
+    def size(self) -> int:
+        """The amount of entries currently cached."""
+        return self._size
+
+    @property
+    def hit_ratio(self) -> float:
+        """The ratio of lookups answered from the cache, between 0 and 1."""
+        hits = self._hits + self._negative_hits
+        total = hits + self._misses
+        return hits / total if total else 0.0
+
+
+class _CacheEntry:
+    __slots__: tuple[str, ...] = (
+        "value",
+        "route",
+        "resource",
+        "expires_at",
+        "negative",
+        "stale_until",
+        "refresh_at",
+        "hits",
+    )
+
+    def __init__(
+        self,
+        value: Any,
+        route: str,
+        resource: str | None,
+        expires_at: float,
+        negative: bool = False,
+    ) -> None:
+        self.value: Any = value
+        self.route: str = route
+        self.resource: str | None = resource
+        self.expires_at: float = expires_at
+        self.negative: bool = negative
+        self.stale_until: float = expires_at
+        self.refresh_at: float = float("inf")
+        self.hits: int = 0
+
+
+def _lookup_ttl(ttls: Mapping[str, float], route: str) -> float | None:
+    while True:
+        ttl = ttls.get(route)
+
+        if ttl is not None or "." not in route:
+            return ttl if ttl is None or ttl > 0 else None
+
+        route = route.rpartition(".")[0]
+
+
+def _disk_key(key: Hashable) -> str:
+    # Request keys include every query parameter, tokens among them, so only a digest
+    # of them is written to disk
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+
+# An odd 64-bit multiplier spreading the bits of a hash over those of the product,
+# which is truncated to 64 bits so that small hashes, such as those of integers,
+# still vary in every slice
+_SKETCH_SEED: Final[int] = 0x9E3779B97F4A7C15
+
+_SKETCH_MAX_WIDTH: Final[int] = 1 << 16
+
+_SKETCH_MASK: Final[int] = (1 << 64) - 1
+
+_SKETCH_MAX_COUNT: Final[int] = 15
+
+_HALVED_COUNTS: Final[bytes] = bytes(count >> 1 for count in range(256))
+
+
+class _FrequencySketch:
+    """A count-min sketch estimating how often keys were looked up recently.
+
+    The sketch has four rows of four counters per key of capacity, indexed by four
+    16-bit slices of one 64-bit product of the hash, stored back to back in one array.
+    Counters saturate at 15 and are all halved after as many lookups as ten times the
+    capacity, so keys popular long ago lose their weight.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_counts",
+        "_width",
+        "_mask",
+        "_additions",
+        "_sample_size",
+    )
+
+    def __init__(self, capacity: int) -> None:
+        width = min(1 << max(4, (4 * capacity - 1).bit_length()), _SKETCH_MAX_WIDTH)
+        self._counts: bytearray = bytearray(4 * width)
+        self._width: int = width
+        self._mask: int = width - 1
+        self._additions: int = 0
+        self._sample_size: int = 10 * capacity
+
+    def _indexes(self, key: Hashable) -> tuple[int, int, int, int]:
+        mixed = (hash(key) * _SKETCH_SEED) & _SKETCH_MASK
+        mask, width = self._mask, self._width
+        return (
+            mixed & mask,
+            width + ((mixed >> 16) & mask),
+            2 * width + ((mixed >> 32) & mask),
+            3 * width + ((mixed >> 48) & mask),
+        )
+
+    def increment(self, key: Hashable) -> None:
+        counts = self._counts
+
+        for index in self._indexes(key):
+            if counts[index] < _SKETCH_MAX_COUNT:
+                counts[index] += 1
+
+        self._additions += 1
+
+        if self._additions >= self._sample_size:
+            counts[:] = counts.translate(_HALVED_COUNTS)
+            self._additions //= 2
+
+    def frequency(self, key: Hashable) -> int:
+        counts = self._counts
+        first, second, third, fourth = self._indexes(key)
+        return min(counts[first], counts[second], counts[third], counts[fourth])
+
+    def clear(self) -> None:
+        self._counts[:] = bytes(len(self._counts))
+        self._additions = 0
+
+
+class _TinyLFU:
+    """The W-TinyLFU eviction policy, tracking the keys of a cache in three segments.
+
+    New keys enter a small LRU window. Keys leaving the window are only admitted into
+    the main segments if looked up more often than the key they would evict, so keys
+    seen once, such as those of a bulk scan, cannot push out popular ones. The main
+    segments are a segmented LRU: keys hit again move from probation to protected.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_sketch",
+        "_window",
+        "_probation",
+        "_protected",
+        "_window_size",
+        "_main_size",
+        "_protected_size",
+    )
+
+    def __init__(self, max_size: int) -> None:
+        self._sketch: _FrequencySketch = _FrequencySketch(max_size)
+        self._window: OrderedDict[Hashable, None] = OrderedDict()
+        self._probation: OrderedDict[Hashable, None] = OrderedDict()
+        self._protected: OrderedDict[Hashable, None] = OrderedDict()
+        self._window_size: int = max(1, max_size // 100)
+        self._main_size: int = max_size - self._window_size
+        self._protected_size: int = self._main_size * 4 // 5
+
+    def record(self, key: Hashable) -> None:
+        self._sketch.increment(key)
+
+    def access(self, key: Hashable) -> None:
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+        elif key in self._probation:
+            del self._probation[key]
+            self._protected[key] = None
+
+            if len(self._protected) > self._protected_size:
+                demoted, _ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+
+    def insert(self, key: Hashable) -> Hashable | None:
+        """Track a new key, returning the key to evict, if any."""
+        self._window[key] = None
+
+        if len(self._window) <= self._window_size:
+            return None
+
+        candidate, _ = self._window.popitem(last=False)
+
+        if len(self._probation) + len(self._protected) < self._main_size:
+            self._probation[candidate] = None
+            return None
+
+        if not self._main_size:
+            return candidate
+
+        victims = self._probation if self._probation else self._protected
+        victim = next(iter(victims))
+
+        if self._sketch.frequency(candidate) <= self._sketch.frequency(victim):
+            return candidate
+
+        del victims[victim]
+        self._probation[candidate] = None
+        return victim
+
+    def discard(self, key: Hashable) -> None:
+        for segment in (self._window, self._probation, self._protected):
+            if key in segment:
+                del segment[key]
+                return
+
+    def clear(self) -> None:
+        self._window.clear()
+        self._probation.clear()
+        self._protected.clear()
+        self._sketch.clear()
+
+
+class ResponseCache:
+    """A bounded LRU cache of decoded responses with a time to live per endpoint.
+
+    Endpoints are named after the permission nodes guarding them, for example
+    `users`, `users.bans`, `guilds`, `ksoft.bans` and `urls`. An endpoint without a
+    time to live is not cached.
+
+    Lookups of resources that do not exist are cached separately, with a shorter time
+    to live, and answered by raising the `ravyapi.api.errors.NotFoundError` again.
+
+    With the `"tinylfu"` policy, a new response is only kept over the response it
+    would evict if requested more often, so a bulk scan of many resources looked up
+    once cannot flush the responses of live traffic.
+
+    With a `DiskCache`, responses are also written to disk, and lookups through
+    `lookup`, as made by `ravyapi.http.HTTPClient`, missing in memory are answered
+    from disk, so cached responses survive restarts.
+
+    Lookups through `lookup` can also be answered with a response expired within the grace window of its endpoint, while it
+    is refreshed once in the background (stale-while-revalidate). With `refresh_ahead`,
+    responses hit often are refreshed in the background before they expire.
+
+    Attributes
+    ----------
+    max_size : int
+        The maximum amount of cached responses.
+    ttls : Mapping[str, float]
+        The time to live, in seconds, of cached responses per endpoint.
+    negative_ttls : Mapping[str, float]
+        The time to live, in seconds, of cached 404 results per endpoint.
+    stale_ttls : Mapping[str, float]
+        The grace window, in seconds, in which expired responses are still served per
+        endpoint.
+    refresh_ahead : float | None
+        The fraction of the time to live after which responses hit often are refreshed,
+        or `None` if they are only refreshed once expired.
+    refresh_ahead_hits : int
+        The amount of hits after which a response is refreshed ahead of expiring.
+    policy : CachePolicy
+        How responses to evict are picked.
+    disk : DiskCache | None
+        The `DiskCache` behind the cache in memory, if persisting responses.
+    stats : CacheStats
+        Metrics describing the effectiveness of the cache.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_max_size",
+        "_ttls",
+        "_negative_ttls",
+        "_stale_ttls",
+        "_refresh_ahead",
+        "_refresh_ahead_hits",
+        "_policy",
+        "_tinylfu",
+        "_disk",
+        "_entries",
+        "_refreshing",
+        "_stats",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 4096,
+        ttls: Mapping[str, float] | None = None,
+        negative_ttls: Mapping[str, float] | None = None,
+        stale_ttls: Mapping[str, float] | None = None,
+        refresh_ahead: float | None = None,
+        refresh_ahead_hits: int = 2,
+        policy: CachePolicy = "lru",
+        disk: DiskCache | None = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        max_size : int
+            The maximum amount of cached responses.
+        ttls : Mapping[str, float] | None
+            Optional, the time to live, in seconds, of cached responses per endpoint.
+            A sub-endpoint such as `users.bans` falls back to its parent's time to live.
+            Defaults to `ravyapi.cache.DEFAULT_TTLS`.
+        negative_ttls : Mapping[str, float] | None
+            Optional, the time to live, in seconds, of cached 404 results per endpoint.
+            Defaults to `ravyapi.cache.DEFAULT_NEGATIVE_TTLS`.
+        stale_ttls : Mapping[str, float] | None
+            Optional, the grace window, in seconds, in which expired responses are
+            still served while refreshed in the background, per endpoint, for example
+            `{"urls": 60.0}`. Expired responses are not served by default.
+        refresh_ahead : float | None
+            Optional, the fraction of the time to live after which responses hit often
+            are refreshed in the background, for example `0.8`.
+        refresh_ahead_hits : int
+            The amount of hits after which a response is refreshed ahead of expiring.
+        policy : CachePolicy
+            How responses to evict are picked: `"lru"` evicts the least recently used,
+            while `"tinylfu"` also keeps responses requested often over new ones,
+            which protects them from bulk scans.
+        disk : DiskCache | None
+            Optional, the `ravyapi.cache.DiskCache` to persist responses in.
+        """
+        if max_size < 1:
+            raise ValueError('Parameter "max_size" must be at least 1')
+
+        if refresh_ahead is not None and not 0 < refresh_ahead < 1:
+            raise ValueError('Parameter "refresh_ahead" must be between 0 and 1')
+
+        if refresh_ahead_hits < 1:
+            raise ValueError('Parameter "refresh_ahead_hits" must be at least 1')
+
+        if policy not in _CACHE_POLICIES:
+            raise ValueError('Parameter "policy" must be either "lru" or "tinylfu"')
+
+        self._max_size: int = max_size
+        self._ttls: dict[str, float] = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self._negative_ttls: dict[str, float] = dict(
+            DEFAULT_NEGATIVE_TTLS if negative_ttls is None else negative_ttls
+        )
+        self._stale_ttls: dict[str, float] = dict(stale_ttls or {})
+        self._refresh_ahead: float | None = refresh_ahead
+        self._refresh_ahead_hits: int = refresh_ahead_hits
+        self._policy: CachePolicy = policy
+        self._tinylfu: _TinyLFU | None = (
+            _TinyLFU(max_size) if policy == "tinylfu" else None
+        )
+        self._disk: DiskCache | None = disk
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._refreshing: set[Hashable] = set()
+        self._stats: CacheStats = CacheStats()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(max_size={self.max_size!r}, ttls={self.ttls!r}, disk={self.disk!r}, "
+            f"stats={self.stats!r})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, route: str) -> float | None:
+        """Get the time to live of an endpoint.
+
+        Parameters
+        ----------
+        route : str
+            The name of the endpoint, for example `users.bans`.
+
+        Returns
+        -------
+        float | None
+            The time to live in seconds, or `None` if the endpoint is not cached.
+        """
+        return _lookup_ttl(self._ttls, route)
+
+    def negative_ttl_for(self, route: str) -> float | None:
+        """Get the time to live of 404 results of an endpoint.
+
+        Parameters
+        ----------
+        route : str
+            The name of the endpoint, for example `users.bans`.
+
+        Returns
+        -------
+        float | None
+            The time to live in seconds, or `None` if 404 results are not cached.
+        """
+        return _lookup_ttl(self._negative_ttls, route)
+
+    def caches(self, route: str) -> bool:
+        """Check whether responses or 404 results of an endpoint are cached.
+
+        Parameters
+        ----------
+        route : str
+            The name of the endpoint, for example `users.bans`.
+
+        Returns
+        -------
+        bool
+            Whether anything of the endpoint is cached.
+        """
+        return (
+            self.ttl_for(route) is not None or self.negative_ttl_for(route) is not None
+        )
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get a response cached in memory.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the request.
+
+        Raises
+        ------
+        NotFoundError
+            If the request is cached as not found.
+
+        Returns
+        -------
+        Any | None
+            The cached decoded response, or `None` if not cached or expired.
+        """
+        if self._tinylfu is not None:
+            self._tinylfu.record(key)
+
+        return self._answer(key, self._memory_entry(key, False), False)[0]
+
+    def peek(self, key: Hashable) -> Any | None:
+        """Get a response cached in memory without counting it as a hit or use.
+
+        Unlike `get`, the lookup is not counted in the stats, does not keep the response
+        from being evicted, and a request cached as not found is returned as `None`.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the request.
+
+        Returns
+        -------
+        Any | None
+            The cached decoded response, or `None` if not cached, expired or not found.
+        """
+        entry = self._entries.get(key)
+
+        if entry is None or entry.negative or entry.expires_at <= time.monotonic():
+            return None
+
+        return entry.value
+
+    async def lookup(self, key: Hashable) -> tuple[Any | None, bool]:
+        """Get a cached response, and whether the caller should refresh it in the background.
+
+        Unlike `get`, a response missing in memory is read from the `DiskCache`, if any,
+        and a response expired within the grace window of its endpoint is returned. A refresh is requested once for a stale response, or for a response
+        hit often once `refresh_ahead` of its time to live has passed, until the
+        response is cached again or `refresh_failed` is called.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the request.
+
+        Raises
+        ------
+        NotFoundError
+            If the request is cached as not found.
+
+        Returns
+        -------
+        tuple[Any | None, bool]
+            The cached decoded response, or `None` if not cached or expired beyond its
+            grace window, and whether to refresh it.
+        """
+        if self._tinylfu is not None:
+            self._tinylfu.record(key)
+
+        entry = self._memory_entry(key, True)
+
+        if entry is None and self._disk is not None:
+            loaded = await self._disk.load(key)
+
+            # Checked again, as the response may have been cached while reading the disk
+            entry = self._memory_entry(key, True)
+
+            if entry is None and loaded is not None:
+                entry = self._promote(key, loaded)
+
+        return self._answer(key, entry, True)
+
+    def refresh_failed(self, key: Hashable) -> None:
+        """Allow another background refresh of a response after one failed.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the request.
+        """
+        self._refreshing.discard(key)
+
+    def _memory_entry(self, key: Hashable, revalidate: bool) -> _CacheEntry | None:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        now = time.monotonic()
+
+        if entry.expires_at <= now:
+            if entry.stale_until <= now:
+                self._remove(key)
+                return None
+
+            if not revalidate:
+                # Kept for callers able to refresh it, but not served to others
+                return None
+
+        self._entries.move_to_end(key)
+
+        if self._tinylfu is not None:
+            self._tinylfu.access(key)
+
+        return entry
+
+    def _promote(self, key: Hashable, entry: _CacheEntry) -> _CacheEntry:
+        now = time.monotonic()
+        ttl = (
+            self.negative_ttl_for(entry.route)
+            if entry.negative
+            else self.ttl_for(entry.route)
+        )
+
+        # Kept in memory, and served stale, no longer than a response fetched now
+        if ttl is not None:
+            entry.expires_at = min(entry.expires_at, now + ttl)
+
+        stale_ttl = (
+            None if entry.negative else _lookup_ttl(self._stale_ttls, entry.route)
+        )
+        entry.stale_until = min(
+            entry.stale_until,
+            entry.expires_at + stale_ttl if stale_ttl is not None else entry.expires_at,
+        )
+
+        self._store(key, entry)
+        self._stats._disk_hits += 1
+        return entry
+
+    def _answer(
+        self, key: Hashable, entry: _CacheEntry | None, revalidate: bool
+    ) -> tuple[Any | None, bool]:
+        if entry is None:
+            self._stats._misses += 1
+            return None, False
+
+        if entry.negative:
+            self._stats._negative_hits += 1
+            raise NotFoundError(entry.value)
+
+        now = time.monotonic()
+        self._stats._hits += 1
+        entry.hits += 1
+        stale = entry.expires_at <= now
+
+        if stale:
+            self._stats._stale_hits += 1
+
+        refresh = (
+            revalidate
+            and key not in self._refreshing
+            and (
+                stale
+                or (entry.refresh_at <= now and entry.hits >= self._refresh_ahead_hits)
+            )
+        )
+
+        if refresh:
+            self._refreshing.add(key)
+            self._stats._refreshes += 1
+
+        return entry.value, refresh
+
+    def set(
+        self, key: Hashable, value: Any, route: str, resource: str | None = None
+    ) -> None:
+        """Cache a response, if its endpoint has a time to live.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the request.
+        value : Any
+            The decoded response.
+        route : str
+            The name of the endpoint, for example `users.bans`.
+        resource : str | None
+            Optional, the ID or URL the response describes, used for invalidation.
+        """
+        ttl = self.ttl_for(route)
+
+        if ttl is not None:
+            now = time.monotonic()
+            entry = _CacheEntry(value, route, resource, now + ttl)
+            stale_ttl = _lookup_ttl(self._stale_ttls, route)
+
+            if stale_ttl is not None:
+                entry.stale_until = entry.expires_at + stale_ttl
+
+            if self._refresh_ahead is not None:
+                entry.refresh_at = now + ttl * self._refresh_ahead
+
+            self._store(key, entry)
+
+            if self._disk is not None:
+                self._disk.save(key, value, route, resource, ttl, False)
+
+    def set_not_found(
+        self,
+        key: Hashable,
+        error: NotFoundError,
+        route: str,
+        resource: str | None = None,
+    ) -> None:
+        """Cache a 404 result, if its endpoint has a time to live for them.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the request.
+        error : NotFoundError
+            The error raised for the request.
+        route : str
+            The name of the endpoint, for example `users.bans`.
+        resource : str | None
+            Optional, the ID or URL the result describes, used for invalidation.
+        """
+        ttl = self.negative_ttl_for(route)
+
+        if ttl is not None:
+            self._store(
+                key,
+                _CacheEntry(
+                    error.exc_data, route, resource, time.monotonic() + ttl, True
+                ),
+            )
+
+            if self._disk is not None:
+                self._disk.save(key, error.exc_data, route, resource, ttl, True)
+
+    def _store(self, key: Hashable, entry: _CacheEntry) -> None:
+        self._refreshing.discard(key)
+
+        if self._tinylfu is not None:
+            if key in self._entries:
+                self._tinylfu.access(key)
+                evicted = None
+            else:
+                evicted = self._tinylfu.insert(key)
+
+            self._entries[key] = entry
+
+            if evicted is not None:
+                del self._entries[evicted]
+                self._stats._evictions += 1
+        else:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._stats._evictions += 1
+
+        self._stats._size = len(self._entries)
+
+    def _remove(self, key: Hashable) -> None:
+        del self._entries[key]
+
+        if self._tinylfu is not None:
+            self._tinylfu.discard(key)
+
+        self._stats._size = len(self._entries)
+
+    async def invalidate(
+        self, route: str | None = None, resource: int | str | None = None
+    ) -> int:
+        """Remove cached responses, including those on disk.
+
+        Parameters
+        ----------
+        route : str | None
+            Optional, the endpoint to remove responses of, including its sub-endpoints.
+            For example, `users` also removes `users.bans` responses.
+        resource : int | str | None
+            Optional, the ID or URL to remove responses for.
+
+        Returns
+        -------
+        int
+            The amount of removed responses.
+        """
+        resource = str(resource) if resource is not None else None
+
+        if route is None and resource is None:
+            removed = len(self._entries)
+            self._clear_memory()
+        else:
+            prefix = f"{route}." if route is not None else ""
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if (
+                    route is None
+                    or entry.route == route
+                    or entry.route.startswith(prefix)
+                )
+                and (resource is None or entry.resource == resource)
+            ]
+
+            for key in keys:
+                self._remove(key)
+
+            removed = len(keys)
+
+        if self._disk is not None:
+            # Responses are written through, so those on disk include those in memory
+            removed = max(removed, await self._disk.delete(route, resource))
+
+        _LOGGER.debug("Invalidated %s cached responses", removed)
+        return removed
+
+    def clear(self) -> None:
+        """Remove all cached responses, including those on disk unless it is closed."""
+        self._clear_memory()
+
+        if self._disk is not None:
+            self._disk.clear()
+
+    def _clear_memory(self) -> None:
+        self._entries.clear()
+        self._refreshing.clear()
+
+        if self._tinylfu is not None:
+            self._tinylfu.clear()
+
+        self._stats._size = 0
+
+    def close(self) -> None:
+        """Close the `DiskCache`, if any, writing the responses pending for it.
+
+        Responses in memory are kept, but are no longer persisted.
+        """
+        if self._disk is not None:
+            self._disk.close()
+
+    @property
+    def max_size(self) -> int:
+        """The maximum amount of cached responses."""
+        return self._max_size
+
+    @property
+    def ttls(self) -> Mapping[str, float]:
+        """The time to live, in seconds, of cached responses per endpoint."""
+        return self._ttls
+
+    @property
+    def negative_ttls(self) -> Mapping[str, float]:
+        """The time to live, in seconds, of cached 404 results per endpoint."""
+        return self._negative_ttls
+
+    @property
+    def stale_ttls(self) -> Mapping[str, float]:
+        """The grace window, in seconds, in which expired responses are still served per endpoint."""
+        return self._stale_ttls
+
+    @property
+    def refresh_ahead(self) -> float | None:
+        """The fraction of the time to live after which responses hit often are refreshed."""
+        return self._refresh_ahead
+
+    @property
+    def refresh_ahead_hits(self) -> int:
+        """The amount of hits after which a response is refreshed ahead of expiring."""
+        return self._refresh_ahead_hits
+
+    @property
+    def policy(self) -> CachePolicy:
+        """How responses to evict are picked."""
+        return self._policy
+
+    @property
+    def disk(self) -> DiskCache | None:
+        """The `DiskCache` behind the cache in memory, if persisting responses."""
+        return self._disk
+
+    @property
+    def stats(self) -> CacheStats:
+        """Metrics describing the effectiveness of the cache."""
+        return self._stats
+
+
+class DiskCache:
+    """A persistent cache of decoded responses in an SQLite database.
+
+    Used as the second tier of a `ResponseCache`, which writes responses through to it
+    and answers lookups missing in memory from it, so cached responses survive
+    restarts and are shared by processes using the same database. Responses are
+    stored as JSON, compressed with zlib unless small, and keyed by a digest of the
+    request, so tokens in its parameters never reach the disk.
+
+    While an event loop is running, the database is read and written in a thread, so
+    the loop is never blocked on the disk, and responses saved while a write is in
+    progress are written together in the next transaction, instead of committing
+    every response on its own. Only one thread uses the database at a time.
+
+    Expired responses are removed and the database is shrunk by `compact`, which runs
+    in the background every `compaction_interval` seconds while an event loop is
+    running. `close` writes the pending responses and closes the database, after which
+    the cache is empty and `clear` and `compact` do nothing.
+
+    Attributes
+    ----------
+    path : str
+        The path of the SQLite database.
+    max_size : int
+        The maximum amount of responses kept on compaction.
+    ttls : Mapping[str, float] | None
+        The time to live, in seconds, of responses on disk per endpoint, or `None` to
+        use those of the `ResponseCache`.
+    negative_ttls : Mapping[str, float] | None
+        The time to live, in seconds, of 404 results on disk per endpoint, or `None` to
+        use those of the `ResponseCache`.
+    compaction_interval : float | None
+        The interval, in seconds, between background compactions, or `None` if they
+        are disabled.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_path",
+        "_max_size",
+        "_ttls",
+        "_negative_ttls",
+        "_compaction_interval",
+        "_connection",
+        "_lock",
+        "_compaction",
+        "_pending",
+        "_writer",
+        "_batches",
+        "_written",
+        "_closed",
+    )
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_size: int = 100_000,
+        ttls: Mapping[str, float] | None = None,
+        negative_ttls: Mapping[str, float] | None = None,
+        compaction_interval: float | None = 300.0,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        path : str | os.PathLike[str]
+            The path of the SQLite database, created if it does not exist.
+        max_size : int
+            The maximum amount of responses kept on compaction.
+        ttls : Mapping[str, float] | None
+            Optional, the time to live, in seconds, of responses on disk per endpoint.
+            Defaults to those of the `ResponseCache`.
+        negative_ttls : Mapping[str, float] | None
+            Optional, the time to live, in seconds, of 404 results on disk per
+            endpoint. Defaults to those of the `ResponseCache`.
+        compaction_interval : float | None
+            The interval, in seconds, between background compactions, or `None` to
+            only compact when `compact` is called.
+        """
+        if max_size < 1:
+            raise ValueError('Parameter "max_size" must be at least 1')
+
+        if compaction_interval is not None and compaction_interval <= 0:
+            raise ValueError('Parameter "compaction_interval" must be positive')
+
+        self._path: str = os.fspath(path)
+        self._max_size: int = max_size
+        self._ttls: dict[str, float] | None = dict(ttls) if ttls is not None else None
+        self._negative_ttls: dict[str, float] | None = (
+            dict(negative_ttls) if negative_ttls is not None else None
+        )
+        self._compaction_interval: float | None = compaction_interval
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            self._path, check_same_thread=False
+        )
+        # Held by the one thread using the connection at a time
+        self._lock: threading.Lock = threading.Lock()
+        self._compaction: asyncio.Task[None] | None = None
+        self._pending: dict[str, tuple[Any, ...]] = {}
+        self._writer: asyncio.Task[None] | None = None
+        self._batches: int = 0
+        self._written: int = 0
+        self._closed: bool = False
+
+        for statement in _SCHEMA:
+            self._connection.execute(statement)
+
+        self._connection.commit()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(path={self.path!r}, max_size={self.max_size!r}, size={len(self)!r})"
+        )
+
+    def __len__(self) -> int:
+        self._flush()
+
+        with self._lock:
+            if self._closed:
+                return 0
+
+            (size,) = self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()
+
+        return int(size)
+
+    async def load(self, key: Hashable) -> _CacheEntry | None:
+        """Internal method to read a response from disk in a thread.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the request.
+
+        Returns
+        -------
+        _CacheEntry | None
+            The response, or `None` if not on disk or expired.
+        """
+        if self._closed:
+            return None
+
+        self._schedule_compaction()
+        disk_key = _disk_key(key)
+        pending = self._pending.get(disk_key)
+
+        if pending is not None:
+            return _decode_row(pending[1:])
+
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._read, disk_key
+        )
+
+    def _read(self, disk_key: str) -> _CacheEntry | None:
+        with self._lock:
+            if self._closed:
+                return None
+
+            row = self._connection.execute(
+                "SELECT route, resource, expires_at, negative, compressed, value "
+                "FROM responses WHERE key = ?",
+                (disk_key,),
+            ).fetchone()
+
+        return _decode_row(row) if row is not None else None
+
+    def save(
+        self,
+        key: Hashable,
+        value: Any,
+        route: str,
+        resource: str | None,
+        ttl: float,
+        negative: bool,
+    ) -> None:
+        """Internal method to queue a response to be written to disk.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the request.
+        value : Any
+            The decoded response.
+        route : str
+            The name of the endpoint, for example `users.bans`.
+        resource : str | None
+            The ID or URL the response describes, used for invalidation.
+        ttl : float
+            The time to live of the response in the `ResponseCache`.
+        negative : bool
+            Whether the response is a 404 result.
+        """
+        ttls = self._negative_ttls if negative else self._ttls
+        disk_ttl = _lookup_ttl(ttls, route) if ttls is not None else ttl
+
+        if disk_ttl is None or self._closed:
+            return
+
+        try:
+            encoded = default_json_dumps(value)
+        except (TypeError, ValueError) as exc:
+            _LOGGER.debug("Not caching response to %s on disk: %r", route, exc)
+            return
+
+        body = encoded.encode() if isinstance(encoded, str) else encoded
+        compressed = len(body) >= _COMPRESSION_THRESHOLD
+
+        if compressed:
+            body = zlib.compress(body, 1)
+
+        disk_key = _disk_key(key)
+        self._pending[disk_key] = (
+            disk_key,
+            route,
+            resource,
+            time.time() + disk_ttl,
+            negative,
+            compressed,
+            body,
+        )
+        self._schedule_flush()
+        self._schedule_compaction()
+
+    def _schedule_flush(self) -> None:
+        if self._writer is not None and not self._writer.done():
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Not running in an event loop, so there is nothing to batch with
+            self._flush()
+            return
+
+        self._writer = loop.create_task(self._write_pending())
+
+    async def _write_pending(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        # Responses stay pending until written, so lookups meanwhile still find them
+        while self._pending and not self._closed:
+            rows = dict(self._pending)
+            self._batches += 1
+            await loop.run_in_executor(
+                None, self._write, list(rows.values()), self._batches
+            )
+
+            for disk_key, row in rows.items():
+                if self._pending.get(disk_key) is row:
+                    del self._pending[disk_key]
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+
+        rows = list(self._pending.values())
+        self._pending.clear()
+        self._batches += 1
+        self._write(rows, self._batches)
+
+    def _write(self, rows: list[tuple[Any, ...]], batch: int) -> None:
+        with self._lock:
+            # Batches include every response still pending, so a later batch written
+            # first holds the newest of the responses in this one
+            if self._closed or batch <= self._written:
+                return
+
+            self._written = batch
+
+            try:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._connection.commit()
+            except Exception:
+                _LOGGER.exception("Failed to write %s responses to disk", len(rows))
+
+    async def _wait_for_writes(self) -> None:
+        if self._pending:
+            self._schedule_flush()
+
+        while self._writer is not None and not self._writer.done():
+            await asyncio.shield(self._writer)
+
+    async def delete(self, route: str | None, resource: str | None) -> int:
+        """Internal method to remove responses from disk in a thread.
+
+        Parameters
+        ----------
+        route : str | None
+            The endpoint to remove responses of, including its sub-endpoints.
+        resource : str | None
+            The ID or URL to remove responses for.
+
+        Returns
+        -------
+        int
+            The amount of removed responses.
+        """
+        if self._closed:
+            return 0
+
+        await self._wait_for_writes()
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._delete, route, resource
+        )
+
+    def _delete(self, route: str | None, resource: str | None) -> int:
+        clauses: list[str] = []
+        params: list[Any] = []
+
+        if route is not None:
+            prefix = f"{route}."
+            clauses.append("(route = ? OR substr(route, 1, ?) = ?)")
+            params.extend((route, len(prefix), prefix))
+
+        if resource is not None:
+            clauses.append("resource = ?")
+            params.append(resource)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            if self._closed:
+                return 0
+
+            removed: int = self._connection.execute(
+                f"DELETE FROM responses{where}", params
+            ).rowcount
+            self._connection.commit()
+
+        return removed
+
+    def _schedule_compaction(self) -> None:
+        if self._compaction_interval is None or (
+            self._compaction is not None and not self._compaction.done()
+        ):
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Not running in an event loop; compacted when `compact` is called
+            return
+
+        self._compaction = loop.create_task(self._compact_periodically())
+
+    async def _compact_periodically(self) -> None:
+        assert self._compaction_interval is not None
+        loop = asyncio.get_running_loop()
+
+        while True:
+            await asyncio.sleep(self._compaction_interval)
+
+            try:
+                await self._wait_for_writes()
+                await loop.run_in_executor(None, self._compact)
+            except Exception:
+                _LOGGER.exception("Failed to compact the cache on disk")
+
+    def compact(self) -> int:
+        """Remove expired responses and the oldest beyond the maximum size, then shrink the database.
+
+        Unlike the compactions in the background, this blocks on the disk.
+
+        Returns
+        -------
+        int
+            The amount of removed responses, or `0` if the cache is closed.
+        """
+        self._flush()
+        return self._compact()
+
+    def _compact(self) -> int:
+        with self._lock:
+            if self._closed:
+                return 0
+
+            removed: int = self._connection.execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+            removed += self._connection.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY expires_at "
+                "LIMIT max(0, (SELECT COUNT(*) FROM responses) - ?))",
+                (self._max_size,),
+            ).rowcount
+            self._connection.commit()
+            self._connection.execute("PRAGMA incremental_vacuum")
+            self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+        _LOGGER.debug("Compacted %s responses cached on disk", removed)
+        return removed
+
+    def clear(self) -> None:
+        """Remove all responses, unless the cache is closed."""
+        self._pending.clear()
+
+        with self._lock:
+            if self._closed:
+                return
+
+            # Batches being written hold cleared responses, so they are skipped
+            self._written = self._batches
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Write the pending responses, stop compacting in the background and close the database.
+
+        Lookups miss and responses are no longer saved once the cache is closed.
+        """
+        if self._closed:
+            return
+
+        self._flush()
+
+        with self._lock:
+            self._closed = True
+            self._connection.close()
+
+        for task in (self._compaction, self._writer):
+            if task is not None:
+                task.cancel()
+
+        self._compaction = None
+        self._writer = None
+
+    @property
+    def path(self) -> str:
+        """The path of the SQLite database."""
+        return self._path
+
+    @property
+    def max_size(self) -> int:
+        """The maximum amount of responses kept on compaction."""
+        return self._max_size
+
+    @property
+    def ttls(self) -> Mapping[str, float] | None:
+        """The time to live, in seconds, of responses on disk per endpoint, or `None` to use those of the `ResponseCache`."""
+        return self._ttls
+
+    @property
+    def negative_ttls(self) -> Mapping[str, float] | None:
+        """The time to live, in seconds, of 404 results on disk per endpoint, or `None` to use those of the `ResponseCache`."""
+        return self._negative_ttls
+
+    @property
+    def compaction_interval(self) -> float | None:
+        """The interval, in seconds, between background compactions, or `None` if they are disabled."""
+        return self._compaction_interval
+
+
+def _decode_row(row: tuple[Any, ...]) -> _CacheEntry | None:
+    route, resource, expires_at, negative, compressed, value = row
+    remaining = expires_at - time.time()
+
+    if remaining <= 0:
+        return None
+
+    try:
+        decoded = default_json_loads(zlib.decompress(value) if compressed else value)
+    except (zlib.error, ValueError) as exc:
+        _LOGGER.warning("Ignoring corrupt cached response on disk: %r", exc)
+        return None
+
+    # Stored in wall clock time, which unlike monotonic time carries over restarts
+    return _CacheEntry(
+        decoded, route, resource, time.monotonic() + remaining, bool(negative)
+    )
+
+
+class AvatarCache:
+    """A bounded LRU cache of avatar check verdicts.
+
+    Verdicts are keyed by the avatar, for uploads a digest of the image bytes, together
+    with the threshold and method of the check, so a repeated avatar is not uploaded
+    again.
+
+    Attributes
+    ----------
+    max_size : int
+        The maximum amount of cached verdicts.
+    ttl : float | None
+        The time to live, in seconds, of cached verdicts.
+    stats : CacheStats
+        Metrics describing the effectiveness of the cache.
+    """
+
+    __slots__: tuple[str, ...] = ("_ttl", "_cache")
+
+    def __init__(self, *, max_size: int = 4096, ttl: float | None = 600.0) -> None:
+        """
+        Parameters
+        ----------
+        max_size : int
+            The maximum amount of cached verdicts.
+        ttl : float | None
+            The time to live, in seconds, of cached verdicts, or `None` to keep them
+            until they are evicted.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError('Parameter "ttl" must be positive')
+
+        self._ttl: float | None = ttl
+        self._cache: ResponseCache = ResponseCache(
+            max_size=max_size,
+            ttls={"avatars": ttl if ttl is not None else float("inf")},
+            negative_ttls={},
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(max_size={self.max_size!r}, ttl={self.ttl!r}, stats={self.stats!r})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @staticmethod
+    def digest(avatar: bytes | bytearray | memoryview) -> str:
+        """Get the key of an uploaded avatar, a BLAKE2b digest of its bytes.
+
+        Parameters
+        ----------
+        avatar : bytes | bytearray | memoryview
+            The image bytes of the avatar.
+
+        Returns
+        -------
+        str
+            The hexadecimal digest.
+        """
+        return hashlib.blake2b(avatar, digest_size=16).hexdigest()
+
+    @staticmethod
+    def digest_file(path: str | os.PathLike[str]) -> str:
+        """Get the key of an avatar uploaded from a file, reading it in chunks.
+
+        This blocks while the file is read, so it should be run in an executor.
+
+        Parameters
+        ----------
+        path : str | os.PathLike[str]
+            The path of the image file of the avatar.
+
+        Returns
+        -------
+        str
+            The hexadecimal digest.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+
+        with open(path, "rb") as file:
+            while chunk := file.read(_DIGEST_CHUNK_SIZE):
+                digest.update(chunk)
+
+        return digest.hexdigest()
+
+    def get(self, key: str, threshold: float, method: str) -> Any | None:
+        """Get a cached verdict.
+
+        Parameters
+        ----------
+        key : str
+            The key of the avatar.
+        threshold : float
+            The threshold of the check.
+        method : str
+            The method of the check.
+
+        Returns
+        -------
+        Any | None
+            The cached decoded response, or `None` if not cached or expired.
+        """
+        return self._cache.get((key, threshold, method))
+
+    def set(self, key: str, threshold: float, method: str, value: Any) -> None:
+        """Cache a verdict.
+
+        Parameters
+        ----------
+        key : str
+            The key of the avatar.
+        threshold : float
+            The threshold of the check.
+        method : str
+            The method of the check.
+        value : Any
+            The decoded response.
+        """
+        self._cache.set((key, threshold, method), value, "avatars", key)
+
+    def clear(self) -> None:
+        """Remove all cached verdicts."""
+        self._cache.clear()
+
+    @property
+    def max_size(self) -> int:
+        """The maximum amount of cached verdicts."""
+        return self._cache.max_size
+
+    @property
+    def ttl(self) -> float | None:
+        """The time to live, in seconds, of cached verdicts."""
+        return self._ttl
+
+    @property
+    def stats(self) -> CacheStats:
+        """Metrics describing the effectiveness of the cache."""
+        return self._cache.stats
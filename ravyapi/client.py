@@ -17,12 +17,21 @@ from __future__ import annotations
 
 __all__: tuple[str, ...] = ("Client",)
 
+import asyncio
 import logging
+from types import TracebackType
+from typing import Awaitable
 
 from typing_extensions import Final
 
 from ravyapi.api.endpoints import Avatars, Guilds, KSoft, Tokens, URLs, Users
+from ravyapi.backends import CacheBackend
+from ravyapi.cache import AvatarCache, ResponseCache
+from ravyapi.connections import ConnectionPool, ConnectionStats
+from ravyapi.data_binding import JSONDumps, JSONLoads, ResponseMode
 from ravyapi.http import HTTPClient
+from ravyapi.ratelimits import RateLimiter
+from ravyapi.retries import RetryPolicy
 
 _LOGGER: Final[logging.Logger] = logging.getLogger("ravyapi.client")
 
@@ -46,6 +55,24 @@ class Client:
         The `urls` endpoint.
     tokens : Tokens
         The `tokens` endpoint.
+    rate_limiter : RateLimiter
+        The `ravyapi.ratelimits.RateLimiter` scheduling requests.
+    retry_policy : RetryPolicy
+        The `ravyapi.retries.RetryPolicy` retrying failed requests.
+    connection_stats : ConnectionStats
+        A snapshot of the state of the connection pool.
+    coalesced_requests : int
+        The amount of GET requests that shared an identical in-flight request.
+    derived_requests : int
+        The amount of GET requests for parts of users answered from the whole user.
+    cache : ResponseCache | None
+        The `ravyapi.cache.ResponseCache` of responses, if caching.
+    avatar_cache : AvatarCache | None
+        The `ravyapi.cache.AvatarCache` of avatar check verdicts, if caching.
+    cache_backend : CacheBackend | None
+        The `ravyapi.backends.CacheBackend` sharing responses, if any.
+    response_mode : ResponseMode
+        What endpoints return by default: a model, the decoded JSON, or the body.
     """
 
     __slots__: tuple[str, ...] = (
@@ -60,15 +87,110 @@ class Client:
         "_tokens",
     )
 
-    def __init__(self, token: str) -> None:
+    def __init__(
+        self,
+        token: str,
+        *,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        connection_pool: ConnectionPool | None = None,
+        cache: ResponseCache | None = None,
+        avatar_cache: AvatarCache | None = None,
+        cache_backend: CacheBackend | None = None,
+        json_loads: JSONLoads | None = None,
+        json_dumps: JSONDumps | None = None,
+        permissions_ttl: float | None = None,
+        lazy_models: bool = False,
+        compact_models: bool = False,
+        response_mode: ResponseMode = "model",
+        upgrade_window: float = 0.0,
+    ) -> None:
         """
         Parameters
         ----------
         token : str
             The token used to authenticate with the API.
+        rate_limiter : RateLimiter | None
+            Optional, the `ravyapi.ratelimits.RateLimiter` used to schedule requests.
+            Defaults to one that only follows the rate limits reported by the API.
+        retry_policy : RetryPolicy | None
+            Optional, the `ravyapi.retries.RetryPolicy` used to retry failed requests.
+        connection_pool : ConnectionPool | None
+            Optional, the `ravyapi.connections.ConnectionPool` settings for connections.
+        cache : ResponseCache | None
+            Optional, the `ravyapi.cache.ResponseCache` to cache responses in.
+            Responses are not cached by default. Its `ravyapi.cache.DiskCache`, if any,
+            is closed with the client.
+        avatar_cache : AvatarCache | None
+            Optional, the `ravyapi.cache.AvatarCache` to cache avatar check verdicts in.
+            Verdicts are not cached by default.
+        cache_backend : CacheBackend | None
+            Optional, the `ravyapi.backends.CacheBackend` to share responses through,
+            for example a `ravyapi.backends.RedisBackend` used by many processes.
+            Responses are shared for as long as `cache` would keep them, and
+            responses to requests with parameters other than the URL are not shared.
+            The backend is closed with the client.
+        json_loads : JSONLoads | None
+            Optional, the callable decoding JSON response bodies from bytes.
+            Defaults to `orjson.loads` if installed, else `json.loads`.
+        json_dumps : JSONDumps | None
+            Optional, the callable encoding JSON request bodies to bytes or a string.
+            Defaults to `orjson.dumps` if installed, else `json.dumps`.
+        permissions_ttl : float | None
+            Optional, how many seconds the token's permissions are used before they are
+            refreshed in the background. By default, they are fetched only once.
+        lazy_models : bool
+            Whether to build nested models of responses, such as the bans of
+            `ravyapi.api.models.users.GetUserResponse`, when first accessed.
+            By default, they are built with the response.
+        compact_models : bool
+            Whether models drop the raw data of responses, rebuilding it from their
+            fields when `data` is accessed, which saves memory when many are kept.
+            The rebuilt `data` only holds the keys the models know about, so any keys
+            the API adds that the library does not model yet are lost.
+            Cannot be combined with `lazy_models`.
+        response_mode : ResponseMode
+            What endpoints return unless told otherwise with their `mode` parameter:
+            `"model"` for models, `"json"` for the decoded JSON, or `"bytes"` for the
+            undecoded response body, which skips decoding for services forwarding it.
+            Endpoints called without `mode` are still typed as returning models, so
+            pass `mode` explicitly for precise types when changing this.
+        upgrade_window : float
+            How many seconds requests for parts of a user, such as its bans and
+            whitelists, are collected for before being upgraded to one
+            `ravyapi.api.endpoints.users.Users.get_user` request if there are several.
+            Defaults to `0.0`, which disables upgrading; parts are still taken from a
+            user already cached or requested.
+
+        Raises
+        ------
+        ValueError
+            If both `lazy_models` and `compact_models` are set, or `response_mode` is
+            not one of `ravyapi.data_binding.ResponseMode`, or `upgrade_window` is
+            negative.
         """
+        if lazy_models and compact_models:
+            raise ValueError(
+                'Parameters "lazy_models" and "compact_models" are mutually exclusive'
+            )
+
         self._token: str = token
-        self._http: HTTPClient = HTTPClient(self._token)
+        self._http: HTTPClient = HTTPClient(
+            self._token,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            connection_pool=connection_pool,
+            cache=cache,
+            avatar_cache=avatar_cache,
+            cache_backend=cache_backend,
+            json_loads=json_loads,
+            json_dumps=json_dumps,
+            permissions_ttl=permissions_ttl,
+            lazy_models=lazy_models,
+            compact_models=compact_models,
+            response_mode=response_mode,
+            upgrade_window=upgrade_window,
+        )
         self._closed: bool = False
         self._avatars: Avatars = Avatars(self._http)
         self._guilds: Guilds = Guilds(self._http)
@@ -77,8 +199,73 @@ class Client:
         self._urls: URLs = URLs(self._http)
         self._tokens: Tokens = Tokens(self._http)
 
+    async def __aenter__(self) -> Client:
+        await self._http.open()
+        self._closed = False
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def start(self, *, connections: int = 1, permissions: bool = True) -> Client:
+        """Starts the client, preparing it for requests before traffic arrives.
+
+        The underlying HTTP client is opened in the running event loop. Otherwise, it is
+        opened lazily on the first request.
+
+        Parameters
+        ----------
+        connections : int
+            How many connections to the API to open ahead of time.
+        permissions : bool
+            Whether to fetch the permissions of the token ahead of time.
+            This uses one of the opened connections.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+
+        Returns
+        -------
+        Client
+            The started client.
+        """
+        if not isinstance(connections, int):
+            raise TypeError('Parameter "connections" must be of type "int"')
+
+        if connections < 0:
+            raise ValueError('Parameter "connections" must not be negative')
+
+        if not isinstance(permissions, bool):
+            raise TypeError('Parameter "permissions" must be of type "bool"')
+
+        await self._http.open()
+        self._closed = False
+
+        awaitables: list[Awaitable[None]] = []
+
+        if permissions:
+            awaitables.append(self._http.get_permissions())
+            connections -= 1
+
+        if connections > 0:
+            awaitables.append(self._http.warmup(connections))
+
+        await asyncio.gather(*awaitables)
+
+        _LOGGER.info("Client is successfully started")
+        return self
+
     async def close(self) -> None:
-        """Closes the client, shutting down the underlying HTTP client."""
+        """Closes the client, shutting down the underlying HTTP client and caches."""
         await self._http.close()
         self._closed = True
 
@@ -134,3 +321,48 @@ class Client:
     def tokens(self) -> Tokens:
         """The `tokens` endpoint."""
         return self._tokens
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """The `ravyapi.ratelimits.RateLimiter` scheduling requests."""
+        return self._http.rate_limiter
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """The `ravyapi.retries.RetryPolicy` retrying failed requests."""
+        return self._http.retry_policy
+
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """A snapshot of the state of the connection pool."""
+        return self._http.connection_stats
+
+    @property
+    def coalesced_requests(self) -> int:
+        """The amount of GET requests that shared an identical in-flight request."""
+        return self._http.coalesced
+
+    @property
+    def derived_requests(self) -> int:
+        """The amount of GET requests for parts of users answered from the whole user."""
+        return self._http.derived
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """The `ravyapi.cache.ResponseCache` of responses, if caching."""
+        return self._http.cache
+
+    @property
+    def avatar_cache(self) -> AvatarCache | None:
+        """The `ravyapi.cache.AvatarCache` of avatar check verdicts, if caching."""
+        return self._http.avatar_cache
+
+    @property
+    def cache_backend(self) -> CacheBackend | None:
+        """The `ravyapi.backends.CacheBackend` sharing responses, if any."""
+        return self._http.cache_backend
+
+    @property
+    def response_mode(self) -> ResponseMode:
+        """What endpoints return by default: a model, the decoded JSON, or the body."""
+        return self._http.response_mode
@@ -0,0 +1,252 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Connection pooling for the underlying aiohttp client."""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = ("ConnectionPool", "ConnectionStats")
+
+import logging
+from typing import Any
+
+import aiohttp
+from aiohttp.abc import AbstractResolver
+from typing_extensions import Final
+
+_LOGGER: Final[logging.Logger] = logging.getLogger("ravyapi.connections")
+
+
+class ConnectionStats:
+    """A snapshot of the state of the connection pool.
+
+    Attributes
+    ----------
+    open : int
+        The amount of open connections, both idle and acquired.
+    idle : int
+        The amount of open connections waiting in the pool to be reused.
+    acquired : int
+        The amount of connections currently in use by a request.
+    created : int
+        The amount of connections created since the pool was opened.
+    reused : int
+        The amount of times a pooled connection was reused by a request.
+    reuse_ratio : float
+        The ratio of requests that reused a pooled connection, between 0 and 1.
+    """
+
+    __slots__: tuple[str, ...] = ("_idle", "_acquired", "_created", "_reused")
+
+    def __init__(self, idle: int, acquired: int, created: int, reused: int) -> None:
+        self._idle: int = idle
+        self._acquired: int = acquired
+        self._created: int = created
+        self._reused: int = reused
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(open={self.open!r}, idle={self.idle!r}, acquired={self.acquired!r}, "
+            f"created={self.created!r}, reused={self.reused!r}, "
+            f"reuse_ratio={self.reuse_ratio!r})"
+        )
+
+    @property
+    def open(self) -> int:
+        """The amount of open connections, both idle and acquired."""
+        return self._idle + self._acquired
+
+    @property
+    def idle(self) -> int:
+        """The amount of open connections waiting in the pool to be reused."""
+        return self._idle
+
+    @property
+    def acquired(self) -> int:
+        """The amount of connections currently in use by a request."""
+        return self._acquired
+
+    @property
+    def created(self) -> int:
+        """The amount of connections created since the pool was opened."""
+        return self._created
+
+    @property
+    def reused(self) -> int:
+        """The amount of times a pooled connection was reused by a request."""
+        return self._reused
+
+    @property
+    def reuse_ratio(self) -> float:
+        """The ratio of requests that reused a pooled connection, between 0 and 1."""
+        total = self._created + self._reused
+        return self._reused / total if total else 0.0
+
+
+class ConnectionPool:
+    """Settings for the pool of connections the client keeps to the Ravy API.
+
+    Attributes
+    ----------
+    limit : int
+        The maximum amount of simultaneous connections, or 0 for no limit.
+    limit_per_host : int
+        The maximum amount of simultaneous connections to one host, or 0 for no limit.
+    dns_cache_ttl : int | None
+        How many seconds resolved addresses are cached, or `None` to cache forever.
+    keepalive_timeout : float
+        How many seconds an idle connection is kept open to be reused.
+    stats : ConnectionStats
+        A snapshot of the state of the connection pool.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_limit",
+        "_limit_per_host",
+        "_dns_cache_ttl",
+        "_keepalive_timeout",
+        "_resolver",
+        "_async_resolver",
+        "_connector",
+        "_created",
+        "_reused",
+    )
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        dns_cache_ttl: int | None = 300,
+        keepalive_timeout: float = 30.0,
+        resolver: AbstractResolver | None = None,
+        async_resolver: bool = False,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        limit : int
+            The maximum amount of simultaneous connections, or 0 for no limit.
+        limit_per_host : int
+            The maximum amount of simultaneous connections to one host, or 0 for no limit.
+        dns_cache_ttl : int | None
+            How many seconds resolved addresses are cached, or `None` to cache forever.
+        keepalive_timeout : float
+            How many seconds an idle connection is kept open to be reused.
+        resolver : AbstractResolver | None
+            Optional, the resolver used to look up hosts.
+        async_resolver : bool
+            Whether to use `aiohttp.AsyncResolver` if `resolver` is not given.
+            This requires `aiodns` to be installed.
+        """
+        if limit < 0 or limit_per_host < 0:
+            raise ValueError(
+                'Parameters "limit" and "limit_per_host" must not be negative'
+            )
+
+        if keepalive_timeout < 0:
+            raise ValueError('Parameter "keepalive_timeout" must not be negative')
+
+        self._limit: int = limit
+        self._limit_per_host: int = limit_per_host
+        self._dns_cache_ttl: int | None = dns_cache_ttl
+        self._keepalive_timeout: float = keepalive_timeout
+        self._resolver: AbstractResolver | None = resolver
+        self._async_resolver: bool = async_resolver
+        self._connector: aiohttp.TCPConnector | None = None
+        self._created: int = 0
+        self._reused: int = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(limit={self.limit!r}, limit_per_host={self.limit_per_host!r}, "
+            f"dns_cache_ttl={self.dns_cache_ttl!r}, "
+            f"keepalive_timeout={self.keepalive_timeout!r})"
+        )
+
+    def create_connector(self) -> aiohttp.TCPConnector:
+        """Create the connector for a new aiohttp client session.
+
+        Returns
+        -------
+        aiohttp.TCPConnector
+            The connector, configured with the settings of the pool.
+        """
+        resolver = self._resolver
+
+        if resolver is None and self._async_resolver:
+            resolver = aiohttp.AsyncResolver()
+
+        _LOGGER.debug("Creating connector for %r", self)
+        self._connector = aiohttp.TCPConnector(
+            limit=self._limit,
+            limit_per_host=self._limit_per_host,
+            ttl_dns_cache=self._dns_cache_ttl,
+            keepalive_timeout=self._keepalive_timeout,
+            resolver=resolver,
+        )
+        return self._connector
+
+    def create_trace_config(self) -> aiohttp.TraceConfig:
+        """Create the trace config counting created and reused connections.
+
+        Returns
+        -------
+        aiohttp.TraceConfig
+            The trace config to pass to the aiohttp client session.
+        """
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        return trace_config
+
+    async def _on_connection_create_end(self, *_: Any) -> None:
+        self._created += 1
+
+    async def _on_connection_reuseconn(self, *_: Any) -> None:
+        self._reused += 1
+
+    @property
+    def limit(self) -> int:
+        """The maximum amount of simultaneous connections, or 0 for no limit."""
+        return self._limit
+
+    @property
+    def limit_per_host(self) -> int:
+        """The maximum amount of simultaneous connections to one host, or 0 for no limit."""
+        return self._limit_per_host
+
+    @property
+    def dns_cache_ttl(self) -> int | None:
+        """How many seconds resolved addresses are cached, or `None` to cache forever."""
+        return self._dns_cache_ttl
+
+    @property
+    def keepalive_timeout(self) -> float:
+        """How many seconds an idle connection is kept open to be reused."""
+        return self._keepalive_timeout
+
+    @property
+    def stats(self) -> ConnectionStats:
+        """A snapshot of the state of the connection pool."""
+        idle = acquired = 0
+
+        if self._connector is not None and not self._connector.closed:
+            # aiohttp does not expose these publicly, so they are read defensively
+            conns: dict[Any, Any] = getattr(self._connector, "_conns", {})
+            idle = sum(len(protocols) for protocols in conns.values())
+            acquired = len(getattr(self._connector, "_acquired", ()))
+
+        return ConnectionStats(idle, acquired, self._created, self._reused)
@@ -0,0 +1,66 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""JSON encoding and decoding of request and response bodies.
+
+`orjson` is used automatically if it is installed, for example with the `orjson`
+extra, falling back to the standard library `json` module otherwise.
+"""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = (
+    "JSONDumps",
+    "JSONLoads",
+    "ResponseMode",
+    "default_json_dumps",
+    "default_json_loads",
+)
+
+import importlib
+import json
+from typing import Any, Callable, Union
+
+from typing_extensions import Literal, TypeAlias
+
+JSONLoads: TypeAlias = Callable[[bytes], Any]
+"""A callable decoding JSON from bytes."""
+
+JSONDumps: TypeAlias = Callable[[Any], Union[bytes, str]]
+"""A callable encoding JSON to bytes or a string."""
+
+ResponseMode: TypeAlias = Literal["model", "json", "bytes"]
+"""What endpoints return: a model, the decoded JSON, or the undecoded response body."""
+
+try:
+    # Imported by name, as it is an optional dependency that may not be installed
+    _orjson: Any = importlib.import_module("orjson")
+except ImportError:
+    _orjson = None
+
+
+def default_json_loads(data: bytes) -> Any:
+    """The default JSON decoder, `orjson.loads` if available, else `json.loads`."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+
+    return json.loads(data)
+
+
+def default_json_dumps(obj: Any) -> bytes:
+    """The default JSON encoder, `orjson.dumps` if available, else `json.dumps`."""
+    if _orjson is not None:
+        encoded: bytes = _orjson.dumps(obj)
+        return encoded
+
+    return json.dumps(obj, separators=(",", ":")).encode()
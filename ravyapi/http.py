@@ -17,9 +17,11 @@ from __future__ import annotations
 
 __all__: tuple[str, ...] = ("HTTPClient", "HTTPAwareEndpoint")
 
+import asyncio
 import logging
 import re
-from typing import Any
+import time
+from typing import Any, Awaitable, Callable, Hashable, Mapping, get_args
 
 import aiohttp
 from typing_extensions import Final
@@ -33,11 +35,64 @@ from ravyapi.api.errors import (
     UnauthorizedError,
 )
 from ravyapi.api.models import GetTokenResponse
-from ravyapi.api.paths import Paths
+from ravyapi.api.paths import PATHS, Paths, Route
+from ravyapi.backends import CacheBackend, CacheBackendError
+from ravyapi.cache import (
+    DEFAULT_NEGATIVE_TTLS,
+    DEFAULT_TTLS,
+    AvatarCache,
+    ResponseCache,
+)
+from ravyapi.connections import ConnectionPool, ConnectionStats
 from ravyapi.const import BASE_URL, KSOFT_TOKEN_REGEX, RAVY_TOKEN_REGEX, USER_AGENT
+from ravyapi.data_binding import (
+    JSONDumps,
+    JSONLoads,
+    ResponseMode,
+    default_json_dumps,
+    default_json_loads,
+)
+from ravyapi.ratelimits import RateLimiter
+from ravyapi.retries import RetryPolicy
+from ravyapi.utils import PermissionSet
 
 _LOGGER: Final[logging.Logger] = logging.getLogger("ravyapi.http")
 
+_IDEMPOTENT_METHODS: Final[frozenset[str]] = frozenset(("GET", "HEAD", "OPTIONS"))
+
+_RESOURCE_PARAMS: Final[tuple[str, ...]] = ("url", "avatar")
+
+_RESPONSE_MODES: Final[tuple[str, ...]] = get_args(ResponseMode)
+
+_ROUTE_NAMES: Final[frozenset[str]] = frozenset(
+    route.name for route in vars(Paths).values() if isinstance(route, Route)
+)
+
+# Shared responses are tagged, so 404 results can be shared as well
+_SHARED_FOUND: Final[bytes] = b"+"
+_SHARED_NOT_FOUND: Final[bytes] = b"-"
+
+_BACKEND_ERRORS: Final[tuple[type[Exception], ...]] = (
+    CacheBackendError,
+    OSError,
+    asyncio.TimeoutError,
+)
+
+
+def _resource(
+    resource: int | str | None, params: Mapping[str, Any] | None
+) -> str | None:
+    """Get the ID or URL a request is about, for invalidating cached responses."""
+    if resource is not None:
+        return str(resource)
+
+    if params:
+        return next(
+            (str(params[name]) for name in _RESOURCE_PARAMS if name in params), None
+        )
+
+    return None
+
 
 class HTTPClient:
     """Internal client using aiohttp to work with networking."""
@@ -45,31 +100,174 @@ class HTTPClient:
     __slots__: tuple[str, ...] = (
         "_token",
         "_permissions",
+        "_permission_set",
+        "_permissions_ttl",
+        "_permissions_expire_at",
+        "_permissions_task",
         "_phisherman_token",
         "_headers",
         "_session",
+        "_loop",
+        "_closed",
+        "_rate_limiter",
+        "_retry_policy",
+        "_connection_pool",
+        "_inflight",
+        "_coalesced",
+        "_derived",
+        "_upgrade_window",
+        "_part_batches",
+        "_cache",
+        "_avatar_cache",
+        "_cache_backend",
+        "_shared_batch",
+        "_refresh_tasks",
+        "_shared_tasks",
+        "_closing_tasks",
+        "_json_loads",
+        "_json_dumps",
+        "_lazy_models",
+        "_compact_models",
+        "_response_mode",
     )
 
-    def __init__(self, token: str) -> None:
+    def __init__(
+        self,
+        token: str,
+        *,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        connection_pool: ConnectionPool | None = None,
+        cache: ResponseCache | None = None,
+        avatar_cache: AvatarCache | None = None,
+        cache_backend: CacheBackend | None = None,
+        json_loads: JSONLoads | None = None,
+        json_dumps: JSONDumps | None = None,
+        permissions_ttl: float | None = None,
+        lazy_models: bool = False,
+        compact_models: bool = False,
+        response_mode: ResponseMode = "model",
+        upgrade_window: float = 0.0,
+    ) -> None:
         self._token: str = self._token_sentinel(token)
         self._permissions: list[str] | None = None
+        self._permission_set: PermissionSet | None = None
+        self._permissions_ttl: float | None = permissions_ttl
+        self._permissions_expire_at: float | None = None
+        self._permissions_task: asyncio.Future[None] | None = None
         self._phisherman_token: str | None = None
         self._headers: dict[str, str] = {
             "Authorization": token,
             "User-Agent": USER_AGENT,
         }
-        self._session: aiohttp.ClientSession = aiohttp.ClientSession(
-            headers=self._headers
+        self._connection_pool: ConnectionPool = (
+            connection_pool if connection_pool is not None else ConnectionPool()
+        )
+        self._session: aiohttp.ClientSession | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._closed: bool = False
+        self._rate_limiter: RateLimiter = (
+            rate_limiter if rate_limiter is not None else RateLimiter()
         )
+        self._retry_policy: RetryPolicy = (
+            retry_policy if retry_policy is not None else RetryPolicy()
+        )
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._coalesced: int = 0
+        self._derived: int = 0
 
-    @staticmethod
-    async def _handle_response(response: aiohttp.ClientResponse) -> None:
+        if upgrade_window < 0:
+            raise ValueError('Parameter "upgrade_window" must not be negative')
+
+        self._upgrade_window: float = upgrade_window
+        self._part_batches: dict[Hashable, dict[str, asyncio.Future[bool]]] = {}
+        self._cache: ResponseCache | None = cache
+        self._avatar_cache: AvatarCache | None = avatar_cache
+        self._cache_backend: CacheBackend | None = cache_backend
+        self._shared_batch: dict[str, asyncio.Future[bytes | None]] | None = None
+        self._refresh_tasks: set[asyncio.Task[None]] = set()
+        self._shared_tasks: set[asyncio.Task[None]] = set()
+        self._closing_tasks: set[asyncio.Task[None]] = set()
+        self._json_loads: JSONLoads = (
+            json_loads if json_loads is not None else default_json_loads
+        )
+        self._json_dumps: JSONDumps = (
+            json_dumps if json_dumps is not None else default_json_dumps
+        )
+        self._lazy_models: bool = lazy_models
+        self._compact_models: bool = compact_models
+
+        if response_mode not in _RESPONSE_MODES:
+            raise ValueError(
+                'Parameter "response_mode" must be either "model", "json" or "bytes"'
+            )
+
+        self._response_mode: ResponseMode = response_mode
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the aiohttp client session, creating it for the running loop if needed.
+
+        Returns
+        -------
+        aiohttp.ClientSession
+            The session bound to the running event loop.
+
+        Raises
+        ------
+        RuntimeError
+            If the client is closed or no event loop is running.
+        """
+        if self._closed:
+            raise RuntimeError("Cannot make requests with a closed client")
+
+        loop = asyncio.get_running_loop()
+
+        if self._session is not None and not self._session.closed:
+            if self._loop is loop:
+                return self._session
+
+            _LOGGER.warning("Event loop changed; creating a new aiohttp client session")
+            self._close_stale_session(self._session)
+
+        # In-flight requests and background tasks belong to the previous loop and
+        # cannot be shared or awaited
+        self._inflight.clear()
+        self._refresh_tasks.clear()
+        self._shared_tasks.clear()
+        self._permissions_task = None
+        self._shared_batch = None
+        self._part_batches.clear()
+
+        _LOGGER.debug("Creating aiohttp client session")
+        self._session = aiohttp.ClientSession(
+            headers=self._headers,
+            connector=self._connection_pool.create_connector(),
+            trace_configs=[self._connection_pool.create_trace_config()],
+        )
+        self._loop = loop
+        return self._session
+
+    def _close_stale_session(self, session: aiohttp.ClientSession) -> None:
+        """Close the session of the previous event loop."""
+        if self._loop is not None and self._loop.is_running():
+            # Still running in another thread, so the session is closed there
+            asyncio.run_coroutine_threadsafe(session.close(), self._loop)
+            return
+
+        # The previous loop has stopped, so its connections are closed from this one
+        task = asyncio.ensure_future(session.close())
+        self._closing_tasks.add(task)
+        task.add_done_callback(self._closing_tasks.discard)
+
+    def _handle_response(self, response: aiohttp.ClientResponse, body: bytes) -> None:
         """Process response errors for requests.
 
         Parameters
         ----------
         response : aiohttp.ClientResponse
             The response to process from the API.
+        body : bytes
+            The body of the response, already read.
 
         Raises
         ------
@@ -80,13 +278,16 @@ class HTTPClient:
             _LOGGER.debug("Handling response successfully: %s", response.status)
             return
 
-        try:
-            data: str | dict[str, Any] = await response.json()
-            _LOGGER.debug("Response type is of JSON; returning as %s", type(data))
-        except aiohttp.ContentTypeError:
-            data = await response.text()  # errors are not always JSON
-            _LOGGER.debug("Response type is not of JSON; returning as %s", type(data))
+        data: str | dict[str, Any] = body.decode(response.charset or "utf-8", "replace")
 
+        # errors are not always JSON
+        if response.content_type == "application/json":
+            try:
+                data = self._json_loads(body)
+            except ValueError:
+                _LOGGER.debug("Response body is not valid JSON")
+
+        _LOGGER.debug("Returning error response as %s", type(data))
         _LOGGER.critical("Response status is not ok: %s", response.status)
 
         exception_map = {
@@ -127,26 +328,70 @@ class HTTPClient:
         return token
 
     async def get_permissions(self) -> None:
-        """Get the permissions for the current token."""
+        """Get the permissions for the current token.
+
+        Concurrent callers share a single request. Once the permissions are set and
+        `permissions_ttl` has expired, they are refreshed in the background while the
+        previous permissions remain in use.
+        """
         _LOGGER.debug("Getting permissions from token")
 
-        if self._permissions is not None:
+        if self._permissions is not None and not self.permissions_expired:
             _LOGGER.debug("Permissions already set; skipping API call")
             return
 
-        self._permissions = GetTokenResponse(
-            await self.get(self.paths.tokens.route)
-        ).access
+        if self._permissions_task is None or self._permissions_task.done():
+            self._permissions_task = asyncio.ensure_future(self._fetch_permissions())
+
+        if self._permissions is not None:
+            _LOGGER.debug("Permissions expired; refreshing in the background")
+            return
+
+        await asyncio.shield(self._permissions_task)
+
+    async def _fetch_permissions(self) -> None:
+        try:
+            access = GetTokenResponse(await self.get(PATHS.TOKEN)).access
+        except Exception:
+            if self._permissions is None:
+                raise
+
+            # Keep using the previous permissions if the background refresh failed
+            _LOGGER.exception("Failed to refresh permissions")
+            return
+
+        self._permissions = access
+        self._permission_set = PermissionSet(access)
+
+        if self._permissions_ttl is not None:
+            self._permissions_expire_at = time.monotonic() + self._permissions_ttl
 
         _LOGGER.debug("Permissions are now set: %s", self.permissions)
 
-    async def get(self, path: str, **kwargs: Any) -> dict[str, Any]:
-        """Internal method to make a GET request to the given path.
+    async def request(
+        self,
+        method: str,
+        route: Route,
+        resource: int | str | None = None,
+        *,
+        retry: bool | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Internal method to make a request to the given route.
+
+        See `ravyapi.http.HTTPClient.request_body`, which this decodes the body of.
 
         Parameters
         ----------
-        path : str
-            The path to make the request to.
+        method : str
+            The HTTP method of the request.
+        route : Route
+            The route to make the request to.
+        resource : int | str | None
+            The ID or URL the request is about, if the route takes one.
+        retry : bool | None
+            Whether to retry the request on transient failures.
+            Defaults to `True` for idempotent methods and `False` otherwise.
         **kwargs : Any
             The keyword arguments to pass to aiohttp.
 
@@ -155,20 +400,166 @@ class HTTPClient:
         dict[str, Any]
             The JSON response from the API.
         """
-        _LOGGER.debug("Making GET request to %s", path)
-        async with self._session.get(BASE_URL + path, **kwargs) as response:
-            await self._handle_response(response)
+        body = await self.request_body(method, route, resource, retry=retry, **kwargs)
+        data: dict[str, Any] = self._json_loads(body) if body.strip() else {}
+        return data
+
+    async def request_body(
+        self,
+        method: str,
+        route: Route,
+        resource: int | str | None = None,
+        *,
+        retry: bool | None = None,
+        **kwargs: Any,
+    ) -> bytes:
+        """Internal method to make a request to the given route, without decoding the response.
+
+        The request is queued by `ravyapi.ratelimits.RateLimiter` until the rate limits
+        allow it to be sent, and retried automatically if it is rate limited anyway.
+        Timeouts, connection errors and the statuses of `ravyapi.retries.RetryPolicy`
+        are retried with a backoff if `retry` is enabled.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method of the request.
+        route : Route
+            The route to make the request to.
+        resource : int | str | None
+            The ID or URL the request is about, if the route takes one.
+        retry : bool | None
+            Whether to retry the request on transient failures.
+            Defaults to `True` for idempotent methods and `False` otherwise.
+        **kwargs : Any
+            The keyword arguments to pass to aiohttp.
+            A coroutine function `data` is awaited for a fresh body on every attempt,
+            since bodies such as `aiohttp.FormData` can only be sent once. Requests
+            with any other body that is not `bytes` or `str` are never sent again.
+
+        Returns
+        -------
+        bytes
+            The body of the response from the API, once its status is checked.
+        """
+        if retry is None:
+            retry = method in _IDEMPOTENT_METHODS
+
+        if "json" in kwargs:
+            kwargs["data"] = self._json_dumps(kwargs.pop("json"))
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                "Content-Type": "application/json",
+            }
 
-            data: dict[str, Any] = await response.json()
-            return data
+        data = kwargs.pop("data", None)
+        make_data: Callable[[], Awaitable[Any]] | None = (
+            data if asyncio.iscoroutinefunction(data) else None
+        )
+        replayable = make_data is not None or isinstance(data, (bytes, str, type(None)))
+
+        if not replayable:
+            retry = False
+
+        url = route.url(resource)
+        self._retry_policy.deposit()
+        rate_limited_attempt = 0
+        failed_attempt = 0
+
+        while True:
+            await self._rate_limiter.acquire(route.bucket)
+
+            if make_data is not None:
+                kwargs["data"] = await make_data()
+            elif data is not None:
+                kwargs["data"] = data
+
+            _LOGGER.debug("Making %s request to %s", method, url)
+            try:
+                async with self._get_session().request(
+                    method, url, **kwargs
+                ) as response:
+                    self._rate_limiter.update(route.bucket, response.headers)
+
+                    if response.status == 429:
+                        # Bodies that cannot be sent again block the bucket without a retry
+                        retry_after = self._rate_limiter.rate_limited(
+                            route.bucket,
+                            response.headers,
+                            (
+                                rate_limited_attempt
+                                if replayable
+                                else self._rate_limiter.max_retries
+                            ),
+                        )
+
+                        if retry_after is not None:
+                            _LOGGER.debug(
+                                "Retrying %s request to %s after being rate limited",
+                                method,
+                                url,
+                            )
+                            rate_limited_attempt += 1
+                            continue
+
+                    delay = (
+                        self._retry_policy.backoff(failed_attempt)
+                        if retry and response.status in self._retry_policy.statuses
+                        else None
+                    )
 
-    async def post(self, path: str, **kwargs: Any) -> dict[str, Any]:
-        """Internal method to make a POST request to the given path.
+                    if delay is None:
+                        # The body is read once and reused for errors and data alike
+                        body = await response.read()
+                        self._handle_response(response, body)
+                        return body
+
+                    _LOGGER.warning(
+                        "%s request to %s failed with status %s; retrying in %.3fs",
+                        method,
+                        url,
+                        response.status,
+                        delay,
+                    )
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as exc:
+                if not retry:
+                    raise
+
+                delay = self._retry_policy.backoff(failed_attempt)
+
+                if delay is None:
+                    raise
+
+                _LOGGER.warning(
+                    "%s request to %s failed with %r; retrying in %.3fs",
+                    method,
+                    url,
+                    exc,
+                    delay,
+                )
+
+            failed_attempt += 1
+            await asyncio.sleep(delay)
+
+    async def get(
+        self,
+        route: Route,
+        resource: int | str | None = None,
+        *,
+        key: Hashable | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Internal method to make a GET request to the given route.
 
         Parameters
         ----------
-        path : str
-            The path to make the request to.
+        route : Route
+            The route to make the request to.
+        resource : int | str | None
+            The ID or URL the request is about, if the route takes one.
+        key : Hashable | None
+            Optional, the key identifying equivalent requests, which share in-flight
+            requests and cached responses. Defaults to the path and parameters.
         **kwargs : Any
             The keyword arguments to pass to aiohttp.
 
@@ -176,32 +567,635 @@ class HTTPClient:
         -------
         dict[str, Any]
             The JSON response from the API.
+            This is shared with concurrent callers and must not be mutated.
         """
-        _LOGGER.debug("Making POST request to %s", path)
-        async with self._session.post(BASE_URL + path, **kwargs) as response:
-            await self._handle_response(response)
+        if kwargs.keys() - {"params"}:
+            return await self.request("GET", route, resource, **kwargs)
+
+        params: Mapping[str, Any] | None = kwargs.get("params")
+        path = route.path(resource)
+
+        if key is None:
+            key = self._request_key(path, params)
+
+        cached_as: tuple[str, str | None] | None = None
 
-            data: dict[str, Any] = await response.json()
-            return data
+        if self._cache is not None and self._cache.caches(route.name):
+            cached_as = (route.name, _resource(resource, params))
+
+            cached, refresh = await self._cache.lookup(key)
+
+            if cached is not None:
+                _LOGGER.debug("Answering GET request to %s from cache", path)
+
+                if refresh:
+                    self._refresh(
+                        key,
+                        path,
+                        lambda: self._fetch(route, resource, key, params, cached_as),
+                    )
+
+                return cached
+
+        data: dict[str, Any] = await self._coalesce(
+            key, path, lambda: self._fetch(route, resource, key, params, cached_as)
+        )
+        return data
+
+    async def get_bytes(
+        self,
+        route: Route,
+        resource: int | str | None = None,
+        *,
+        key: Hashable | None = None,
+        **kwargs: Any,
+    ) -> bytes:
+        """Internal method to make a GET request to the given route, without decoding the response.
+
+        Identical requests in flight are shared, but the responses are not cached, as
+        only decoded responses are.
+
+        Parameters
+        ----------
+        route : Route
+            The route to make the request to.
+        resource : int | str | None
+            The ID or URL the request is about, if the route takes one.
+        key : Hashable | None
+            Optional, the key identifying equivalent requests, which share in-flight
+            requests. Defaults to the path and parameters.
+        **kwargs : Any
+            The keyword arguments to pass to aiohttp.
+
+        Returns
+        -------
+        bytes
+            The body of the response from the API, once its status is checked.
+        """
+        if kwargs.keys() - {"params"}:
+            return await self.request_body("GET", route, resource, **kwargs)
+
+        path = route.path(resource)
+
+        if key is None:
+            key = self._request_key(path, kwargs.get("params"))
+
+        body: bytes = await self._coalesce(
+            (bytes, key),
+            path,
+            lambda: self._fetch_body(route, resource, kwargs.get("params")),
+        )
+        return body
+
+    async def get_part(
+        self,
+        route: Route,
+        resource: int | str,
+        *,
+        whole: Route,
+        part: Callable[[dict[str, Any]], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Internal method to make a GET request for a part of a larger resource.
+
+        The part is taken from the whole resource instead if it is cached in memory or
+        already requested. If `upgrade_window` is positive, requests for different
+        parts of the same resource made within it are upgraded to one request for the
+        whole resource.
+
+        Parameters
+        ----------
+        route : Route
+            The route of the part, for example `/users/{}/bans`.
+        resource : int | str
+            The ID or URL the request is about.
+        whole : Route
+            The route of the whole resource, for example `/users/{}`.
+        part : Callable[[dict[str, Any]], dict[str, Any]]
+            The callable taking the response of the part from that of the whole.
+
+        Returns
+        -------
+        dict[str, Any]
+            The JSON response of the part.
+            This is shared with concurrent callers and must not be mutated.
+        """
+        whole_key = self._request_key(whole.path(resource), None)
+
+        # Peeked at, so a part does not count as a miss or a use of the whole; parts
+        # may exist without the whole, so a cached 404 is requested as usual
+        cached = self._cache.peek(whole_key) if self._cache is not None else None
+
+        if cached is not None:
+            self._derived += 1
+            return part(cached)
+
+        if (inflight := self._inflight.get(whole_key)) is not None:
+            try:
+                response = await asyncio.shield(inflight)
+            except NotFoundError:
+                # Parts may exist without the whole, so the part is requested itself
+                return await self.get(route, resource)
+
+            self._derived += 1
+            return part(response)
+
+        if not self._upgrade_window or (
+            self._permission_set is not None and whole.name not in self._permission_set
+        ):
+            return await self.get(route, resource)
+
+        if await asyncio.shield(self._join_part_batch(whole_key, route.name)):
+            try:
+                response = await self.get(whole, resource)
+            except NotFoundError:
+                return await self.get(route, resource)
+
+            self._derived += 1
+            return part(response)
+
+        return await self.get(route, resource)
+
+    def _join_part_batch(self, whole_key: Hashable, name: str) -> asyncio.Future[bool]:
+        """Wait for the requests of parts within the window, and whether to upgrade."""
+        batch = self._part_batches.get(whole_key)
+
+        if batch is None:
+            batch = self._part_batches[whole_key] = {}
+            asyncio.get_running_loop().call_later(
+                self._upgrade_window, self._flush_part_batch, whole_key, batch
+            )
+
+        future = batch.get(name)
+
+        if future is None:
+            future = batch[name] = asyncio.get_running_loop().create_future()
+
+        return future
+
+    def _flush_part_batch(
+        self, whole_key: Hashable, batch: dict[str, asyncio.Future[bool]]
+    ) -> None:
+        if self._part_batches.get(whole_key) is batch:
+            del self._part_batches[whole_key]
+
+        # One request for a part is cheaper than one for the whole, but two are not
+        upgrade = len(batch) > 1
+
+        if upgrade:
+            _LOGGER.debug("Upgrading %s part requests to GET %s", len(batch), whole_key)
+
+        for future in batch.values():
+            if not future.done():
+                future.set_result(upgrade)
+
+    async def _coalesce(
+        self, key: Hashable, path: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        future = self._inflight.get(key)
+
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._release_inflight(key, done))
+        else:
+            _LOGGER.debug("Coalescing GET request to %s", path)
+            self._coalesced += 1
+
+        # Cancelling one waiter must not cancel the request shared by the others
+        return await asyncio.shield(future)
+
+    def _refresh(
+        self, key: Hashable, path: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> None:
+        """Refresh a cached response in the background, sharing a request in flight."""
+
+        async def refresh() -> None:
+            assert self._cache is not None
+
+            try:
+                await self._coalesce(key, path, fetch)
+            except NotFoundError:
+                # Cached as not found by the fetch itself
+                pass
+            except asyncio.CancelledError:
+                self._cache.refresh_failed(key)
+                raise
+            except Exception as exc:
+                self._cache.refresh_failed(key)
+                _LOGGER.warning("Failed to refresh cached %s: %r", path, exc)
+
+        _LOGGER.debug("Refreshing cached GET request to %s in the background", path)
+        task = asyncio.ensure_future(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _fetch(
+        self,
+        route: Route,
+        resource: int | str | None,
+        key: Hashable,
+        params: Mapping[str, Any] | None,
+        cached_as: tuple[str, str | None] | None,
+    ) -> dict[str, Any]:
+        try:
+            body = await self._fetch_body(route, resource, params)
+        except NotFoundError as exc:
+            if self._cache is not None and cached_as is not None:
+                self._cache.set_not_found(key, exc, *cached_as)
+
+            raise
+
+        data: dict[str, Any] = self._json_loads(body) if body.strip() else {}
+
+        if self._cache is not None and cached_as is not None:
+            self._cache.set(key, data, *cached_as)
+
+        return data
+
+    async def _fetch_body(
+        self,
+        route: Route,
+        resource: int | str | None,
+        params: Mapping[str, Any] | None,
+    ) -> bytes:
+        shared_key = self._shared_key(route, resource, params)
+
+        if shared_key is None:
+            return await self.request_body("GET", route, resource, params=params)
+
+        shared = await self._shared_get(shared_key)
+
+        if shared is not None:
+            _LOGGER.debug("Answering GET request to %s from cache backend", shared_key)
+
+            if shared[:1] == _SHARED_NOT_FOUND:
+                raise NotFoundError(self._json_loads(shared[1:]))
+
+            return shared[1:]
+
+        try:
+            body = await self.request_body("GET", route, resource, params=params)
+        except NotFoundError as exc:
+            ttl = self._shared_ttl(route.name, True)
+
+            if ttl is not None:
+                encoded = self._json_dumps(exc.exc_data)
+                encoded = encoded.encode() if isinstance(encoded, str) else encoded
+                await self._shared_set(shared_key, _SHARED_NOT_FOUND + encoded, ttl)
+
+            raise
+
+        ttl = self._shared_ttl(route.name, False)
+
+        if ttl is not None:
+            await self._shared_set(shared_key, _SHARED_FOUND + body, ttl)
+
+        return body
+
+    def _shared_key(
+        self,
+        route: Route,
+        resource: int | str | None,
+        params: Mapping[str, Any] | None,
+    ) -> str | None:
+        """Get the key of a response in the cache backend, if it is shared.
+
+        Only responses identified by the endpoint and the ID or URL alone are shared,
+        as other parameters, such as tokens, may be specific to the client.
+        """
+        if self._cache_backend is None or (
+            params and not params.keys() <= set(_RESOURCE_PARAMS)
+        ):
+            return None
+
+        if (
+            self._shared_ttl(route.name, False) is None
+            and self._shared_ttl(route.name, True) is None
+        ):
+            return None
+
+        shared_resource = _resource(resource, params)
+        return (
+            route.name if shared_resource is None else f"{route.name}:{shared_resource}"
+        )
+
+    def _shared_ttl(self, route: str, negative: bool) -> float | None:
+        """Get the time to live of shared responses, the same as in the response cache."""
+        if self._cache is not None:
+            return (
+                self._cache.negative_ttl_for(route)
+                if negative
+                else self._cache.ttl_for(route)
+            )
+
+        ttls = DEFAULT_NEGATIVE_TTLS if negative else DEFAULT_TTLS
+        ttl = ttls.get(route, ttls.get(route.partition(".")[0]))
+        return ttl if ttl is not None and ttl > 0 else None
+
+    async def _shared_get(self, key: str) -> bytes | None:
+        # Lookups made in the same iteration of the event loop, such as those of the
+        # `*_many` methods, are sent to the backend together as one bulk get
+        if self._shared_batch is None:
+            self._shared_batch = {}
+            asyncio.get_running_loop().call_soon(self._flush_shared_batch)
+
+        future = self._shared_batch.get(key)
+
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._shared_batch[key] = future
+
+        return await asyncio.shield(future)
+
+    def _flush_shared_batch(self) -> None:
+        batch, self._shared_batch = self._shared_batch, None
+
+        if batch:
+            task = asyncio.ensure_future(self._load_shared_batch(batch))
+            self._shared_tasks.add(task)
+            task.add_done_callback(self._shared_tasks.discard)
+
+    async def _load_shared_batch(
+        self, batch: dict[str, asyncio.Future[bytes | None]]
+    ) -> None:
+        assert self._cache_backend is not None
+        keys = list(batch)
+        values: list[bytes | None] = [None] * len(keys)
+
+        try:
+            loaded = (
+                await self._cache_backend.get_many(keys)
+                if len(keys) > 1
+                else [await self._cache_backend.get(keys[0])]
+            )
+
+            if len(loaded) != len(keys):
+                raise CacheBackendError(
+                    f"Expected {len(keys)} values from the cache backend, "
+                    f"got {len(loaded)}"
+                )
+
+            values = list(loaded)
+        except _BACKEND_ERRORS as exc:
+            _LOGGER.warning(
+                "Failed to get %s keys from cache backend: %r", len(keys), exc
+            )
+        except Exception:
+            _LOGGER.exception("Failed to get %s keys from cache backend", len(keys))
+        finally:
+            # Whatever went wrong, even cancellation, the lookups fall back to the API
+            # instead of waiting forever
+            for future, value in zip(batch.values(), values):
+                if not future.done():
+                    future.set_result(value)
+
+    async def _shared_set(self, key: str, value: bytes, ttl: float) -> None:
+        assert self._cache_backend is not None
+
+        try:
+            await self._cache_backend.set(key, value, ttl)
+        except _BACKEND_ERRORS as exc:
+            _LOGGER.warning("Failed to set %s in cache backend: %r", key, exc)
+
+    @staticmethod
+    def _request_key(path: str, params: Mapping[str, Any] | None) -> Hashable:
+        if not params:
+            return path
+
+        return (path, tuple(sorted((key, str(value)) for key, value in params.items())))
+
+    def _release_inflight(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+        # Retrieve the exception so it is not reported if every waiter was cancelled
+        if not future.cancelled():
+            future.exception()
+
+    async def post(
+        self,
+        route: Route,
+        resource: int | str | None = None,
+        *,
+        retry: bool = False,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Internal method to make a POST request to the given route.
+
+        Parameters
+        ----------
+        route : Route
+            The route to make the request to.
+        resource : int | str | None
+            The ID or URL the request is about, if the route takes one.
+        retry : bool
+            Whether to retry the request on transient failures.
+            Only enable this if sending the request more than once is harmless.
+        **kwargs : Any
+            The keyword arguments to pass to aiohttp.
+
+        Returns
+        -------
+        dict[str, Any]
+            The JSON response from the API.
+        """
+        return await self.request("POST", route, resource, retry=retry, **kwargs)
+
+    def response_mode_of(self, mode: ResponseMode | None) -> ResponseMode:
+        """Validate what an endpoint returns, defaulting to `response_mode`.
+
+        Parameters
+        ----------
+        mode : ResponseMode | None
+            What the endpoint returns, or `None` for the default of the client.
+
+        Returns
+        -------
+        ResponseMode
+            What the endpoint returns.
+
+        Raises
+        ------
+        ValueError
+            If the mode is not one of `ravyapi.data_binding.ResponseMode`.
+        """
+        if mode is None:
+            return self._response_mode
+
+        if mode not in _RESPONSE_MODES:
+            raise ValueError(
+                'Parameter "mode" must be either "model", "json" or "bytes"'
+            )
+
+        return mode
+
+    async def invalidate(self, route: str, resource: int | str) -> None:
+        """Remove cached responses of an endpoint for an ID or URL, if caching.
+
+        Responses shared in the cache backend are removed as well.
+
+        Parameters
+        ----------
+        route : str
+            The endpoint to remove responses of, including its sub-endpoints.
+        resource : int | str
+            The ID or URL to remove responses for.
+        """
+        if self._cache is not None:
+            await self._cache.invalidate(route, resource)
+
+        if self._cache_backend is not None:
+            keys = [
+                f"{name}:{resource}"
+                for name in sorted(_ROUTE_NAMES)
+                if name == route or name.startswith(f"{route}.")
+            ]
+
+            try:
+                await self._cache_backend.delete(keys)
+            except _BACKEND_ERRORS as exc:
+                _LOGGER.warning("Failed to delete %s from cache backend: %r", keys, exc)
 
     def set_phisherman_token(self, token: str) -> None:
         """Set the phisherman token for use in `urls` endpoint routes."""
         self._phisherman_token = token
 
+    async def open(self) -> None:
+        """Open the underlying aiohttp client in the running event loop."""
+        self._closed = False
+        self._get_session()
+
+    async def warmup(self, connections: int) -> None:
+        """Open connections to the Ravy API ahead of the first requests.
+
+        Parameters
+        ----------
+        connections : int
+            How many connections to open simultaneously.
+        """
+        session = self._get_session()
+
+        async def connect() -> None:
+            try:
+                async with session.head(BASE_URL, allow_redirects=False):
+                    pass
+            except (asyncio.TimeoutError, aiohttp.ClientError) as exc:
+                _LOGGER.warning("Failed to open connection during warmup: %r", exc)
+
+        _LOGGER.debug("Warming up %s connections", connections)
+        await asyncio.gather(*(connect() for _ in range(connections)))
+
     async def close(self) -> None:
-        """Close the underlying aiohttp client."""
+        """Close the underlying aiohttp client, the response cache and the cache backend."""
+        self._closed = True
+
+        loop = asyncio.get_running_loop()
+
+        # Tasks of a previous loop cannot be cancelled or awaited from this one
+        tasks = [
+            task
+            for task in (*self._refresh_tasks, *self._shared_tasks)
+            if task.get_loop() is loop
+        ]
+
+        for task in tasks:
+            task.cancel()
+
+        # Awaited so they are done before the session and caches they use are closed
+        await asyncio.gather(
+            *tasks,
+            *(task for task in self._closing_tasks if task.get_loop() is loop),
+            return_exceptions=True,
+        )
+
+        if self._cache is not None:
+            self._cache.close()
+
+        if self._cache_backend is not None:
+            await self._cache_backend.close()
+
+        if self._session is None:
+            return
+
         _LOGGER.debug("Closing underlying aiohttp client")
         await self._session.close()
+        self._session = None
+        self._loop = None
 
     @property
     def headers(self) -> dict[str, str]:
         """The headers set in the aiohttp client for requests."""
         return self._headers
 
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """The `ravyapi.ratelimits.RateLimiter` scheduling requests."""
+        return self._rate_limiter
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """The `ravyapi.retries.RetryPolicy` retrying failed requests."""
+        return self._retry_policy
+
+    @property
+    def connection_pool(self) -> ConnectionPool:
+        """The `ravyapi.connections.ConnectionPool` settings for connections."""
+        return self._connection_pool
+
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """A snapshot of the state of the connection pool."""
+        return self._connection_pool.stats
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """The `ravyapi.cache.ResponseCache` of responses, if caching."""
+        return self._cache
+
+    @property
+    def avatar_cache(self) -> AvatarCache | None:
+        """The `ravyapi.cache.AvatarCache` of avatar check verdicts, if caching."""
+        return self._avatar_cache
+
+    @property
+    def cache_backend(self) -> CacheBackend | None:
+        """The `ravyapi.backends.CacheBackend` sharing responses, if any."""
+        return self._cache_backend
+
+    @property
+    def lazy_models(self) -> bool:
+        """Whether nested models of responses are built when first accessed."""
+        return self._lazy_models
+
+    @property
+    def compact_models(self) -> bool:
+        """Whether models drop the raw data of responses, rebuilding it when accessed."""
+        return self._compact_models
+
+    @property
+    def response_mode(self) -> ResponseMode:
+        """What endpoints return by default: a model, the decoded JSON, or the body."""
+        return self._response_mode
+
+    @property
+    def coalesced(self) -> int:
+        """The amount of GET requests that shared an identical in-flight request."""
+        return self._coalesced
+
+    @property
+    def derived(self) -> int:
+        """The amount of GET requests for parts of resources answered from the whole."""
+        return self._derived
+
+    @property
+    def upgrade_window(self) -> float:
+        """The window, in seconds, in which requests for parts are upgraded, or `0.0` if they are not."""
+        return self._upgrade_window
+
     @property
     def paths(self) -> Paths:
-        """An instance of `ravyapi.api.paths.Path` for routing."""
-        return Paths()
+        """The shared instance of `ravyapi.api.paths.Paths` for routing."""
+        return PATHS
 
     @property
     def permissions(self) -> list[str] | None:
@@ -213,6 +1207,22 @@ class HTTPClient:
         """
         return self._permissions
 
+    @property
+    def permission_set(self) -> PermissionSet | None:
+        """The compiled `ravyapi.utils.PermissionSet` of the token's permissions.
+
+        This is `None` if the token has not yet been retrieved.
+        """
+        return self._permission_set
+
+    @property
+    def permissions_expired(self) -> bool:
+        """Whether the permissions are due to be refreshed."""
+        return (
+            self._permissions_expire_at is not None
+            and self._permissions_expire_at <= time.monotonic()
+        )
+
     @property
     def phisherman_token(self) -> str | None:
         """The phisherman token for use in `urls` endpoint routes."""
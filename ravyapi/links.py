@@ -0,0 +1,202 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Extraction and normalization of URLs before they are looked up."""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = (
+    "TRACKING_PARAMS",
+    "avatar_key",
+    "canonicalize_url",
+    "extract_urls",
+)
+
+import re
+import urllib.parse
+
+from typing_extensions import Final
+
+TRACKING_PARAMS: Final[frozenset[str]] = frozenset(
+    (
+        "dclid",
+        "fbclid",
+        "gclid",
+        "gclsrc",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "msclkid",
+        "yclid",
+        "_ga",
+        "_gl",
+    )
+)
+"""Query parameters only used for tracking, besides those starting with `utm_`."""
+
+_DEFAULT_PORTS: Final[dict[str, str]] = {"http": "80", "https": "443"}
+
+# One pass finds both URLs with a scheme and bare domains such as `example.com/path`.
+# Markdown links need no special casing, as brackets and parentheses end a URL.
+_URL_REGEX: Final[re.Pattern[str]] = re.compile(
+    r"""
+    (?:
+        https?://[^\s<>()\[\]{}"'`|]+
+    |
+        (?<![\w@./:-])
+        (?:[^\W_](?:[\w-]{0,61}[^\W_])?\.)+[^\W\d_]{2,63}
+        (?::\d{1,5})?
+        (?:/[^\s<>()\[\]{}"'`|]*)?
+        (?![\w@-])
+    )
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+_TRAILING_PUNCTUATION: Final[str] = ".,;:!?*_~"
+
+_AVATAR_PATH_REGEX: Final[re.Pattern[str]] = re.compile(
+    r"""
+    /(?:
+        (?:guilds/\d+/users/\d+/)?avatars/\d+/(?P<hash>(?:a_)?[0-9a-f]{32})
+    |
+        embed/avatars/(?P<index>\d+)
+    )
+    \.(?:png|jpe?g|webp|gif)
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name.startswith("utm_") or name in TRACKING_PARAMS
+
+
+def _encode_host(host: str) -> str:
+    try:
+        return host.encode("idna").decode("ascii")
+    except UnicodeError:
+        # Not a valid internationalized domain name; looked up as given
+        return host
+
+
+def canonicalize_url(url: str) -> str:
+    """Get the canonical form of a URL, so that equivalent URLs compare equal.
+
+    The scheme and host are lowercased, the host is encoded with IDNA (punycode),
+    default ports, fragments, trailing slashes and tracking query parameters are
+    dropped. The path and remaining query parameters are kept as given.
+
+    Parameters
+    ----------
+    url : str
+        The URL to canonicalize, with or without a scheme.
+
+    Returns
+    -------
+    str
+        The canonical URL.
+    """
+    url = url.strip()
+    has_scheme = "://" in url
+    parts = urllib.parse.urlsplit(url if has_scheme else f"//{url}")
+    scheme = parts.scheme.lower()
+
+    userinfo, _, hostport = parts.netloc.rpartition("@")
+    host, _, port = hostport.partition(":")
+
+    if hostport.startswith("["):
+        # IPv6 addresses cannot be IDNA encoded and contain colons themselves
+        host, _, port = hostport.partition("]")
+        host, port = f"{host}]".lower(), port[1:]
+    else:
+        host = _encode_host(host.lower().rstrip("."))
+
+    netloc = host
+
+    if port and port != _DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{port}"
+
+    if userinfo:
+        netloc = f"{userinfo}@{netloc}"
+
+    query = parts.query
+
+    if query:
+        query = "&".join(
+            param
+            for param in query.split("&")
+            if param and not _is_tracking_param(param.partition("=")[0])
+        )
+
+    canonical = urllib.parse.urlunsplit(
+        (scheme, netloc, parts.path.rstrip("/"), query, "")
+    )
+    return canonical if has_scheme else canonical[2:]
+
+
+def extract_urls(text: str) -> list[str]:
+    """Find the URLs in a message in a single pass.
+
+    Both URLs with an `http` or `https` scheme and bare domains are found, including
+    those in markdown links and angle brackets. Trailing punctuation is not included.
+
+    Parameters
+    ----------
+    text : str
+        The text of the message.
+
+    Returns
+    -------
+    list[str]
+        The URLs in the order they appear, as written in the message.
+    """
+    # Most messages contain no URL at all, which is cheaper to rule out up front
+    if "." not in text and "://" not in text:
+        return []
+
+    return [
+        stripped
+        for url in _URL_REGEX.findall(text)
+        if (stripped := url.rstrip(_TRAILING_PUNCTUATION))
+    ]
+
+
+def avatar_key(url: str) -> str | None:
+    """Get the key identifying the image of a Discord CDN avatar URL.
+
+    Discord names avatars by a hash of the image, so the key is the same regardless of
+    the size, format and query parameters of the URL, and for users sharing an avatar.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the avatar, for example
+        `https://cdn.discordapp.com/avatars/1234/a_0123456789abcdef0123456789abcdef.webp?size=128`.
+
+    Returns
+    -------
+    str | None
+        The key, for example `avatars/a_0123456789abcdef0123456789abcdef` or
+        `embed/avatars/0` for default avatars, or `None` if the URL is not of an avatar.
+    """
+    match = _AVATAR_PATH_REGEX.fullmatch(urllib.parse.urlsplit(url).path)
+
+    if match is None:
+        return None
+
+    if match["hash"] is not None:
+        return f"avatars/{match['hash'].lower()}"
+
+    return f"embed/avatars/{match['index']}"
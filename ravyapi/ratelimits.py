@@ -0,0 +1,564 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Rate limit aware scheduling of requests to the Ravy API."""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = ("RateLimiter", "RateLimitStats", "TokenBucket")
+
+import asyncio
+import datetime
+import email.utils
+import logging
+import math
+import time
+from typing import Mapping
+
+from typing_extensions import Final
+
+_LOGGER: Final[logging.Logger] = logging.getLogger("ravyapi.ratelimits")
+
+
+class TokenBucket:
+    """A token bucket limiting how frequently requests may be made.
+
+    Tokens are reserved eagerly, so concurrent callers are queued behind one another
+    instead of all waking up at once when the bucket refills.
+
+    Attributes
+    ----------
+    rate : float
+        How many tokens are refilled per second.
+    capacity : float
+        The maximum amount of tokens the bucket can hold.
+    """
+
+    __slots__: tuple[str, ...] = ("_rate", "_capacity", "_tokens", "_updated")
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """
+        Parameters
+        ----------
+        rate : float
+            How many tokens are refilled per second.
+        capacity : float
+            The maximum amount of tokens the bucket can hold.
+        """
+        if rate <= 0:
+            raise ValueError('Parameter "rate" must be greater than 0')
+
+        if capacity < 1:
+            raise ValueError('Parameter "capacity" must be at least 1')
+
+        self._rate: float = rate
+        self._capacity: float = capacity
+        self._tokens: float = capacity
+        self._updated: float = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Reserve a token from the bucket.
+
+        Returns
+        -------
+        float
+            How many seconds the caller must wait before the reserved token is usable.
+        """
+        self._refill(time.monotonic())
+        self._tokens -= 1
+
+        if self._tokens >= 0:
+            return 0.0
+
+        return -self._tokens / self._rate
+
+    @property
+    def rate(self) -> float:
+        """How many tokens are refilled per second."""
+        return self._rate
+
+    @property
+    def capacity(self) -> float:
+        """The maximum amount of tokens the bucket can hold."""
+        return self._capacity
+
+
+class _RouteBucket:
+    """Rate limit state for a single route, driven by the API's response headers."""
+
+    __slots__: tuple[str, ...] = ("_lock", "_limit", "_remaining", "_reset_at")
+
+    def __init__(self) -> None:
+        self._lock: asyncio.Lock | None = None
+        self._limit: int | None = None
+        self._remaining: int | None = None
+        self._reset_at: float = 0.0
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        # Created lazily so the lock is bound to the loop that first uses it
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        return self._lock
+
+    def delay(self, now: float) -> float:
+        if self._reset_at and now >= self._reset_at:
+            self._remaining = self._limit
+            self._reset_at = 0.0
+
+        if self._remaining is not None and self._remaining <= 0 and self._reset_at:
+            return self._reset_at - now
+
+        return 0.0
+
+    def consume(self) -> None:
+        if self._remaining is not None:
+            self._remaining -= 1
+
+    def update(self, limit: int | None, remaining: int | None, reset_at: float) -> None:
+        if limit is not None:
+            self._limit = limit
+
+        if remaining is not None:
+            self._remaining = remaining
+
+        if reset_at:
+            self._reset_at = max(self._reset_at, reset_at)
+
+    def block(self, until: float) -> None:
+        self._remaining = 0
+        self._reset_at = max(self._reset_at, until)
+
+
+class RateLimitStats:
+    """A snapshot of how long requests waited in the rate limit queue.
+
+    Attributes
+    ----------
+    requests : int
+        The amount of requests that passed through the rate limiter.
+    queued : int
+        The amount of requests that had to wait before being sent.
+    waiting : int
+        The amount of requests currently waiting in the queue.
+    rate_limited : int
+        The amount of responses that came back with a 429 status.
+    retries : int
+        The amount of requests that were retried after being rate limited.
+    total_wait : float
+        The total time, in seconds, requests spent waiting in the queue.
+    max_wait : float
+        The longest time, in seconds, a single request spent waiting in the queue.
+    average_wait : float
+        The average time, in seconds, a request spent waiting in the queue.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_requests",
+        "_queued",
+        "_waiting",
+        "_rate_limited",
+        "_retries",
+        "_total_wait",
+        "_max_wait",
+    )
+
+    def __init__(
+        self,
+        requests: int,
+        queued: int,
+        waiting: int,
+        rate_limited: int,
+        retries: int,
+        total_wait: float,
+        max_wait: float,
+    ) -> None:
+        self._requests: int = requests
+        self._queued: int = queued
+        self._waiting: int = waiting
+        self._rate_limited: int = rate_limited
+        self._retries: int = retries
+        self._total_wait: float = total_wait
+        self._max_wait: float = max_wait
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(requests={self.requests!r}, queued={self.queued!r}, "
+            f"waiting={self.waiting!r}, rate_limited={self.rate_limited!r}, "
+            f"retries={self.retries!r}, total_wait={self.total_wait!r}, "
+            f"max_wait={self.max_wait!r})"
+        )
+
+    @property
+    def requests(self) -> int:
+        """The amount of requests that passed through the rate limiter."""
+        return self._requests
+
+    @property
+    def queued(self) -> int:
+        """The amount of requests that had to wait before being sent."""
+        return self._queued
+
+    @property
+    def waiting(self) -> int:
+        """The amount of requests currently waiting in the queue."""
+        return self._waiting
+
+    @property
+    def rate_limited(self) -> int:
+        """The amount of responses that came back with a 429 status."""
+        return self._rate_limited
+
+    @property
+    def retries(self) -> int:
+        """The amount of requests that were retried after being rate limited."""
+        return self._retries
+
+    @property
+    def total_wait(self) -> float:
+        """The total time, in seconds, requests spent waiting in the queue."""
+        return self._total_wait
+
+    @property
+    def max_wait(self) -> float:
+        """The longest time, in seconds, a single request spent waiting in the queue."""
+        return self._max_wait
+
+    @property
+    def average_wait(self) -> float:
+        """The average time, in seconds, a request spent waiting in the queue."""
+        return self._total_wait / self._requests if self._requests else 0.0
+
+
+class RateLimiter:
+    """A scheduler queueing requests according to global and per-route rate limits.
+
+    Per-route limits are learned from the `X-RateLimit-*` and `Retry-After` headers
+    of responses, while the optional global bucket limits the client as a whole.
+
+    Attributes
+    ----------
+    max_retries : int
+        How many times a rate limited request is retried before giving up.
+    max_retry_after : float
+        The longest `Retry-After`, in seconds, that is waited out before giving up.
+    stats : RateLimitStats
+        A snapshot of how long requests waited in the queue.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_global_bucket",
+        "_global_lock",
+        "_global_reset_at",
+        "_routes",
+        "_max_retries",
+        "_max_retry_after",
+        "_requests",
+        "_queued",
+        "_waiting",
+        "_rate_limited",
+        "_retries",
+        "_total_wait",
+        "_max_wait",
+    )
+
+    def __init__(
+        self,
+        *,
+        global_rate: float | None = None,
+        global_burst: int | None = None,
+        max_retries: int = 3,
+        max_retry_after: float = 60.0,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        global_rate : float | None
+            Optional, how many requests per second the client may make in total.
+        global_burst : int | None
+            Optional, how many requests may be made at once before `global_rate` applies.
+            Defaults to `global_rate` rounded up.
+        max_retries : int
+            How many times a rate limited request is retried before giving up.
+        max_retry_after : float
+            The longest `Retry-After`, in seconds, that is waited out before giving up.
+        """
+        if max_retries < 0:
+            raise ValueError('Parameter "max_retries" must not be negative')
+
+        self._global_bucket: TokenBucket | None = None
+
+        if global_rate is not None:
+            self._global_bucket = TokenBucket(
+                global_rate,
+                (
+                    global_burst
+                    if global_burst is not None
+                    else max(1, math.ceil(global_rate))
+                ),
+            )
+
+        self._global_lock: asyncio.Lock | None = None
+        self._global_reset_at: float = 0.0
+        self._routes: dict[str, _RouteBucket] = {}
+        self._max_retries: int = max_retries
+        self._max_retry_after: float = max_retry_after
+        self._requests: int = 0
+        self._queued: int = 0
+        self._waiting: int = 0
+        self._rate_limited: int = 0
+        self._retries: int = 0
+        self._total_wait: float = 0.0
+        self._max_wait: float = 0.0
+
+    async def acquire(self, route: str) -> float:
+        """Wait until a request to the given route may be sent.
+
+        Parameters
+        ----------
+        route : str
+            The rate limit bucket of the route, see `ravyapi.api.paths.Route.bucket`.
+
+        Returns
+        -------
+        float
+            How many seconds the request waited in the queue.
+        """
+        bucket = self._routes.get(route)
+
+        if bucket is None:
+            bucket = self._routes[route] = _RouteBucket()
+
+        start = time.monotonic()
+        queued = bucket.lock.locked()
+        self._waiting += 1
+
+        try:
+            async with bucket.lock:
+                while (delay := bucket.delay(time.monotonic())) > 0:
+                    _LOGGER.debug(
+                        "Route %s is rate limited; waiting %.3fs", route, delay
+                    )
+                    queued = True
+                    await asyncio.sleep(delay)
+
+                bucket.consume()
+
+            queued = await self._acquire_global() or queued
+        finally:
+            self._waiting -= 1
+
+        waited = time.monotonic() - start if queued else 0.0
+        self._requests += 1
+        self._total_wait += waited
+
+        if waited > 0:
+            self._queued += 1
+            self._max_wait = max(self._max_wait, waited)
+
+        return waited
+
+    async def _acquire_global(self) -> bool:
+        if self._global_lock is None:
+            self._global_lock = asyncio.Lock()
+
+        queued = self._global_lock.locked()
+
+        async with self._global_lock:
+            while (delay := self._global_reset_at - time.monotonic()) > 0:
+                _LOGGER.debug("Globally rate limited; waiting %.3fs", delay)
+                queued = True
+                await asyncio.sleep(delay)
+
+            if self._global_bucket is not None:
+                delay = self._global_bucket.reserve()
+
+                if delay > 0:
+                    queued = True
+                    await asyncio.sleep(delay)
+
+        return queued
+
+    def update(self, route: str, headers: Mapping[str, str]) -> None:
+        """Update the route's bucket from the rate limit headers of a response.
+
+        Parameters
+        ----------
+        route : str
+            The rate limit bucket of the route, see `ravyapi.api.paths.Route.bucket`.
+        headers : Mapping[str, str]
+            The headers of the response.
+        """
+        bucket = self._routes.get(route)
+
+        if bucket is None:
+            return
+
+        limit = _parse_int(headers.get("X-RateLimit-Limit"))
+        remaining = _parse_int(headers.get("X-RateLimit-Remaining"))
+        reset_at = _parse_reset(headers)
+
+        if limit is not None or remaining is not None or reset_at:
+            bucket.update(limit, remaining, reset_at)
+
+    def rate_limited(
+        self, route: str, headers: Mapping[str, str], attempt: int
+    ) -> float | None:
+        """Register a 429 response and block its bucket until the limit resets.
+
+        Parameters
+        ----------
+        route : str
+            The rate limit bucket of the route, see `ravyapi.api.paths.Route.bucket`.
+        headers : Mapping[str, str]
+            The headers of the response.
+        attempt : int
+            How many times the request has already been retried.
+
+        Returns
+        -------
+        float | None
+            How many seconds until the request may be retried,
+            or `None` if it should not be retried.
+        """
+        self._rate_limited += 1
+        now = time.monotonic()
+        retry_after = _parse_retry_after(headers.get("Retry-After"))
+
+        if retry_after is None:
+            reset_at = _parse_reset(headers)
+            retry_after = reset_at - now if reset_at else 1.0
+
+        retry_after = max(retry_after, 0.0)
+
+        if retry_after > self._max_retry_after:
+            _LOGGER.warning(
+                "Retry-After of %.3fs exceeds the maximum of %.3fs; not retrying",
+                retry_after,
+                self._max_retry_after,
+            )
+            return None
+
+        if headers.get("X-RateLimit-Global", "").lower() == "true":
+            _LOGGER.warning("Globally rate limited for %.3fs", retry_after)
+            self._global_reset_at = max(self._global_reset_at, now + retry_after)
+        else:
+            _LOGGER.warning("Route %s rate limited for %.3fs", route, retry_after)
+            bucket = self._routes.get(route)
+
+            if bucket is None:
+                bucket = self._routes[route] = _RouteBucket()
+
+            bucket.block(now + retry_after)
+
+        if attempt >= self._max_retries:
+            return None
+
+        self._retries += 1
+        return retry_after
+
+    @property
+    def max_retries(self) -> int:
+        """How many times a rate limited request is retried before giving up."""
+        return self._max_retries
+
+    @property
+    def max_retry_after(self) -> float:
+        """The longest `Retry-After`, in seconds, that is waited out before giving up."""
+        return self._max_retry_after
+
+    @property
+    def stats(self) -> RateLimitStats:
+        """A snapshot of how long requests waited in the queue."""
+        return RateLimitStats(
+            self._requests,
+            self._queued,
+            self._waiting,
+            self._rate_limited,
+            self._retries,
+            self._total_wait,
+            self._max_wait,
+        )
+
+
+def _parse_int(value: str | None) -> int | None:
+    if value is None:
+        return None
+
+    try:
+        return int(float(value))
+    except (ValueError, OverflowError):
+        # Not a number, or not a finite one such as `inf`
+        return None
+
+
+def _parse_float(value: str | None) -> float | None:
+    if value is None:
+        return None
+
+    try:
+        parsed = float(value)
+    except ValueError:
+        return None
+
+    return parsed if math.isfinite(parsed) else None
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a `Retry-After` header given either in seconds or as an HTTP date."""
+    if value is None:
+        return None
+
+    seconds = _parse_float(value)
+
+    if seconds is not None:
+        return seconds
+
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    # Dates without a known offset, such as those marked "-0000", are in UTC
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+
+    return date.timestamp() - time.time()
+
+
+def _parse_reset(headers: Mapping[str, str]) -> float:
+    """Parse the reset time of a bucket as a monotonic timestamp, or `0.0` if absent."""
+    now = time.monotonic()
+    reset_after = _parse_float(headers.get("X-RateLimit-Reset-After"))
+
+    if reset_after is not None:
+        return now + reset_after
+
+    reset = _parse_float(headers.get("X-RateLimit-Reset"))
+
+    if reset is None:
+        return 0.0
+
+    # Large values are epoch timestamps, small ones are relative to now
+    if reset > 1e9:
+        return now + (reset - time.time())
+
+    return now + reset
@@ -0,0 +1,199 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Retrying of requests that failed because of transient errors."""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = ("RetryPolicy",)
+
+import logging
+import random
+from typing import Iterable
+
+from typing_extensions import Final
+
+_LOGGER: Final[logging.Logger] = logging.getLogger("ravyapi.retries")
+
+
+class RetryPolicy:
+    """A policy deciding whether and when a failed request is retried.
+
+    Requests are retried after a jittered exponential backoff. Retries are also limited
+    by a budget shared by the whole client: every request deposits `budget_ratio`
+    tokens and every retry withdraws one, so an outage cannot be amplified by retries.
+
+    Attributes
+    ----------
+    max_retries : int
+        How many times a single request is retried at most.
+    backoff_base : float
+        The backoff, in seconds, before the first retry.
+    backoff_max : float
+        The upper bound, in seconds, of the backoff between retries.
+    statuses : frozenset[int]
+        The response statuses which are retried.
+    budget : float
+        The maximum amount of retry tokens the client may accumulate.
+    budget_ratio : float
+        How many retry tokens every request deposits into the budget.
+    retries : int
+        The amount of retries made.
+    exhausted : int
+        The amount of retries denied because the budget was exhausted.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_max_retries",
+        "_backoff_base",
+        "_backoff_max",
+        "_jitter",
+        "_statuses",
+        "_budget",
+        "_budget_ratio",
+        "_tokens",
+        "_retries",
+        "_exhausted",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 10.0,
+        jitter: bool = True,
+        statuses: Iterable[int] = (502, 503, 504),
+        budget: float = 10.0,
+        budget_ratio: float = 0.1,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        max_retries : int
+            How many times a single request is retried at most.
+        backoff_base : float
+            The backoff, in seconds, before the first retry.
+        backoff_max : float
+            The upper bound, in seconds, of the backoff between retries.
+        jitter : bool
+            Whether to randomize the backoff between zero and its exponential value.
+        statuses : Iterable[int]
+            The response statuses which are retried.
+        budget : float
+            The maximum amount of retry tokens the client may accumulate.
+        budget_ratio : float
+            How many retry tokens every request deposits into the budget.
+        """
+        if max_retries < 0:
+            raise ValueError('Parameter "max_retries" must not be negative')
+
+        if backoff_base < 0 or backoff_max < 0:
+            raise ValueError(
+                'Parameters "backoff_base" and "backoff_max" must not be negative'
+            )
+
+        if budget < 0 or budget_ratio < 0:
+            raise ValueError(
+                'Parameters "budget" and "budget_ratio" must not be negative'
+            )
+
+        self._max_retries: int = max_retries
+        self._backoff_base: float = backoff_base
+        self._backoff_max: float = backoff_max
+        self._jitter: bool = jitter
+        self._statuses: frozenset[int] = frozenset(statuses)
+        self._budget: float = budget
+        self._budget_ratio: float = budget_ratio
+        self._tokens: float = budget
+        self._retries: int = 0
+        self._exhausted: int = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(max_retries={self.max_retries!r}, backoff_base={self.backoff_base!r}, "
+            f"backoff_max={self.backoff_max!r}, budget={self.budget!r}, "
+            f"retries={self.retries!r}, exhausted={self.exhausted!r})"
+        )
+
+    def deposit(self) -> None:
+        """Deposit the retry tokens earned by making a request into the budget."""
+        self._tokens = min(self._budget, self._tokens + self._budget_ratio)
+
+    def backoff(self, attempt: int) -> float | None:
+        """Get the backoff before retrying a failed request, withdrawing from the budget.
+
+        Parameters
+        ----------
+        attempt : int
+            How many times the request has already been retried.
+
+        Returns
+        -------
+        float | None
+            How many seconds to wait before retrying, or `None` if it should not be retried.
+        """
+        if attempt >= self._max_retries:
+            return None
+
+        if self._tokens < 1:
+            _LOGGER.warning("Retry budget is exhausted; not retrying")
+            self._exhausted += 1
+            return None
+
+        self._tokens -= 1
+        self._retries += 1
+        delay = min(self._backoff_max, self._backoff_base * 2**attempt)
+
+        return random.uniform(0, delay) if self._jitter else delay
+
+    @property
+    def max_retries(self) -> int:
+        """How many times a single request is retried at most."""
+        return self._max_retries
+
+    @property
+    def backoff_base(self) -> float:
+        """The backoff, in seconds, before the first retry."""
+        return self._backoff_base
+
+    @property
+    def backoff_max(self) -> float:
+        """The upper bound, in seconds, of the backoff between retries."""
+        return self._backoff_max
+
+    @property
+    def statuses(self) -> frozenset[int]:
+        """The response statuses which are retried."""
+        return self._statuses
+
+    @property
+    def budget(self) -> float:
+        """The maximum amount of retry tokens the client may accumulate."""
+        return self._budget
+
+    @property
+    def budget_ratio(self) -> float:
+        """How many retry tokens every request deposits into the budget."""
+        return self._budget_ratio
+
+    @property
+    def retries(self) -> int:
+        """The amount of retries made."""
+        return self._retries
+
+    @property
+    def exhausted(self) -> int:
+        """The amount of retries denied because the budget was exhausted."""
+        return self._exhausted
@@ -0,0 +1,317 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Screening of message text for fraudulent URLs."""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = ("MessageVerdict", "URLScreener")
+
+import asyncio
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, AsyncIterable, AsyncIterator, Iterable
+
+from typing_extensions import Final
+
+from ravyapi.api.models import GetWebsiteResponse
+from ravyapi.cache import ResponseCache
+from ravyapi.links import canonicalize_url, extract_urls
+from ravyapi.utils import gather_bounded
+
+if TYPE_CHECKING:
+    from ravyapi.api.endpoints import URLs
+
+_LOGGER: Final[logging.Logger] = logging.getLogger("ravyapi.screening")
+
+
+class MessageVerdict:
+    """The result of screening the URLs in a message.
+
+    Attributes
+    ----------
+    content : str
+        The text of the message.
+    urls : dict[str, GetWebsiteResponse | Exception]
+        The response of every URL in the message, or the exception raised looking it up.
+    is_fraudulent : bool
+        Whether any URL in the message is fraudulent.
+    fraudulent_urls : list[str]
+        The URLs in the message that are fraudulent.
+    """
+
+    __slots__: tuple[str, ...] = ("_content", "_urls")
+
+    def __init__(
+        self, content: str, urls: dict[str, GetWebsiteResponse | Exception]
+    ) -> None:
+        self._content: str = content
+        self._urls: dict[str, GetWebsiteResponse | Exception] = urls
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(is_fraudulent={self.is_fraudulent!r}, "
+            f"fraudulent_urls={self.fraudulent_urls!r})"
+        )
+
+    @property
+    def content(self) -> str:
+        """The text of the message."""
+        return self._content
+
+    @property
+    def urls(self) -> dict[str, GetWebsiteResponse | Exception]:
+        """The response of every URL in the message, or the exception raised looking it up."""
+        return self._urls
+
+    @property
+    def is_fraudulent(self) -> bool:
+        """Whether any URL in the message is fraudulent."""
+        return any(
+            isinstance(result, GetWebsiteResponse) and result.is_fraudulent
+            for result in self._urls.values()
+        )
+
+    @property
+    def fraudulent_urls(self) -> list[str]:
+        """The URLs in the message that are fraudulent."""
+        return [
+            url
+            for url, result in self._urls.items()
+            if isinstance(result, GetWebsiteResponse) and result.is_fraudulent
+        ]
+
+
+class URLScreener:
+    """A pipeline screening the URLs in messages with `ravyapi.api.endpoints.urls.URLs.get_website`.
+
+    URLs are extracted with `ravyapi.links.extract_urls` and canonicalized with
+    `ravyapi.links.canonicalize_url`. Every canonical URL is looked up once and its
+    verdict is cached, so a link pasted in many messages costs one request.
+
+    Attributes
+    ----------
+    cache : ResponseCache
+        The cache of verdicts by canonical URL.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_urls",
+        "_phisherman_user",
+        "_concurrency",
+        "_cache",
+    )
+
+    def __init__(
+        self,
+        urls: URLs,
+        *,
+        phisherman_user: int | None = None,
+        concurrency: int = 10,
+        max_size: int = 4096,
+        ttl: float = 300.0,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        urls : URLs
+            The `urls` endpoint to look URLs up with, usually `ravyapi.client.Client.urls`.
+        phisherman_user : int | None
+            Optional, required if `ravyapi.client.Client.set_phisherman_token` is called, Discord user ID of the token owner.
+        concurrency : int
+            The maximum amount of lookups running at once.
+        max_size : int
+            The maximum amount of cached verdicts.
+        ttl : float
+            The time to live, in seconds, of cached verdicts.
+        """
+        if concurrency < 1:
+            raise ValueError('Parameter "concurrency" must be at least 1')
+
+        self._urls: URLs = urls
+        self._phisherman_user: int | None = phisherman_user
+        self._concurrency: int = concurrency
+        self._cache: ResponseCache = ResponseCache(
+            max_size=max_size, ttls={"urls": ttl}, negative_ttls={}
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(concurrency={self._concurrency!r}, cache={self.cache!r})"
+        )
+
+    async def _lookup(self, url: str) -> GetWebsiteResponse:
+        verdict = await self._urls.get_website(
+            url, phisherman_user=self._phisherman_user, mode="model"
+        )
+        self._cache.set(url, verdict, "urls", url)
+        return verdict
+
+    def _resolve(self, contents: Iterable[str]) -> tuple[
+        list[tuple[str, dict[str, str]]],
+        dict[str, GetWebsiteResponse | Exception],
+        list[str],
+    ]:
+        """Extract the URLs of messages and answer what is cached.
+
+        Returns the messages with their URLs mapped to canonical URLs, the cached
+        verdicts, and the canonical URLs which still have to be looked up.
+        """
+        messages: list[tuple[str, dict[str, str]]] = []
+        canonical: dict[str, str] = {}
+
+        for content in contents:
+            found: dict[str, str] = {}
+
+            for url in extract_urls(content):
+                if url not in found:
+                    if url not in canonical:
+                        canonical[url] = canonicalize_url(url)
+
+                    found[url] = canonical[url]
+
+            messages.append((content, found))
+
+        results: dict[str, GetWebsiteResponse | Exception] = {}
+        missing: list[str] = []
+
+        for target in dict.fromkeys(canonical.values()):
+            cached: GetWebsiteResponse | None = self._cache.get(target)
+
+            if cached is None:
+                missing.append(target)
+            else:
+                results[target] = cached
+
+        return messages, results, missing
+
+    async def _complete(
+        self,
+        messages: list[tuple[str, dict[str, str]]],
+        results: dict[str, GetWebsiteResponse | Exception],
+        missing: list[str],
+    ) -> list[MessageVerdict]:
+        if missing:
+            results.update(
+                await gather_bounded(
+                    self._lookup, missing, concurrency=self._concurrency
+                )
+            )
+
+        _LOGGER.debug(
+            "Screened %s messages, looking up %s of %s distinct URLs",
+            len(messages),
+            len(missing),
+            len(results),
+        )
+
+        return [
+            MessageVerdict(
+                content, {url: results[target] for url, target in found.items()}
+            )
+            for content, found in messages
+        ]
+
+    async def screen(self, content: str) -> MessageVerdict:
+        """Screen the URLs in a message.
+
+        Parameters
+        ----------
+        content : str
+            The text of the message.
+
+        Returns
+        -------
+        MessageVerdict
+            The verdicts of the URLs in the message.
+        """
+        return (await self._complete(*self._resolve((content,))))[0]
+
+    async def screen_many(self, contents: Iterable[str]) -> list[MessageVerdict]:
+        """Screen the URLs in many messages, looking up every distinct URL once.
+
+        Parameters
+        ----------
+        contents : Iterable[str]
+            The texts of the messages.
+
+        Returns
+        -------
+        list[MessageVerdict]
+            The verdicts of the URLs in every message, in the order they were given.
+        """
+        return await self._complete(*self._resolve(contents))
+
+    async def screen_stream(
+        self, contents: AsyncIterable[str], *, window: int = 100
+    ) -> AsyncIterator[MessageVerdict]:
+        """Screen the URLs in a stream of messages, yielding verdicts in order.
+
+        Messages are screened as they arrive, up to `window` at once. A URL repeated in
+        messages screened at once is still looked up once, as identical requests in
+        flight are shared by `ravyapi.http.HTTPClient`.
+
+        Parameters
+        ----------
+        contents : AsyncIterable[str]
+            The texts of the messages.
+        window : int
+            The maximum amount of messages screened at once.
+
+        Yields
+        ------
+        MessageVerdict
+            The verdicts of the URLs in every message, in the order they were received.
+        """
+        if window < 1:
+            raise ValueError('Parameter "window" must be at least 1')
+
+        loop = asyncio.get_running_loop()
+        pending: deque[asyncio.Future[list[MessageVerdict]]] = deque()
+
+        try:
+            async for content in contents:
+                messages, results, missing = self._resolve((content,))
+
+                if missing:
+                    future = asyncio.ensure_future(
+                        self._complete(messages, results, missing)
+                    )
+                elif pending:
+                    # Answered from the cache, but must wait for the messages before it
+                    future = loop.create_future()
+                    future.set_result(await self._complete(messages, results, []))
+                else:
+                    yield (await self._complete(messages, results, []))[0]
+                    continue
+
+                pending.append(future)
+
+                if len(pending) >= window:
+                    yield (await pending.popleft())[0]
+
+                while pending and pending[0].done():
+                    yield pending.popleft().result()[0]
+
+            while pending:
+                yield (await pending.popleft())[0]
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @property
+    def cache(self) -> ResponseCache:
+        """The cache of verdicts by canonical URL."""
+        return self._cache
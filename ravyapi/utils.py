@@ -15,10 +15,30 @@
 
 from __future__ import annotations
 
-__all__: tuple[str, ...] = ("with_permission_check",)
+__all__: tuple[str, ...] = (
+    "PermissionSet",
+    "copy_json",
+    "gather_bounded",
+    "iterate_bounded",
+    "with_permission_check",
+)
 
+import asyncio
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Coroutine,
+    Hashable,
+    Iterable,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from typing_extensions import Concatenate, ParamSpec, TypeAlias
 
@@ -36,14 +56,153 @@ if TYPE_CHECKING:
     ]
 
 
-def has_permissions(required: str, permissions: list[str]) -> bool:
+_KeyT = TypeVar("_KeyT", bound=Hashable)
+_ResultT = TypeVar("_ResultT")
+
+
+async def iterate_bounded(
+    function: Callable[[_KeyT], Awaitable[_ResultT]],
+    keys: Iterable[_KeyT],
+    *,
+    concurrency: int,
+) -> AsyncIterator[tuple[_KeyT, Union[_ResultT, Exception]]]:
+    """Call a coroutine function for every unique key, yielding results as they complete.
+
+    Keys are consumed lazily and at most `concurrency` calls run at once, so only the
+    calls in progress and their results are held in memory, along with every distinct
+    key seen so far for deduplication. A call raising an exception does not stop the
+    others; the exception is yielded as its result instead.
+
+    Parameters
+    ----------
+    function : Callable[[_KeyT], Awaitable[_ResultT]]
+        The coroutine function to call with every key.
+    keys : Iterable[_KeyT]
+        The keys to call the function with. Duplicates are only called once.
+    concurrency : int
+        The maximum amount of calls running at once.
+
+    Raises
+    ------
+    ValueError
+        If `concurrency` is less than 1.
+
+    Yields
+    ------
+    tuple[_KeyT, _ResultT | Exception]
+        Every unique key and its result, or the exception raised for it.
+    """
+    if concurrency < 1:
+        raise ValueError('Parameter "concurrency" must be at least 1')
+
+    seen: set[_KeyT] = set()
+    iterator = iter(keys)
+    pending: dict[asyncio.Future[_ResultT], _KeyT] = {}
+
+    def schedule() -> None:
+        while len(pending) < concurrency:
+            for key in iterator:
+                if key not in seen:
+                    break
+            else:
+                return
+
+            seen.add(key)
+            pending[asyncio.ensure_future(function(key))] = key
+
+    try:
+        schedule()
+
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            for future in done:
+                key = pending.pop(future)
+                exc = future.exception()
+
+                if exc is not None and not isinstance(exc, Exception):
+                    raise exc
+
+                yield key, exc if exc is not None else future.result()
+
+            schedule()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def gather_bounded(
+    function: Callable[[_KeyT], Awaitable[_ResultT]],
+    keys: Iterable[_KeyT],
+    *,
+    concurrency: int,
+) -> dict[_KeyT, Union[_ResultT, Exception]]:
+    """Call a coroutine function for every unique key, with bounded concurrency.
+
+    Parameters
+    ----------
+    function : Callable[[_KeyT], Awaitable[_ResultT]]
+        The coroutine function to call with every key.
+    keys : Iterable[_KeyT]
+        The keys to call the function with. Duplicates are only called once.
+    concurrency : int
+        The maximum amount of calls running at once.
+
+    Raises
+    ------
+    ValueError
+        If `concurrency` is less than 1.
+
+    Returns
+    -------
+    dict[_KeyT, _ResultT | Exception]
+        The result of every unique key, or the exception raised for it,
+        in the order the keys were given.
+    """
+    unique = list(dict.fromkeys(keys))
+    results: dict[_KeyT, Union[_ResultT, Exception]] = {}
+
+    async for key, result in iterate_bounded(function, unique, concurrency=concurrency):
+        results[key] = result
+
+    return {key: results[key] for key in unique}
+
+
+def copy_json(value: Any) -> Any:
+    """Copy decoded JSON, so it can be changed without changing cached responses.
+
+    Only objects and arrays are copied, as the other JSON values are immutable,
+    which makes this considerably faster than `copy.deepcopy`.
+
+    Parameters
+    ----------
+    value : Any
+        The decoded JSON.
+
+    Returns
+    -------
+    Any
+        The copy of the decoded JSON.
+    """
+    if type(value) is dict:
+        return {
+            key: copy_json(item) for key, item in cast("dict[str, Any]", value).items()
+        }
+
+    if type(value) is list:
+        return [copy_json(item) for item in cast("list[Any]", value)]
+
+    return value
+
+
+def has_permissions(required: str, permissions: Collection[str]) -> bool:
     """Check whether the required permissions match a list of permissions.
 
     Parameters
     ----------
     required : str
         The required permissions.
-    permissions : list[str]
+    permissions : Collection[str]
         The list of permissions.
 
     Returns
@@ -61,6 +220,53 @@ def has_permissions(required: str, permissions: list[str]) -> bool:
     return False
 
 
+class PermissionSet:
+    """A compiled set of permission nodes of a token.
+
+    Checking whether a permission is granted walks its parent nodes only the first time;
+    afterwards the result is answered by a single dictionary lookup.
+
+    Attributes
+    ----------
+    nodes : frozenset[str]
+        The permission nodes granted to the token.
+    """
+
+    __slots__: tuple[str, ...] = ("_nodes", "_granted")
+
+    def __init__(self, nodes: Iterable[str]) -> None:
+        """
+        Parameters
+        ----------
+        nodes : Iterable[str]
+            The permission nodes granted to the token.
+        """
+        self._nodes: frozenset[str] = frozenset(nodes)
+        self._granted: dict[str, bool] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(nodes={sorted(self.nodes)!r})"
+        )
+
+    def __contains__(self, required: object) -> bool:
+        if not isinstance(required, str):
+            return False
+
+        granted = self._granted.get(required)
+
+        if granted is None:
+            granted = self._granted[required] = has_permissions(required, self._nodes)
+
+        return granted
+
+    @property
+    def nodes(self) -> frozenset[str]:
+        """The permission nodes granted to the token."""
+        return self._nodes
+
+
 def with_permission_check(
     required: str,
 ) -> Callable[
@@ -89,14 +295,18 @@ def with_permission_check(
         async def wrapper(
             self: HTTPAwareEndpoint, *args: _EndpointP.args, **kwargs: _EndpointP.kwargs
         ) -> _EndpointR:
-            await self._http.get_permissions()
+            permissions = self._http.permission_set
+
+            if permissions is None or self._http.permissions_expired:
+                await self._http.get_permissions()
+                permissions = self._http.permission_set
 
-            if self._http.permissions is None:
+            if permissions is None:
                 raise AssertionError(
                     'Permissions is "None"; were permissions not yet fetched or unexpectedly modified?'
                 )
 
-            if not has_permissions(required, self._http.permissions):
+            if required not in permissions:
                 raise AccessError(required)
 
             return await function(self, *args, **kwargs)
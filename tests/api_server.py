@@ -0,0 +1,96 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A stand-in Ravy API server shared by the tests of `ravyapi.http`."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Union
+
+from aiohttp import web
+
+from ravyapi.api.paths import Route
+
+TOKEN = f"{'A' * 24}.{'a' * 64}"
+
+USER: dict[str, Any] = {
+    "pronouns": "they/them",
+    "trust": {"level": 3, "label": "no data"},
+    "whitelists": [],
+    "bans": [],
+    "rep": [],
+    "sentinel": {"verified": False, "id": "1"},
+}
+
+Handler = Callable[
+    [web.Request], Union[web.StreamResponse, Awaitable[web.StreamResponse]]
+]
+
+
+class APIServer:
+    """A stand-in Ravy API server answering requests with the handlers of paths."""
+
+    def __init__(self) -> None:
+        self.handlers: dict[str, Handler] = {}
+        self.hits: dict[str, int] = {}
+        self.url = ""
+        self._runner: web.AppRunner | None = None
+
+    async def __aenter__(self) -> APIServer:
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.url = f"http://127.0.0.1:{self._runner.addresses[0][1]}"
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        assert self._runner is not None
+        await self._runner.cleanup()
+
+    def route(self, name: str, template: str) -> Route:
+        """Get a route of the endpoint on this server."""
+        return Route(name, template, base_url=self.url)
+
+    def json(self, path: str, data: Any, status: int = 200, **headers: str) -> None:
+        """Answer requests to the path with JSON."""
+        self.handlers[path] = lambda request: web.json_response(
+            data, status=status, headers=headers
+        )
+
+    def not_found(self, path: str, *, delay: float = 0.0) -> None:
+        """Answer requests to the path with a 404, after the delay."""
+
+        async def handle(request: web.Request) -> web.StreamResponse:
+            await asyncio.sleep(delay)
+            return web.json_response({"error": "Not Found"}, status=404)
+
+        self.handlers[path] = handle
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        path = f"/{request.match_info['path']}"
+        self.hits[path] = self.hits.get(path, 0) + 1
+        handler = self.handlers.get(path)
+
+        if handler is None:
+            return web.json_response({"error": "Not Found"}, status=404)
+
+        response = handler(request)
+
+        if not isinstance(response, web.StreamResponse):
+            response = await response
+
+        return response
@@ -0,0 +1,363 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for `ravyapi.cache` and the caching of responses by the HTTP client."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from aiohttp import web
+
+from ravyapi.api.errors import NotFoundError
+from ravyapi.cache import DiskCache, ResponseCache
+from ravyapi.http import HTTPClient
+from tests.api_server import TOKEN, USER, APIServer
+
+
+class TestResponseCache(unittest.IsolatedAsyncioTestCase):
+    def test_responses_expire(self) -> None:
+        cache = ResponseCache(ttls={"users": 0.01})
+        cache.set("a", {"a": 1}, "users")
+
+        self.assertEqual(cache.get("a"), {"a": 1})
+        time.sleep(0.02)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (1, 1))
+
+    def test_sub_endpoints_fall_back_to_their_parent(self) -> None:
+        cache = ResponseCache(ttls={"users": 60, "urls": 0})
+
+        self.assertEqual(cache.ttl_for("users.bans"), 60)
+        self.assertIsNone(cache.ttl_for("urls"))
+        self.assertIsNone(cache.ttl_for("guilds"))
+
+        cache.set("a", {}, "urls")
+        self.assertEqual(len(cache), 0)
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        cache = ResponseCache(max_size=2)
+        cache.set("a", 1, "users")
+        cache.set("b", 2, "users")
+        cache.get("a")
+        cache.set("c", 3, "users")
+
+        self.assertEqual([cache.get(key) for key in "abc"], [1, None, 3])
+        self.assertEqual(cache.stats.evictions, 1)
+
+    async def test_invalidate(self) -> None:
+        cache = ResponseCache()
+        cache.set("a", 1, "users", "1")
+        cache.set("b", 2, "users.bans", "1")
+        cache.set("c", 3, "users", "2")
+        cache.set("d", 4, "guilds", "1")
+
+        self.assertEqual(await cache.invalidate("users", 1), 2)
+        self.assertEqual([cache.get(key) for key in "abcd"], [None, None, 3, 4])
+        self.assertEqual(await cache.invalidate(), 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_not_found_results_are_raised_again(self) -> None:
+        cache = ResponseCache(negative_ttls={"users": 0.01})
+        cache.set_not_found("a", NotFoundError({"error": "Not Found"}), "users")
+
+        with self.assertRaises(NotFoundError) as context:
+            cache.get("a")
+
+        self.assertEqual(context.exception.exc_data, {"error": "Not Found"})
+        self.assertIsNone(cache.peek("a"))
+        time.sleep(0.02)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual((cache.stats.negative_hits, cache.stats.misses), (1, 1))
+
+    def test_not_found_results_without_ttl_are_not_cached(self) -> None:
+        cache = ResponseCache(negative_ttls={"users": 15})
+        cache.set_not_found("a", NotFoundError({}), "guilds")
+
+        self.assertEqual(len(cache), 0)
+
+    def test_parameters_are_validated(self) -> None:
+        with self.assertRaises(ValueError):
+            ResponseCache(max_size=0)
+
+        with self.assertRaises(ValueError):
+            ResponseCache(policy="lfu")  # type: ignore[arg-type]
+
+
+class TestRevalidation(unittest.IsolatedAsyncioTestCase):
+    async def test_stale_responses_are_refreshed_once(self) -> None:
+        cache = ResponseCache(ttls={"urls": 0.01}, stale_ttls={"urls": 0.05})
+        cache.set("a", {"a": 1}, "urls")
+        await asyncio.sleep(0.02)
+
+        # Only callers able to refresh it are answered with a stale response
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(await cache.lookup("a"), ({"a": 1}, True))
+        self.assertEqual(await cache.lookup("a"), ({"a": 1}, False))
+
+        cache.refresh_failed("a")
+        self.assertEqual(await cache.lookup("a"), ({"a": 1}, True))
+        self.assertEqual((cache.stats.stale_hits, cache.stats.refreshes), (3, 2))
+
+        await asyncio.sleep(0.05)
+        self.assertEqual(await cache.lookup("a"), (None, False))
+
+    async def test_responses_hit_often_are_refreshed_ahead(self) -> None:
+        cache = ResponseCache(
+            ttls={"urls": 0.05}, refresh_ahead=0.2, refresh_ahead_hits=2
+        )
+        cache.set("a", {"a": 1}, "urls")
+        await asyncio.sleep(0.02)
+
+        self.assertEqual(await cache.lookup("a"), ({"a": 1}, False))
+        self.assertEqual(await cache.lookup("a"), ({"a": 1}, True))
+        self.assertEqual(await cache.lookup("a"), ({"a": 1}, False))
+
+    def test_refresh_ahead_is_validated(self) -> None:
+        with self.assertRaises(ValueError):
+            ResponseCache(refresh_ahead=1)
+
+    async def test_stale_responses_are_refreshed_in_the_background(self) -> None:
+        async with APIServer() as server:
+            versions = iter(range(2))
+            server.handlers["/urls"] = lambda request: web.json_response(
+                {"version": next(versions)}
+            )
+            route = server.route("urls", "/urls")
+            cache = ResponseCache(ttls={"urls": 0.01}, stale_ttls={"urls": 60})
+            http = HTTPClient(TOKEN, cache=cache)
+
+            await http.get(route)
+            await asyncio.sleep(0.02)
+
+            self.assertEqual(await http.get(route), {"version": 0})
+            await asyncio.sleep(0.05)
+            self.assertEqual(await http.get(route), {"version": 1})
+            self.assertEqual(server.hits, {"/urls": 2})
+            await http.close()
+
+
+class TestCachedRequests(unittest.IsolatedAsyncioTestCase):
+    async def test_responses_are_answered_from_cache(self) -> None:
+        async with APIServer() as server:
+            server.json("/users/1", USER)
+            route = server.route("users", "/users/{}")
+            cache = ResponseCache()
+            http = HTTPClient(TOKEN, cache=cache)
+
+            self.assertEqual(await http.get(route, 1), USER)
+            self.assertEqual(await http.get(route, 1), USER)
+            self.assertEqual(server.hits, {"/users/1": 1})
+
+            # Invalidated responses are requested again
+            await http.invalidate("users", 1)
+            await http.get(route, 1)
+            self.assertEqual(server.hits, {"/users/1": 2})
+            await http.close()
+
+    async def test_not_found_is_answered_from_cache(self) -> None:
+        async with APIServer() as server:
+            route = server.route("users", "/users/{}")
+            http = HTTPClient(TOKEN, cache=ResponseCache())
+
+            for _ in range(2):
+                with self.assertRaises(NotFoundError):
+                    await http.get(route, 1)
+
+            self.assertEqual(server.hits, {"/users/1": 1})
+            await http.close()
+
+    async def test_uncached_endpoints_are_requested(self) -> None:
+        async with APIServer() as server:
+            server.json("/users/1", USER)
+            route = server.route("users", "/users/{}")
+            http = HTTPClient(TOKEN, cache=ResponseCache(ttls={}))
+
+            await http.get(route, 1)
+            await http.get(route, 1)
+            self.assertEqual(server.hits, {"/users/1": 2})
+            await http.close()
+
+
+class TestTinyLFU(unittest.TestCase):
+    def fill_then_scan(self, cache: ResponseCache) -> int:
+        for key in range(50):
+            cache.set(key, key, "users")
+
+            for _ in range(3):
+                cache.get(key)
+
+        # A bulk scan of keys looked up once, as made when checking many users
+        for key in range(1000, 2000):
+            if cache.get(key) is None:
+                cache.set(key, key, "users")
+
+        return sum(cache.get(key) is not None for key in range(50))
+
+    def test_scans_do_not_evict_popular_responses(self) -> None:
+        self.assertEqual(self.fill_then_scan(ResponseCache(max_size=100)), 0)
+        self.assertEqual(
+            self.fill_then_scan(ResponseCache(max_size=100, policy="tinylfu")), 50
+        )
+
+    def test_popular_new_responses_are_admitted(self) -> None:
+        cache = ResponseCache(max_size=10, policy="tinylfu")
+
+        for key in range(10):
+            cache.set(key, key, "users")
+
+        for _ in range(5):
+            cache.get("new")
+
+        cache.set("new", "new", "users")
+        # Leaves the window, and is admitted over a key looked up less often
+        cache.set("other", "other", "users")
+
+        self.assertEqual(cache.get("new"), "new")
+        self.assertEqual(len(cache), 10)
+
+    def test_size_is_bounded(self) -> None:
+        for max_size in (1, 2, 50):
+            with self.subTest(max_size=max_size):
+                cache = ResponseCache(max_size=max_size, policy="tinylfu")
+
+                for key in range(200):
+                    cache.get(key % 17)
+                    cache.set(key, key, "users")
+
+                self.assertEqual(len(cache), max_size)
+                self.assertEqual(cache.stats.evictions, 200 - max_size)
+
+
+class TestDiskCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache.db")
+
+    async def test_responses_survive_restarts(self) -> None:
+        async with APIServer() as server:
+            server.json("/users/1", USER)
+            route = server.route("users", "/users/{}")
+
+            caches = [ResponseCache(disk=DiskCache(self.path)) for _ in range(2)]
+
+            for cache in caches:
+                http = HTTPClient(TOKEN, cache=cache)
+                self.assertEqual(await http.get(route, 1), USER)
+                await http.close()
+
+            # The second client answered from disk, promoting the response to memory
+            cache = caches[1]
+            self.assertEqual(server.hits, {"/users/1": 1})
+            self.assertEqual((cache.stats.disk_hits, cache.stats.misses), (1, 0))
+            self.assertEqual(len(cache), 1)
+
+    async def test_promoted_responses_expire_with_the_memory_ttl(self) -> None:
+        disk = DiskCache(self.path, ttls={"users": 60})
+        cache = ResponseCache(ttls={"users": 0.01}, disk=disk)
+        cache.set("a", {"a": 1}, "users")
+        await asyncio.sleep(0.02)
+
+        self.assertEqual(await cache.lookup("a"), ({"a": 1}, False))
+        await asyncio.sleep(0.02)
+        self.assertIsNone(cache.get("a"))
+        disk.close()
+
+    async def test_not_found_results_survive_restarts(self) -> None:
+        cache = ResponseCache(disk=DiskCache(self.path))
+        cache.set_not_found("a", NotFoundError({"error": "Not Found"}), "users")
+        cache.close()
+        cache = ResponseCache(disk=DiskCache(self.path))
+
+        with self.assertRaises(NotFoundError):
+            await cache.lookup("a")
+
+        cache.close()
+
+    async def test_disk_is_not_used_on_the_event_loop_thread(self) -> None:
+        disk = DiskCache(self.path, compaction_interval=0.01)
+        statements: list[str] = []
+        loop_thread = threading.get_ident()
+        disk._connection.set_trace_callback(
+            lambda statement: (
+                statements.append(statement)
+                if threading.get_ident() == loop_thread
+                else None
+            )
+        )
+        cache = ResponseCache(disk=disk)
+
+        cache.set("a", {"a": 1}, "users", "1")
+        cache.set("b", {"b": 2}, "users", "2")
+        await asyncio.sleep(0.05)
+        # Dropped from memory, so the lookup reads the disk
+        cache._entries.clear()
+
+        self.assertEqual(await cache.lookup("a"), ({"a": 1}, False))
+        self.assertEqual(await cache.invalidate("users", 2), 1)
+        self.assertEqual(statements, [])
+        disk.close()
+
+    async def test_invalidate_removes_pending_responses(self) -> None:
+        disk = DiskCache(self.path)
+        cache = ResponseCache(disk=disk)
+        cache.set("a", {"a": 1}, "users", "1")
+
+        self.assertEqual(await cache.invalidate("users", 1), 1)
+        self.assertEqual(len(disk), 0)
+        disk.close()
+
+    def test_compact(self) -> None:
+        disk = DiskCache(self.path, max_size=2, ttls={"users": 0.01, "guilds": 60})
+        cache = ResponseCache(disk=disk)
+        cache.set("a", {}, "users")
+
+        for key in "bcd":
+            cache.set(key, {}, "guilds")
+
+        time.sleep(0.02)
+        self.assertEqual(disk.compact(), 2)
+        self.assertEqual(len(disk), 2)
+        disk.close()
+
+    def test_closed_cache_does_nothing(self) -> None:
+        disk = DiskCache(self.path)
+        cache = ResponseCache(disk=disk)
+        cache.set("a", {}, "users")
+        cache.close()
+
+        cache.clear()
+        self.assertEqual(disk.compact(), 0)
+        self.assertEqual(len(disk), 0)
+        # Responses written before closing are kept
+        disk = DiskCache(self.path)
+        self.assertEqual(len(disk), 1)
+        disk.close()
+
+    def test_tokens_are_not_written(self) -> None:
+        disk = DiskCache(self.path)
+        ResponseCache(disk=disk).set(("/urls", (("token", "secret"),)), {}, "urls")
+        disk.close()
+
+        with open(self.path, "rb") as file:
+            self.assertNotIn(b"secret", file.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
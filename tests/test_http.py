@@ -0,0 +1,202 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the sharing of requests by `ravyapi.http.HTTPClient`."""
+
+from __future__ import annotations
+
+import asyncio
+import unittest
+from typing import Any
+
+from aiohttp import web
+
+from ravyapi.api.errors import NotFoundError
+from ravyapi.cache import ResponseCache
+from ravyapi.http import HTTPClient
+from tests.api_server import TOKEN, USER, APIServer
+
+
+class TestCoalescing(unittest.IsolatedAsyncioTestCase):
+    async def test_identical_requests_are_shared(self) -> None:
+        async with APIServer() as server:
+
+            async def slow(request: web.Request) -> web.StreamResponse:
+                await asyncio.sleep(0.05)
+                return web.json_response(USER)
+
+            server.handlers["/users/1"] = slow
+            route = server.route("users", "/users/{}")
+            http = HTTPClient(TOKEN)
+
+            responses = await asyncio.gather(*(http.get(route, 1) for _ in range(5)))
+
+            self.assertEqual(responses, [USER] * 5)
+            self.assertEqual(server.hits, {"/users/1": 1})
+            self.assertEqual(http.coalesced, 4)
+
+            # Finished requests are not shared with later ones
+            await http.get(route, 1)
+            self.assertEqual(server.hits, {"/users/1": 2})
+            await http.close()
+
+    async def test_different_parameters_are_not_shared(self) -> None:
+        async with APIServer() as server:
+            server.json("/urls", {"isFraudulent": False, "message": ""})
+            route = server.route("urls", "/urls")
+            http = HTTPClient(TOKEN)
+
+            await asyncio.gather(
+                http.get(route, params={"url": "a.com"}),
+                http.get(route, params={"url": "b.com"}),
+            )
+
+            self.assertEqual(server.hits, {"/urls": 2})
+            self.assertEqual(http.coalesced, 0)
+            await http.close()
+
+    async def test_errors_reach_every_caller(self) -> None:
+        async with APIServer() as server:
+            server.not_found("/users/1", delay=0.05)
+            route = server.route("users", "/users/{}")
+            http = HTTPClient(TOKEN)
+
+            results = await asyncio.gather(
+                *(http.get(route, 1) for _ in range(3)), return_exceptions=True
+            )
+
+            self.assertTrue(all(isinstance(exc, NotFoundError) for exc in results))
+            self.assertEqual(server.hits, {"/users/1": 1})
+            await http.close()
+
+    async def test_cancelled_caller_does_not_cancel_others(self) -> None:
+        async with APIServer() as server:
+
+            async def slow(request: web.Request) -> web.StreamResponse:
+                await asyncio.sleep(0.05)
+                return web.json_response(USER)
+
+            server.handlers["/users/1"] = slow
+            route = server.route("users", "/users/{}")
+            http = HTTPClient(TOKEN)
+
+            first = asyncio.ensure_future(http.get(route, 1))
+            second = asyncio.ensure_future(http.get(route, 1))
+            await asyncio.sleep(0.01)
+            first.cancel()
+
+            self.assertEqual(await second, USER)
+            self.assertEqual(server.hits, {"/users/1": 1})
+            await http.close()
+
+
+def bans(user: dict[str, Any]) -> dict[str, Any]:
+    return {"trust": user["trust"], "bans": user["bans"]}
+
+
+def pronouns(user: dict[str, Any]) -> dict[str, Any]:
+    return {"pronouns": user["pronouns"]}
+
+
+class TestParts(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.server = await APIServer().__aenter__()
+        self.whole = self.server.route("users", "/users/{}")
+        self.bans = self.server.route("users.bans", "/users/{}/bans")
+        self.pronouns = self.server.route("users.pronouns", "/users/{}/pronouns")
+        self.server.json("/users/1/bans", bans(USER))
+        self.server.json("/users/1/pronouns", pronouns(USER))
+
+    async def asyncTearDown(self) -> None:
+        await self.server.__aexit__()
+
+    async def test_parts_are_taken_from_cached_users(self) -> None:
+        self.server.json("/users/1", USER)
+        http = HTTPClient(TOKEN, cache=ResponseCache())
+        await http.get(self.whole, 1)
+
+        part = await http.get_part(self.bans, 1, whole=self.whole, part=bans)
+
+        self.assertEqual(part, bans(USER))
+        self.assertEqual(self.server.hits, {"/users/1": 1})
+        self.assertEqual(http.derived, 1)
+        await http.close()
+
+    async def test_parts_are_taken_from_users_in_flight(self) -> None:
+        async def slow(request: web.Request) -> web.StreamResponse:
+            await asyncio.sleep(0.05)
+            return web.json_response(USER)
+
+        self.server.handlers["/users/1"] = slow
+        http = HTTPClient(TOKEN)
+
+        user, part = await asyncio.gather(
+            http.get(self.whole, 1),
+            http.get_part(self.bans, 1, whole=self.whole, part=bans),
+        )
+
+        self.assertEqual(part, bans(user))
+        self.assertEqual(self.server.hits, {"/users/1": 1})
+        await http.close()
+
+    async def test_parts_of_users_not_found_are_requested(self) -> None:
+        self.server.not_found("/users/1", delay=0.05)
+        http = HTTPClient(TOKEN)
+
+        user, part = await asyncio.gather(
+            http.get(self.whole, 1),
+            http.get_part(self.bans, 1, whole=self.whole, part=bans),
+            return_exceptions=True,
+        )
+
+        self.assertIsInstance(user, NotFoundError)
+        self.assertEqual(part, bans(USER))
+        self.assertEqual(self.server.hits, {"/users/1": 1, "/users/1/bans": 1})
+        self.assertEqual(http.derived, 0)
+        await http.close()
+
+    async def test_parts_within_the_window_are_upgraded(self) -> None:
+        self.server.json("/users/1", USER)
+        http = HTTPClient(TOKEN, upgrade_window=0.01)
+
+        parts = await asyncio.gather(
+            http.get_part(self.bans, 1, whole=self.whole, part=bans),
+            http.get_part(self.pronouns, 1, whole=self.whole, part=pronouns),
+        )
+
+        self.assertEqual(parts, [bans(USER), pronouns(USER)])
+        self.assertEqual(self.server.hits, {"/users/1": 1})
+
+        # A single part is cheaper to request on its own
+        await http.get_part(self.bans, 1, whole=self.whole, part=bans)
+        self.assertEqual(self.server.hits, {"/users/1": 1, "/users/1/bans": 1})
+        await http.close()
+
+    async def test_upgraded_parts_of_users_not_found_are_requested(self) -> None:
+        http = HTTPClient(TOKEN, upgrade_window=0.01)
+
+        parts = await asyncio.gather(
+            http.get_part(self.bans, 1, whole=self.whole, part=bans),
+            http.get_part(self.pronouns, 1, whole=self.whole, part=pronouns),
+        )
+
+        self.assertEqual(parts, [bans(USER), pronouns(USER)])
+        self.assertEqual(
+            self.server.hits,
+            {"/users/1": 1, "/users/1/bans": 1, "/users/1/pronouns": 1},
+        )
+        await http.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
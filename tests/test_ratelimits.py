@@ -0,0 +1,141 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for `ravyapi.ratelimits` and the handling of 429 responses."""
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import time
+import unittest
+
+from aiohttp import web
+
+from ravyapi.api.errors import TooManyRequestsError
+from ravyapi.http import HTTPClient
+from ravyapi.ratelimits import RateLimiter, TokenBucket, _parse_retry_after
+from tests.api_server import TOKEN, APIServer
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_rate(self) -> None:
+        bucket = TokenBucket(10, 2)
+
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        # Reserved tokens queue callers one after another
+        self.assertAlmostEqual(bucket.reserve(), 0.1, delta=0.01)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, delta=0.01)
+
+    def test_parameters_are_validated(self) -> None:
+        with self.assertRaises(ValueError):
+            TokenBucket(0, 1)
+
+        with self.assertRaises(ValueError):
+            TokenBucket(1, 0)
+
+
+class TestRetryAfter(unittest.TestCase):
+    def test_seconds(self) -> None:
+        self.assertEqual(_parse_retry_after("1.5"), 1.5)
+        self.assertIsNone(_parse_retry_after("soon"))
+        self.assertIsNone(_parse_retry_after("inf"))
+        self.assertIsNone(_parse_retry_after(None))
+
+    def test_http_dates_are_in_utc(self) -> None:
+        date = email.utils.formatdate(time.time() + 30, usegmt=True)
+        # An unknown offset, which parses as a naive datetime
+        unknown = email.utils.formatdate(time.time() + 30).replace("+0000", "-0000")
+
+        for value in (date, unknown):
+            with self.subTest(value=value):
+                retry_after = _parse_retry_after(value)
+                assert retry_after is not None
+                self.assertAlmostEqual(retry_after, 30, delta=2)
+
+
+class TestRateLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_headers_block_the_route(self) -> None:
+        limiter = RateLimiter()
+        await limiter.acquire("/users/{id}")
+        limiter.update(
+            "/users/{id}",
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "0.1"},
+        )
+
+        self.assertGreaterEqual(await limiter.acquire("/users/{id}"), 0.09)
+        # Other routes are not blocked
+        self.assertEqual(await limiter.acquire("/guilds/{id}"), 0.0)
+
+        stats = limiter.stats
+        self.assertEqual((stats.requests, stats.queued, stats.waiting), (3, 1, 0))
+
+    async def test_global_rate(self) -> None:
+        limiter = RateLimiter(global_rate=20, global_burst=1)
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire(f"/{route}") for route in range(3)))
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+        self.assertEqual(limiter.stats.queued, 2)
+
+    async def test_stats_are_snapshots(self) -> None:
+        limiter = RateLimiter()
+        stats = limiter.stats
+        await limiter.acquire("/users/{id}")
+
+        self.assertEqual(stats.requests, 0)
+        self.assertEqual(limiter.stats.requests, 1)
+
+    def test_retry_after_beyond_maximum_is_not_retried(self) -> None:
+        limiter = RateLimiter(max_retry_after=1)
+
+        self.assertIsNone(limiter.rate_limited("/", {"Retry-After": "5"}, 0))
+        self.assertEqual(limiter.rate_limited("/", {"Retry-After": "0.5"}, 0), 0.5)
+        self.assertIsNone(limiter.rate_limited("/", {"Retry-After": "0.5"}, 3))
+        self.assertEqual((limiter.stats.rate_limited, limiter.stats.retries), (3, 1))
+
+
+class TestRateLimitedRequests(unittest.IsolatedAsyncioTestCase):
+    async def test_429_is_retried_after_retry_after(self) -> None:
+        async with APIServer() as server:
+            responses = [
+                web.json_response({}, status=429, headers={"Retry-After": "0.1"}),
+                web.json_response({"ok": True}),
+            ]
+            server.handlers["/users/1"] = lambda request: responses.pop(0)
+            http = HTTPClient(TOKEN)
+            start = time.monotonic()
+
+            data = await http.get(server.route("users", "/users/{}"), 1)
+
+            self.assertEqual(data, {"ok": True})
+            self.assertGreaterEqual(time.monotonic() - start, 0.09)
+            self.assertEqual(server.hits["/users/1"], 2)
+            self.assertEqual(http.rate_limiter.stats.retries, 1)
+            await http.close()
+
+    async def test_429_is_raised_once_retries_run_out(self) -> None:
+        async with APIServer() as server:
+            server.json("/users/1", {}, 429, **{"Retry-After": "0"})
+            http = HTTPClient(TOKEN, rate_limiter=RateLimiter(max_retries=1))
+
+            with self.assertRaises(TooManyRequestsError):
+                await http.get(server.route("users", "/users/{}"), 1)
+
+            self.assertEqual(server.hits["/users/1"], 2)
+            await http.close()
+
+
+if __name__ == "__main__":
+    unittest.main()